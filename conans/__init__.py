@@ -1,22 +1,46 @@
+import importlib
+import sys
+
 # Allow conans to import ConanFile from here
 # to allow refactors
-from conans.client.build.autotools_environment import AutoToolsBuildEnvironment
-from conans.client.build.cmake import CMake
-from conans.client.build.meson import Meson
-from conans.client.build.msbuild import MSBuild
-from conans.client.build.visual_environment import VisualStudioBuildEnvironment
-from conans.client.run_environment import RunEnvironment
-from conans.model.conan_file import ConanFile
-from conans.model.options import Options
-from conans.model.settings import Settings
-from conans.util.files import load
+_EXPORTED = {"AutoToolsBuildEnvironment": "conans.client.build.autotools_environment",
+             "CMake": "conans.client.build.cmake",
+             "Meson": "conans.client.build.meson",
+             "MSBuild": "conans.client.build.msbuild",
+             "VisualStudioBuildEnvironment": "conans.client.build.visual_environment",
+             "RunEnvironment": "conans.client.run_environment",
+             "ConanFile": "conans.model.conan_file",
+             "Options": "conans.model.options",
+             "Settings": "conans.model.settings",
+             "load": "conans.util.files"}
+
+if sys.version_info >= (3, 7):
+    # Imported the first time they are used, so the conan commands that don't load recipes
+    # don't import the build helpers
+    def __getattr__(name):
+        try:
+            module = _EXPORTED[name]
+        except KeyError:
+            raise AttributeError("module 'conans' has no attribute '%s'" % name)
+        value = getattr(importlib.import_module(module), name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()).union(_EXPORTED))
+else:
+    for _name, _module in _EXPORTED.items():
+        globals()[_name] = getattr(importlib.import_module(_module), _name)
 
 # complex_search: With ORs and not filtering by not restricted settings
 COMPLEX_SEARCH_CAPABILITY = "complex_search"
 CHECKSUM_DEPLOY = "checksum_deploy"  # Only when v2
 REVISIONS = "revisions"  # Only when enabled in config, not by default look at server_launcher.py
 ONLY_V2 = "only_v2"  # Remotes and virtuals from Artifactory returns this capability
-SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]  # Server is always with revisions
+ZSTD_CAPABILITY = "zstd"  # Accepts conan_package.tzst binaries compressed with zstd
+BULK_PACKAGES_INFO = "bulk_packages_info"  # Latest PREV and conaninfo of many packages in a POST
+SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS,  # Server is always with revisions
+                       ZSTD_CAPABILITY, BULK_PACKAGES_INFO]
 DEFAULT_REVISION_V1 = "0"
 
 __version__ = '1.17.0-dev'
@@ -4,10 +4,14 @@ import shutil
 from collections import OrderedDict
 from os.path import join
 
+from conans.client.cache.catalog import RecipeCatalog
+from conans.client.cache.compiled_recipes import CompiledRecipesCache
 from conans.client.cache.editable import EditablePackages
+from conans.client.cache.file_hashes import FileHashesCache
+from conans.client.cache.metadata_cache import PackageMetadataCache
 from conans.client.cache.remote_registry import RemoteRegistry
+from conans.client.cache.remote_search_cache import RemoteSearchCache
 from conans.client.conf import ConanClientConfigParser, default_client_conf, default_settings_yml
-from conans.client.conf.detect import detect_defaults_settings
 from conans.client.output import Color
 from conans.client.profile_loader import read_profile
 from conans.errors import ConanException
@@ -72,6 +76,11 @@ class ClientCache(object):
         self.editable_packages = EditablePackages(self.cache_folder)
         # paths
         self._store_folder = self.config.storage_path or self.cache_folder
+        self.catalog = RecipeCatalog(self.cache_folder, self._store_folder)
+        self.remote_search_cache = RemoteSearchCache(self.cache_folder)
+        self.compiled_recipes = CompiledRecipesCache(self.cache_folder)
+        self.file_hashes = FileHashesCache(self.cache_folder)
+        self.metadata_cache = PackageMetadataCache()
 
     def all_refs(self):
         subdirs = list_folder_subdirs(basedir=self._store_folder, level=4)
@@ -103,7 +112,9 @@ class ClientCache(object):
             check_ref_case(ref, self.store)
             base_folder = os.path.normpath(os.path.join(self.store, ref.dir_repr()))
             return PackageCacheLayout(base_folder=base_folder, ref=ref,
-                                      short_paths=short_paths, no_lock=self._no_locks())
+                                      short_paths=short_paths, no_lock=self._no_locks(),
+                                      file_hashes=self.file_hashes,
+                                      metadata_cache=self.metadata_cache)
 
     @property
     def registry_path(self):
@@ -188,6 +199,7 @@ class ClientCache(object):
                                  "default profile (%s)" % self.default_profile_path,
                                  Color.BRIGHT_YELLOW)
 
+            from conans.client.conf.detect import detect_defaults_settings
             default_settings = detect_defaults_settings(self._output,
                                                         profile_path=self.default_profile_path)
             self._output.writeln("Default settings", Color.BRIGHT_YELLOW)
@@ -218,12 +230,11 @@ class ClientCache(object):
 
         if not os.path.exists(self.settings_path):
             save(self.settings_path, normalize(default_settings_yml))
-            settings = Settings.loads(default_settings_yml)
+            content = default_settings_yml
         else:
             content = load(self.settings_path)
-            settings = Settings.loads(content)
 
-        return settings
+        return _load_settings(content)
 
     @property
     def hooks(self):
@@ -244,6 +255,7 @@ class ClientCache(object):
                     except OSError:
                         break  # not empty
                 ref_path = os.path.dirname(ref_path)
+            self.catalog.update(ref)
 
     def remove_locks(self):
         folders = list_folder_subdirs(self._store_folder, 4)
@@ -257,6 +269,22 @@ class ClientCache(object):
         self._no_lock = None
 
 
+_parsed_settings = {}  # {settings.yml contents: Settings}, shared by all the caches
+
+
+def _load_settings(content):
+    """ The settings.yml is parsed only the first time, the next times the parsed Settings are
+    copied, which is cheap as they are copy-on-write
+    """
+    settings = _parsed_settings.get(content)
+    if settings is None:
+        settings = Settings.loads(content)
+        if len(_parsed_settings) >= 8:
+            _parsed_settings.clear()
+        _parsed_settings[content] = settings
+    return settings.copy()
+
+
 def _mix_settings_with_env(settings):
     """Reads CONAN_ENV_XXXX variables from environment
     and if it's defined uses these value instead of the default
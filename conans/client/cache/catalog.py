@@ -0,0 +1,171 @@
+import json
+import os
+import time
+
+from conans.model.ref import ConanFileReference
+from conans.util.files import list_folder_subdirs, load, save_atomic
+from conans.util.log import logger
+
+CATALOG_FILE = "recipes_catalog.json"
+CATALOG_VERSION = 1
+# Changes done in the same folder shortly after a scan might not modify its mtime (coarse
+# filesystem timestamps), so the folders modified this recently are scanned always
+_RACY_SECONDS = 2
+
+
+def _subdirs(folder):
+    try:
+        return sorted(d for d in os.listdir(folder) if os.path.isdir(os.path.join(folder, d)))
+    except OSError:
+        return []
+
+
+def _load_ref(ref):
+    return ConanFileReference(*ref.replace("@", "/").split("/"))
+
+
+def _mtime(folder):
+    try:
+        return os.stat(folder).st_mtime
+    except OSError:
+        return None
+
+
+class RecipeCatalog(object):
+    """ Persistent index of the recipes in the local cache store, by name:
+
+        {name: {"dirs": {"name", "name/version", "name/version/user": mtime},
+                "refs": ["name/version@user/channel", ...]}}
+
+    The entry of a name is trusted while the mtimes of its folders don't change, so looking
+    for the references of a name doesn't walk the whole store, and the changes done by other
+    means than conan commands are also found.
+    """
+
+    def __init__(self, cache_folder, store_folder):
+        self._store_folder = store_folder
+        self._path = os.path.join(cache_folder, CATALOG_FILE)
+        self._root = None  # mtime of the store folder when the list of names was read
+        self._names = None
+        self._dirty = False
+
+    def _load(self):
+        if self._names is not None:
+            return
+        self._names = {}
+        if not os.path.exists(self._path):
+            return
+        try:
+            contents = json.loads(load(self._path))
+            if contents.get("version") == CATALOG_VERSION:
+                self._root = contents["root"]
+                self._names = contents["names"]
+        except Exception as exc:  # Rebuilt from the store folders
+            logger.warning("Invalid recipes catalog %s: %s" % (self._path, exc))
+
+    def _save(self):
+        if self._dirty:
+            contents = {"version": CATALOG_VERSION, "root": self._root, "names": self._names}
+            try:  # Other processes read it concurrently, they can't see it half written
+                save_atomic(self._path, json.dumps(contents))
+            except (IOError, OSError) as exc:  # Scanned again the next time
+                logger.warning("Cannot save recipes catalog %s: %s" % (self._path, exc))
+        self._dirty = False
+
+    @staticmethod
+    def _trusted_mtime(mtime, scan_time):
+        return mtime if mtime is not None and mtime < scan_time - _RACY_SECONDS else None
+
+    def _scan_name(self, name):
+        scan_time = time.time()
+        name_folder = os.path.join(self._store_folder, name)
+        dirs = {name: self._trusted_mtime(_mtime(name_folder), scan_time)}
+        refs = []
+        for version in _subdirs(name_folder):
+            version_folder = os.path.join(name_folder, version)
+            dirs["%s/%s" % (name, version)] = self._trusted_mtime(_mtime(version_folder),
+                                                                  scan_time)
+            for user in _subdirs(version_folder):
+                user_folder = os.path.join(version_folder, user)
+                dirs["%s/%s/%s" % (name, version, user)] = self._trusted_mtime(_mtime(user_folder),
+                                                                               scan_time)
+                refs.extend("%s/%s@%s/%s" % (name, version, user, channel)
+                            for channel in _subdirs(user_folder))
+        return {"dirs": dirs, "refs": refs}
+
+    def _is_valid(self, entry):
+        for folder, mtime in entry["dirs"].items():
+            if mtime is None or _mtime(os.path.join(self._store_folder, folder)) != mtime:
+                return False
+        return True
+
+    def _validated_names(self):
+        mtime = _mtime(self._store_folder)
+        if mtime is None or mtime != self._root:
+            scan_time = time.time()
+            names = [name for name in _subdirs(self._store_folder)
+                     if not name.startswith(".")]
+            for name in set(self._names).difference(names):
+                del self._names[name]
+            for name in names:
+                self._names.setdefault(name, {"dirs": {name: None}, "refs": []})
+            self._root = self._trusted_mtime(mtime, scan_time)
+            self._dirty = True
+        return sorted(self._names)
+
+    def _validated_refs(self, name):
+        entry = self._names.get(name)
+        if entry is None or not self._is_valid(entry):
+            entry = self._scan_name(name)
+            if not os.path.isdir(os.path.join(self._store_folder, name)):
+                self._names.pop(name, None)
+            else:
+                self._names[name] = entry
+            self._dirty = True
+        return [_load_ref(ref) for ref in entry["refs"]]
+
+    def refs(self, name=None, ignorecase=False):
+        """ The references in the store, all of them or the ones with the given name
+        """
+        self._load()
+        if name is None or ignorecase:
+            names = self._validated_names()
+            if name is not None:
+                names = [n for n in names if n.lower() == name.lower()]
+        else:
+            names = [name]
+        result = []
+        for n in names:
+            result.extend(self._validated_refs(n))
+        self._save()
+        return result
+
+    def update(self, ref):
+        """ Updates the catalog after the recipe "ref" has been added or removed from the store
+        """
+        self._load()
+        self._validated_names()
+        self._validated_refs(ref.name)
+        self._save()
+
+    def rebuild(self, verify=False):
+        """ Computes the catalog again walking all the store folders. Returns the references
+        that were missing in the stored catalog and the ones that were not in the store.
+        With verify=True the stored catalog is not modified
+        """
+        self._names = None
+        self._load()
+        cataloged = set(ref for entry in self._names.values() for ref in entry["refs"])
+        subdirs = list_folder_subdirs(basedir=self._store_folder, level=4)
+        in_store = set("%s/%s@%s/%s" % tuple(folder.split("/")) for folder in subdirs)
+        if not verify:
+            self._names = {}
+            self._root = None
+            self._validated_names()
+            for name in list(self._names):
+                self._validated_refs(name)
+            self._dirty = True
+            self._save()
+        missing = [_load_ref(ref) for ref in sorted(in_store - cataloged)]
+        stale = [_load_ref(ref) for ref in sorted(cataloged - in_store)]
+        return missing, stale
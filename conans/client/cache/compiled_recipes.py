@@ -0,0 +1,79 @@
+import imp
+import marshal
+import os
+
+from conans.client.cache.entries_cache import EntriesCache
+from conans.util.files import decode_text, load, to_file_bytes
+from conans.util.log import logger
+from conans.util.sha import sha1
+
+COMPILED_RECIPES_FOLDER = "compiled_recipes"
+
+
+class CompiledRecipesCache(EntriesCache):
+    """ The compiled code of the conanfile.py files and the parsed conandata.yml files, so
+    loading them again doesn't compile the python code or parse the yml. There is a file for
+    every loaded file, by path, with the hash of the contents it was computed from:
+
+        <sha1(python magic + path + contents)>\n<path>\n<marshal data>
+
+    The files of the paths that don't exist anymore are removed by prune()
+    """
+
+    def __init__(self, cache_folder):
+        super(CompiledRecipesCache, self).__init__(os.path.join(cache_folder,
+                                                                COMPILED_RECIPES_FOLDER))
+
+    def _entry(self, path, contents, suffix):
+        path = to_file_bytes(os.path.abspath(path))
+        key = sha1(imp.get_magic() + path + b"\n" + contents).encode("ascii")
+        entry_path = os.path.join(self._folder, "%s.%s" % (sha1(path), suffix))
+        return key + b"\n" + path + b"\n", entry_path
+
+    @staticmethod
+    def _load(header, entry_path):
+        try:
+            entry = load(entry_path, binary=True)
+        except (IOError, OSError):
+            return None
+        if not entry.startswith(header):
+            return None
+        try:
+            return marshal.loads(entry[len(header):])
+        except Exception as exc:  # Truncated or corrupted, computed again
+            logger.warning("Invalid compiled recipe cache %s: %s" % (entry_path, exc))
+            return None
+
+    def _entry_source(self, entry_path):
+        with open(entry_path, "rb") as handle:
+            handle.readline()
+            return handle.readline()[:-1]
+
+    def _save_value(self, header, entry_path, value):
+        try:
+            data = marshal.dumps(value)
+        except ValueError:  # Types that cannot be stored, as dates in the yml
+            return
+        self._save(entry_path, header + data)
+
+    def code(self, conanfile_path, source):
+        """ The code object of the python source of the given path, as "compile()" does
+        """
+        header, entry_path = self._entry(conanfile_path, source, "code")
+        code = self._load(header, entry_path)
+        if code is None:
+            code = compile(source, conanfile_path, "exec", dont_inherit=True)
+            self._save_value(header, entry_path, code)
+        return code
+
+    def data(self, data_path, contents):
+        """ The parsed contents of a conandata.yml file, as "yaml.safe_load()" does
+        """
+        header, entry_path = self._entry(data_path, contents, "data")
+        data = self._load(header, entry_path)
+        if data is None:
+            import yaml
+            data = yaml.safe_load(decode_text(contents))
+            if data is not None:
+                self._save_value(header, entry_path, data)
+        return data
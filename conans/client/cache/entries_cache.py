@@ -0,0 +1,65 @@
+import os
+import time
+
+from conans.util.files import save, save_atomic
+from conans.util.log import logger
+
+# The entries of the paths that don't exist anymore are removed once a day, when saving one
+_PRUNE_INTERVAL = 24 * 3600
+_PRUNED_FILE = ".pruned"
+
+
+class EntriesCache(object):
+    """ Base of the persistent caches with an entry file in their folder for every file or
+    folder of the disk. The entries of the paths that don't exist anymore are removed by
+    prune(), also when saving an entry if the last prune was more than a day ago.
+
+    The entry files are named "<name>.<extension>", the subclasses return the path an entry
+    was computed from with _entry_source()
+    """
+
+    def __init__(self, folder):
+        self._folder = folder
+
+    def _entry_source(self, entry_path):
+        """ the path the entry was computed from, None if unknown. It can raise IOError
+        """
+        raise NotImplementedError()
+
+    def _save(self, entry_path, contents):
+        try:
+            save_atomic(entry_path, contents)
+        except (IOError, OSError) as exc:
+            logger.warning("Cannot save cache entry %s: %s" % (entry_path, exc))
+            return
+        self._prune_if_due()
+
+    def _prune_if_due(self):
+        pruned_path = os.path.join(self._folder, _PRUNED_FILE)
+        try:
+            if time.time() - os.path.getmtime(pruned_path) < _PRUNE_INTERVAL:
+                return
+            due = True
+        except OSError:  # The first entry, the interval starts now
+            due = False
+        save(pruned_path, "")  # Before pruning, so other processes don't do it too
+        if due:
+            self.prune()
+
+    def prune(self):
+        """ Removes the entries of the paths that don't exist anymore
+        """
+        try:
+            names = os.listdir(self._folder)
+        except OSError:
+            return
+        for name in names:
+            if name == _PRUNED_FILE or name.count(".") > 1:  # Other process writing it
+                continue
+            entry_path = os.path.join(self._folder, name)
+            try:
+                source = self._entry_source(entry_path)
+                if not source or not os.path.exists(source):
+                    os.remove(entry_path)
+            except (IOError, OSError) as exc:
+                logger.warning("Cannot prune cache entry %s: %s" % (entry_path, exc))
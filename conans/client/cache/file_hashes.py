@@ -0,0 +1,160 @@
+import json
+import os
+import time
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+
+from conans.client.cache.entries_cache import EntriesCache
+from conans.util.files import load, md5sum, to_file_bytes
+from conans.util.log import logger
+from conans.util.sha import sha1
+
+FILE_HASHES_FOLDER = "file_hashes"
+# Coarsest time resolution of the file systems (FAT), a file modified within it after being
+# hashed could keep the same mtime and ctime, so those hashes are not stored
+_TIME_RESOLUTION = 2
+# Below this size it is faster to hash the files than to start the threads
+_THREADS_MIN_SIZE = 1024 * 1024
+
+
+def _stat_key(file_stat):
+    """ (size, mtime_ns, ctime_ns, inode) of the file. The ctime changes with any change, even
+    if the mtime is restored, and cannot be set
+    """
+    try:
+        times = file_stat.st_mtime_ns, file_stat.st_ctime_ns
+    except AttributeError:  # Python 2
+        times = int(file_stat.st_mtime * 1e9), int(file_stat.st_ctime * 1e9)
+    return [file_stat.st_size, times[0], times[1], file_stat.st_ino]
+
+
+def _md5sums(paths, total_size):
+    if len(paths) < 2 or total_size < _THREADS_MIN_SIZE:
+        return [md5sum(path) for path in paths]
+    pool = ThreadPool(min(len(paths), cpu_count(), 8))  # hashlib releases the GIL
+    try:
+        return pool.map(md5sum, paths)
+    finally:
+        pool.close()
+        pool.join()
+
+
+class FileHashesCache(EntriesCache):
+    """ The md5 of the files of the folders with a computed manifest, so the files not modified
+    since then are not read again. There is a file for every folder, by path, with the hashes
+    by name and the (size, mtime_ns, ctime_ns, inode) of the file they were computed from:
+
+        {"folder": "<folder>",
+         "files": {"<name>": [<size>, <mtime_ns>, <ctime_ns>, <inode>, "<md5>"]}}
+
+    The files of the folders that don't exist anymore are removed by prune().
+
+    The copied files of an export are not new for the cache: they are hashed as their origin
+    files if neither of them has been modified after the copy.
+    """
+
+    def __init__(self, cache_folder):
+        super(FileHashesCache, self).__init__(os.path.join(cache_folder, FILE_HASHES_FOLDER))
+        # {dst path: (src folder, src path, src stat key, dst stat key)} when copied
+        self._copies = {}
+
+    def _entries_path(self, folder):
+        return os.path.join(self._folder, "%s.json" % sha1(to_file_bytes(os.path.abspath(folder))))
+
+    @staticmethod
+    def _load(entries_path):
+        """ The (folder, {name: entry}) stored in the entries_path, (None, {}) if nothing
+        """
+        try:
+            contents = json.loads(load(entries_path))
+            return contents["folder"], contents["files"]
+        except (IOError, OSError):
+            return None, {}
+        except Exception as exc:  # Truncated or corrupted, computed again
+            logger.warning("Invalid file hashes cache %s: %s" % (entries_path, exc))
+            return None, {}
+
+    def _entry_source(self, entry_path):
+        return self._load(entry_path)[0]
+
+    def copied(self, src_folder, copied_files):
+        """ src_folder: the folder the files were copied from
+        copied_files: {dst path: src path} of the copied files, just copied: the copies and their
+        origin files have to remain as they are now to reuse the hash of the origin file
+        """
+        for dst, src in copied_files.items():
+            try:
+                dst_key = _stat_key(os.stat(dst))
+                src_key = _stat_key(os.stat(src))
+            except OSError:
+                continue
+            # copy2() keeps the size and mtime
+            if dst_key[:2] == src_key[:2]:
+                self._copies[os.path.abspath(dst)] = src_folder, src, src_key, dst_key
+
+    def _copied_md5sums(self, pending, stats, not_racy):
+        """ the md5 of the copies not modified after the copy, from their origin files
+        """
+        sources = {}
+        for name, path in pending:
+            copy = self._copies.get(os.path.abspath(path))
+            if copy is None:
+                continue
+            src_folder, src, src_key, dst_key = copy
+            # Any change of the copy or of its origin changes their ctime, also restoring the
+            # mtime after modifying them
+            if stats[name] != dst_key or src_key[2] >= not_racy:
+                continue
+            try:
+                if _stat_key(os.stat(src)) != src_key:
+                    continue
+            except OSError:
+                continue
+            sources.setdefault(src_folder, {})[name] = src
+        result = {}
+        for src_folder, src_files in sources.items():
+            src_names = {name: os.path.relpath(src, src_folder) for name, src in src_files.items()}
+            # Other copies of the folder could be in other call, its hashes are kept
+            src_md5s = self.md5sums(src_folder, {src_names[name]: src
+                                                 for name, src in src_files.items()},
+                                    keep_others=True)
+            result.update((name, src_md5s[src_name]) for name, src_name in src_names.items())
+        return result
+
+    def md5sums(self, folder, files, keep_others=False):
+        """ {name: md5} of the files {name: path} of the folder
+        keep_others: keep the stored hashes of other files not in "files"
+        """
+        folder = os.path.abspath(folder)
+        entries_path = self._entries_path(folder)
+        _, entries = self._load(entries_path)
+        not_racy = int((time.time() - _TIME_RESOLUTION) * 1e9)
+
+        result = {}
+        new_entries = dict(entries) if keep_others else {}
+        stats = {}
+        pending = []
+        for name, path in files.items():
+            stat_key = _stat_key(os.stat(path))
+            entry = entries.get(name)
+            if entry is not None and entry[:4] == stat_key:
+                result[name] = entry[4]
+                new_entries[name] = entry
+            else:
+                stats[name] = stat_key
+                pending.append((name, path))
+
+        if pending and self._copies:
+            copied = self._copied_md5sums(pending, stats, not_racy)
+            result.update(copied)
+            pending = [(name, path) for name, path in pending if name not in copied]
+
+        md5s = _md5sums([path for _, path in pending], sum(stats[n][0] for n, _ in pending))
+        result.update((name, md5) for (name, _), md5 in zip(pending, md5s))
+        for name, stat_key in stats.items():
+            if stat_key[2] < not_racy:
+                new_entries[name] = stat_key + [result[name]]
+
+        if new_entries != entries:
+            self._save(entries_path, json.dumps({"folder": folder, "files": new_entries}))
+        return result
@@ -0,0 +1,46 @@
+import json
+import os
+import time
+
+from conans.model.package_metadata import PackageMetadata
+from conans.util.files import load
+
+# Coarsest time resolution of the file systems (FAT), a file modified within it after being
+# read could keep the same mtime and ctime, so those files are not kept
+_TIME_RESOLUTION = 2
+
+
+def _stat_key(file_stat):
+    return file_stat.st_size, file_stat.st_mtime, file_stat.st_ctime, file_stat.st_ino
+
+
+class PackageMetadataCache(object):
+    """ The parsed metadata.json files of the references of the cache, so they are not read and
+    parsed again every time while they don't change, in this process. They are invalidated by
+    the (size, mtime, ctime, inode) of the file, the ctime changes with any change, even if the
+    mtime is restored
+    """
+
+    def __init__(self):
+        self._entries = {}  # {path: (stat key, json data)}
+
+    def load(self, path):
+        """ a new PackageMetadata of the file every time, it can be modified by the caller.
+        Raises IOError if it doesn't exist
+        """
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            raise IOError("Metadata file %s doesn't exist" % path)
+        stat_key = _stat_key(file_stat)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == stat_key:
+            return PackageMetadata.from_dict(entry[1])
+
+        data = json.loads(load(path))
+        # Written in the last seconds, it could change again without changing the stat
+        if file_stat.st_ctime < time.time() - _TIME_RESOLUTION:
+            self._entries[path] = stat_key, data
+        else:
+            self._entries.pop(path, None)
+        return PackageMetadata.from_dict(data)
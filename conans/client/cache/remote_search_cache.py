@@ -0,0 +1,60 @@
+import errno
+import json
+import os
+import time
+
+from conans.model.ref import ConanFileReference
+from conans.util.files import load, save
+from conans.util.log import logger
+from conans.util.sha import sha1
+
+REMOTE_SEARCH_CACHE_FOLDER = "remote_search_cache"
+
+
+class RemoteSearchCache(object):
+    """ Results of the recipes searches done in the remotes, to resolve the version ranges
+    without asking the remotes again. There is a file for every remote, by url:
+
+        {pattern: {"time": timestamp, "refs": ["name/version@user/channel", ...]}}
+    """
+
+    def __init__(self, cache_folder):
+        self._folder = os.path.join(cache_folder, REMOTE_SEARCH_CACHE_FOLDER)
+
+    def _path(self, remote):
+        return os.path.join(self._folder, "%s.json" % sha1(remote.url.encode("utf-8")))
+
+    def _load(self, remote):
+        path = self._path(remote)
+        if not os.path.exists(path):
+            return {}
+        try:
+            return json.loads(load(path))
+        except Exception as exc:
+            logger.warning("Invalid remote search cache %s: %s" % (path, exc))
+            return {}
+
+    def get(self, remote, pattern, ttl):
+        """ The references found in the remote for the pattern, None if they were not searched
+        in the last "ttl" seconds
+        """
+        entry = self._load(remote).get(pattern)
+        if entry is None or not 0 <= time.time() - entry["time"] < ttl:
+            return None
+        return [ConanFileReference.loads(ref) for ref in entry["refs"]]
+
+    def set(self, remote, pattern, refs, ttl):
+        now = time.time()
+        contents = {p: entry for p, entry in self._load(remote).items()
+                    if 0 <= now - entry["time"] < ttl}  # Discard the outdated entries
+        contents[pattern] = {"time": now, "refs": [str(ref) for ref in refs]}
+        save(self._path(remote), json.dumps(contents))
+
+    def invalidate(self, remote):
+        """ Forgets the searches in the remote, after uploading or removing recipes
+        """
+        try:  # Uploads run concurrently, another one could have removed it already
+            os.remove(self._path(remote))
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
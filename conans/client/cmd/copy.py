@@ -61,6 +61,7 @@ def package_copy(src_ref, user_channel, package_ids, cache, user_io, short_paths
             return
         rmdir(export_dest)
     shutil.copytree(export_origin, export_dest, symlinks=True)
+    cache.catalog.update(dest_ref)
     user_io.out.info("Copied %s to %s" % (str(src_ref), str(dest_ref)))
 
     export_sources_origin = src_layout.export_sources()
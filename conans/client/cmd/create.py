@@ -26,7 +26,7 @@ def get_test_conanfile_path(tf, conanfile_path):
 
 def create(reference, manager, user_io, graph_info, remotes, update, build_modes,
            manifest_folder, manifest_verify, manifest_interactive, keep_build, test_build_folder,
-           test_folder, conanfile_path):
+           test_folder, conanfile_path, parallel=None):
 
     test_conanfile_path = get_test_conanfile_path(test_folder, conanfile_path)
 
@@ -38,7 +38,8 @@ def create(reference, manager, user_io, graph_info, remotes, update, build_modes
                                   manifest_verify=manifest_verify,
                                   manifest_interactive=manifest_interactive,
                                   keep_build=keep_build,
-                                  test_build_folder=test_build_folder)
+                                  test_build_folder=test_build_folder,
+                                  parallel=parallel)
     else:
         manager.install(ref_or_path=reference,
                         create_reference=reference,
@@ -50,4 +51,5 @@ def create(reference, manager, user_io, graph_info, remotes, update, build_modes
                         graph_info=graph_info,
                         build_modes=build_modes,
                         update=update,
-                        keep_build=keep_build)
+                        keep_build=keep_build,
+                        parallel=parallel)
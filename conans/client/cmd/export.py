@@ -85,9 +85,13 @@ def cmd_export(conanfile_path, name, version, user, channel, keep_source, revisi
     # Copy sources to target folders
     with package_layout.conanfile_write_lock(output=output):
         origin_folder = os.path.dirname(conanfile_path)
-        export_recipe(conanfile, origin_folder, package_layout.export())
-        export_source(conanfile, origin_folder, package_layout.export_sources())
+        copied_files = export_recipe(conanfile, origin_folder, package_layout.export())
+        copied_files.update(export_source(conanfile, origin_folder,
+                                          package_layout.export_sources()))
         shutil.copy2(conanfile_path, package_layout.conanfile())
+        copied_files[package_layout.conanfile()] = conanfile_path
+        # The unmodified copies are hashed as the origin files, not read again
+        cache.file_hashes.copied(origin_folder, copied_files)
 
         _capture_export_scm_data(conanfile, os.path.dirname(conanfile_path),
                                  package_layout.export(), output,
@@ -98,7 +102,8 @@ def cmd_export(conanfile_path, name, version, user, channel, keep_source, revisi
                              conanfile_path=package_layout.conanfile())
 
         # Compute the new digest
-        digest = FileTreeManifest.create(package_layout.export(), package_layout.export_sources())
+        digest = FileTreeManifest.create(package_layout.export(), package_layout.export_sources(),
+                                         file_hashes=cache.file_hashes)
         modified_recipe = not previous_digest or previous_digest != digest
         if modified_recipe:
             output.success('A new %s version was exported' % CONANFILE)
@@ -107,6 +112,7 @@ def cmd_export(conanfile_path, name, version, user, channel, keep_source, revisi
             output.info("The stored package has not changed")
             digest = previous_digest  # Use the old one, keep old timestamp
         digest.save(package_layout.export())
+    cache.catalog.update(ref)
 
     # Compute the revision for the recipe
     revision = _update_revision_in_metadata(package_layout=package_layout,
@@ -344,6 +350,7 @@ def export_source(conanfile, origin_folder, destination_source_folder):
     output = conanfile.output
     package_output = ScopedOutput("%s exports_sources" % output.scope, output)
     copier.report(package_output)
+    return copier.copied_from
 
 
 def export_recipe(conanfile, origin_folder, destination_folder):
@@ -372,3 +379,4 @@ def export_recipe(conanfile, origin_folder, destination_folder):
         copier(pattern, links=True, excludes=excluded_exports)
 
     copier.report(package_output)
+    return copier.copied_from
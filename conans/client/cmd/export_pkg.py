@@ -48,12 +48,13 @@ def export_pkg(cache, graph_manager, hook_manager, recorder, output,
     conanfile.develop = True
     if package_folder:
         packager.export_pkg(conanfile, package_id, package_folder, dest_package_folder,
-                            hook_manager, conan_file_path, ref)
+                            hook_manager, conan_file_path, ref, file_hashes=cache.file_hashes)
     else:
         with get_env_context_manager(conanfile):
             packager.create_package(conanfile, package_id, source_folder, build_folder,
                                     dest_package_folder, install_folder, hook_manager,
-                                    conan_file_path, ref, local=True)
+                                    conan_file_path, ref, local=True,
+                                    file_hashes=cache.file_hashes)
 
     readed_manifest = FileTreeManifest.load(dest_package_folder)
     pref = PackageReference(pref.ref, pref.id, readed_manifest.summary_hash)
@@ -1,6 +1,5 @@
 import os
 
-from conans.client.conf.detect import detect_defaults_settings
 from conans.client.profile_loader import get_profile_path, read_profile
 from conans.errors import ConanException
 from conans.model.options import OptionsValues
@@ -43,6 +42,7 @@ def cmd_profile_create(profile_name, cache_profiles_path, output, detect=False,
 
     profile = Profile()
     if detect:
+        from conans.client.conf.detect import detect_defaults_settings
         settings = detect_defaults_settings(output, profile_path)
         for name, value in settings:
             profile.settings[name] = value
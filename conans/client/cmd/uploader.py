@@ -3,17 +3,21 @@ import stat
 import tarfile
 import time
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 
+from conans import ZSTD_CAPABILITY
+from conans.client.recorder.upload_recoder import UploadRecorder
 from conans.client.remote_manager import is_package_snapshot_complete
 from conans.client.source import complete_recipe_sources
 from conans.errors import ConanException, NotFoundException
 from conans.model.manifest import gather_files, FileTreeManifest
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
 from conans.paths import (CONAN_MANIFEST, CONANFILE, EXPORT_SOURCES_TGZ_NAME,
-                          EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, CONANINFO)
+                          EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME, CONANINFO)
 from conans.search.search import search_packages, search_recipes
-from conans.util.files import (load, clean_dirty, is_dirty,
-                               gzopen_without_timestamps, set_dirty)
+from conans.util.compression import zstd_available, zstd_tar_open
+from conans.util.files import (HashingFile, load, clean_dirty, is_dirty,
+                               gzopen_without_timestamps, remember_checksums, set_dirty)
 from conans.util.log import logger
 from conans.util.tracer import (log_recipe_upload, log_compressed_files,
                                 log_package_upload)
@@ -56,6 +60,12 @@ class CmdUpload(object):
               "_package_files_to_upload". Can raise if policy is NOT overwrite
             - Do the actual upload
 
+    If "parallel" (or the "general.parallel_upload" configuration) is greater than 1, the
+    refs of every remote are uploaded concurrently in a pool of that many threads, and
+    the binaries of every ref are compressed in a pipeline: the package.tgz of the next
+    package is being created while the previous one is being uploaded (unless there are
+    "pre_upload_package" hooks, that have to run before compressing).
+
     All the REVISIONS are local defined, not retrieved from servers
 
     This requires calling to the remote API methods:
@@ -74,20 +84,66 @@ class CmdUpload(object):
 
     def upload(self, reference_or_pattern, remotes, upload_recorder, package_id=None,
                all_packages=None, confirm=False, retry=None, retry_wait=None, integrity_check=False,
-               policy=None, query=None):
+               policy=None, query=None, parallel=None):
         t1 = time.time()
         refs, confirm = self._collects_refs_to_upload(package_id, reference_or_pattern, confirm)
         refs_by_remote = self._collect_packages_to_upload(refs, confirm, remotes, all_packages,
                                                           query, package_id)
+        if parallel is None:
+            parallel = self._cache.config.parallel_upload
+        parallel = parallel if parallel and parallel > 1 else None
         # Do the job
         for remote, refs in refs_by_remote.items():
             self._user_io.out.info("Uploading to remote '{}':".format(remote.name))
+            if parallel and len(refs) > 1:
+                self._upload_refs_concurrently(refs, retry, retry_wait, integrity_check, policy,
+                                               remote, upload_recorder, remotes, parallel)
+                continue
             for (ref, conanfile, prefs) in refs:
                 self._upload_ref(conanfile, ref, prefs, retry, retry_wait,
-                                 integrity_check, policy, remote, upload_recorder, remotes)
+                                 integrity_check, policy, remote, upload_recorder, remotes,
+                                 pipeline=bool(parallel))
 
         logger.debug("UPLOAD: Time manager upload: %f" % (time.time() - t1))
 
+    def _upload_refs_concurrently(self, refs, retry, retry_wait, integrity_check, policy,
+                                  remote, upload_recorder, remotes, parallel):
+        """ Every ref is uploaded in its own thread, recording its results in its own
+        UploadRecorder. The results are added to the upload_recorder in the order of the refs,
+        once all the threads have finished. Then the first error, if any, is raised
+        """
+        if policy != UPLOAD_POLICY_SKIP:
+            # Ask for credentials, if necessary, only once and before starting the threads
+            self._remote_manager.check_credentials(remote)
+
+        def upload_ref(ref_to_upload):
+            ref, conanfile, prefs = ref_to_upload
+            ref_recorder = UploadRecorder()
+            try:
+                self._upload_ref(conanfile, ref, prefs, retry, retry_wait, integrity_check,
+                                 policy, remote, ref_recorder, remotes, pipeline=True)
+            except Exception as exc:
+                return ref_recorder, exc
+            return ref_recorder, None
+
+        parallel = min(parallel, len(refs))
+        self._user_io.out.info("Uploading %s references in %s parallel threads"
+                               % (len(refs), parallel))
+        thread_pool = ThreadPool(parallel)
+        try:
+            results = thread_pool.map(upload_ref, refs)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+
+        errors = []
+        for ref_recorder, exc in results:
+            upload_recorder.update(ref_recorder)
+            if exc is not None:
+                errors.append(exc)
+        if errors:
+            raise errors[0]
+
     def _collects_refs_to_upload(self, package_id, reference_or_pattern, confirm):
         """ validate inputs and compute the refs (without revisions) to be uploaded
         """
@@ -174,7 +230,7 @@ class CmdUpload(object):
         return refs_by_remote
 
     def _upload_ref(self, conanfile, ref, prefs, retry, retry_wait, integrity_check, policy,
-                    recipe_remote, upload_recorder, remotes):
+                    recipe_remote, upload_recorder, remotes, pipeline=False):
         """ Uploads the recipes and binaries identified by ref
         """
         assert (ref.revision is not None), "Cannot upload a recipe without RREV"
@@ -191,14 +247,37 @@ class CmdUpload(object):
         # Now the binaries
         if prefs:
             total = len(prefs)
-            for index, pref in enumerate(prefs):
-                p_remote = recipe_remote
-                msg = ("Uploading package %d/%d: %s to '%s'" % (index+1, total, str(pref.id),
-                                                                p_remote.name))
-                self._user_io.out.info(msg)
-                self._upload_package(pref, retry, retry_wait,
-                                     integrity_check, policy, p_remote)
-                upload_recorder.add_package(pref, p_remote.name, p_remote.url)
+            p_remote = recipe_remote
+            compressor = None
+            # The "pre_upload_package" hooks run before compressing each package, in order
+            if pipeline and total > 1 and not self._hook_manager.has_hooks("pre_upload_package"):
+                # A thread compresses the next package, while the current one is uploaded
+                compressor = ThreadPool(1)
+            compressing = None  # The compression of the next package, started in advance
+            uploaded = []
+            try:
+                for index, pref in enumerate(prefs):
+                    msg = ("Uploading package %d/%d: %s to '%s'" % (index+1, total, str(pref.id),
+                                                                    p_remote.name))
+                    self._user_io.out.info(msg)
+                    the_files = compressing.get() if compressing else None
+                    compressing = None
+                    if compressor and index + 1 < total:
+                        if the_files is None:
+                            the_files = self._prepare_package(pref, integrity_check, p_remote)
+                        # Only one package ahead, not to fill the disk with the compressed ones
+                        compressing = compressor.apply_async(self._compress_package_files,
+                                                             (prefs[index + 1], integrity_check,
+                                                              p_remote))
+                    if self._upload_package(pref, retry, retry_wait, integrity_check, policy,
+                                            p_remote, the_files):
+                        uploaded.append(pref)
+                    upload_recorder.add_package(pref, p_remote.name, p_remote.url)
+            finally:
+                if compressor:
+                    compressor.terminate()
+                    compressor.join()
+                self._update_packages_remote(ref, uploaded, p_remote)
 
         # FIXME: I think it makes no sense to specify a remote to "post_upload"
         # FIXME: because the recipe can have one and the package a different one
@@ -247,20 +326,27 @@ class CmdUpload(object):
 
         return ref
 
-    def _upload_package(self, pref, retry=None, retry_wait=None, integrity_check=False,
-                        policy=None, p_remote=None):
-
-        assert (pref.revision is not None), "Cannot upload a package without PREV"
-        assert (pref.ref.revision is not None), "Cannot upload a package without RREV"
-
+    def _prepare_package(self, pref, integrity_check, p_remote):
+        """ Runs the "pre_upload_package" hook and creates the package.tgz, returning the
+        files to upload
+        """
         conanfile_path = self._cache.package_layout(pref.ref).conanfile()
         self._hook_manager.execute("pre_upload_package", conanfile_path=conanfile_path,
                                    reference=pref.ref,
                                    package_id=pref.id,
                                    remote=p_remote)
+        return self._compress_package_files(pref, integrity_check, p_remote)
 
+    def _upload_package(self, pref, retry=None, retry_wait=None, integrity_check=False,
+                        policy=None, p_remote=None, the_files=None):
+
+        assert (pref.revision is not None), "Cannot upload a package without PREV"
+        assert (pref.ref.revision is not None), "Cannot upload a package without RREV"
+
+        conanfile_path = self._cache.package_layout(pref.ref).conanfile()
         t1 = time.time()
-        the_files = self._compress_package_files(pref, integrity_check)
+        if the_files is None:  # Not already compressed by the pipeline, without hooks
+            the_files = self._prepare_package(pref, integrity_check, p_remote)
         if policy == UPLOAD_POLICY_SKIP:
             return None
         files_to_upload, deleted = self._package_files_to_upload(pref, policy, the_files, p_remote)
@@ -278,15 +364,19 @@ class CmdUpload(object):
                                    reference=pref.ref, package_id=pref.id, remote=p_remote)
 
         logger.debug("UPLOAD: Time uploader upload_package: %f" % (time.time() - t1))
-
-        metadata = self._cache.package_layout(pref.ref).load_metadata()
-        cur_package_remote = metadata.packages[pref.id].remote
-        if not cur_package_remote and policy != UPLOAD_POLICY_SKIP:
-            with self._cache.package_layout(pref.ref).update_metadata() as metadata:
-                metadata.packages[pref.id].remote = p_remote.name
-
         return pref
 
+    def _update_packages_remote(self, ref, prefs, remote):
+        """ The uploaded packages without remote get the one they have been uploaded to, all of
+        them in a single update of the metadata
+        """
+        if not prefs:
+            return
+        with self._cache.package_layout(ref).update_metadata() as metadata:
+            for pref in prefs:
+                if not metadata.packages[pref.id].remote:
+                    metadata.packages[pref.id].remote = remote.name
+
     def _compress_recipe_files(self, ref):
         export_folder = self._cache.package_layout(ref).export()
 
@@ -306,7 +396,21 @@ class CmdUpload(object):
                                            self._user_io.out)
         return the_files
 
-    def _compress_package_files(self, pref, integrity_check):
+    def _package_tgz_name(self, remote):
+        """ The binaries are compressed with zstd only if configured and the remote supports it
+        """
+        if self._cache.config.compression_format != "zstd":
+            return PACKAGE_TGZ_NAME
+        if not zstd_available():
+            raise ConanException("The 'zstd' compression format requires the 'zstandard' "
+                                 "python package")
+        if ZSTD_CAPABILITY not in self._remote_manager.server_capabilities(remote):
+            self._user_io.out.warn("Remote '%s' doesn't support 'zstd' compression, "
+                                   "using 'gzip'" % remote.name)
+            return PACKAGE_TGZ_NAME
+        return PACKAGE_TZST_NAME
+
+    def _compress_package_files(self, pref, integrity_check, p_remote):
 
         t1 = time.time()
         # existing package, will use short paths if defined
@@ -316,10 +420,11 @@ class CmdUpload(object):
             raise ConanException("Package %s is corrupted, aborting upload.\n"
                                  "Remove it with 'conan remove %s -p=%s'"
                                  % (pref, pref.ref, pref.id))
-        tgz_path = os.path.join(package_folder, PACKAGE_TGZ_NAME)
+        tgz_name = self._package_tgz_name(p_remote)
+        tgz_path = os.path.join(package_folder, tgz_name)
         if is_dirty(tgz_path):
             self._user_io.out.warn("%s: Removing %s, marked as dirty"
-                                   % (str(pref), PACKAGE_TGZ_NAME))
+                                   % (str(pref), tgz_name))
             os.remove(tgz_path)
             clean_dirty(tgz_path)
         # Get all the files in that directory
@@ -330,12 +435,13 @@ class CmdUpload(object):
             raise ConanException("Cannot upload corrupted package '%s'" % str(pref))
 
         logger.debug("UPLOAD: Time remote_manager build_files_set : %f" % (time.time() - t1))
+        the_files = _compress_package_files(files, symlinks, package_folder, self._user_io.out,
+                                            tgz_name)
         if integrity_check:
-            self._package_integrity_check(pref, files, package_folder)
+            # After the compression, the checksums of the files are already known
+            self._package_integrity_check(pref, the_files, package_folder)
             logger.debug("UPLOAD: Time remote_manager check package integrity : %f"
                          % (time.time() - t1))
-
-        the_files = _compress_package_files(files, symlinks, package_folder, self._user_io.out)
         return the_files
 
     def _recipe_files_to_upload(self, ref, policy, the_files, remote, remote_manifest,
@@ -407,12 +513,13 @@ class CmdUpload(object):
                 self._user_io.out.warn("Mismatched checksum '%s' (manifest: %s, file: %s)"
                                        % (fname, h1, h2))
 
-            if PACKAGE_TGZ_NAME in files:
-                try:
-                    tgz_path = os.path.join(package_folder, PACKAGE_TGZ_NAME)
-                    os.unlink(tgz_path)
-                except Exception:
-                    pass
+            for tgz_name in (PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME):
+                if tgz_name in files:
+                    try:
+                        tgz_path = os.path.join(package_folder, tgz_name)
+                        os.unlink(tgz_path)
+                    except Exception:
+                        pass
             error_msg = os.linesep.join("Mismatched checksum '%s' (manifest: %s, file: %s)"
                                         % (fname, h1, h2) for fname, (h1, h2) in diff.items())
             logger.error("Manifests doesn't match!\n%s" % error_msg)
@@ -480,26 +587,33 @@ def _compress_recipe_files(files, symlinks, src_files, src_symlinks, dest_folder
     return result
 
 
-def _compress_package_files(files, symlinks, dest_folder, output):
-    tgz_path = files.get(PACKAGE_TGZ_NAME)
+def _compress_package_files(files, symlinks, dest_folder, output, tgz_name=PACKAGE_TGZ_NAME):
+    tgz_path = files.get(tgz_name)
     if not tgz_path:
         output.writeln("Compressing package...")
-        tgz_files = {f: path for f, path in files.items() if f not in [CONANINFO, CONAN_MANIFEST]}
-        tgz_path = compress_files(tgz_files, symlinks, PACKAGE_TGZ_NAME, dest_folder, output)
+        excluded = [CONANINFO, CONAN_MANIFEST, PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME]
+        tgz_files = {f: path for f, path in files.items() if f not in excluded}
+        tgz_path = compress_files(tgz_files, symlinks, tgz_name, dest_folder, output)
 
-    return {PACKAGE_TGZ_NAME: tgz_path,
+    return {tgz_name: tgz_path,
             CONANINFO: files[CONANINFO],
             CONAN_MANIFEST: files[CONAN_MANIFEST]}
 
 
 def compress_files(files, symlinks, name, dest_dir, output=None):
+    """ Writes the tgz in a single pass, reading every file once. The checksums of the
+    tgz and the md5 of every file are computed on the fly, so computing them later (the
+    X-Checksum-Sha1 of the upload, the manifest of the integrity check) won't read them again
+    """
     t1 = time.time()
-    # FIXME, better write to disk sequentially and not keep tgz contents in memory
     tgz_path = os.path.join(dest_dir, name)
     set_dirty(tgz_path)
     with open(tgz_path, "wb") as tgz_handle:
-        # tgz_contents = BytesIO()
-        tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle)
+        tgz_hashing = HashingFile(tgz_handle)
+        if name == PACKAGE_TZST_NAME:
+            tgz = zstd_tar_open(name, mode="w", fileobj=tgz_hashing)
+        else:
+            tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_hashing)
 
         for filename, dest in sorted(symlinks.items()):
             info = tarfile.TarInfo(name=filename)
@@ -516,8 +630,9 @@ def compress_files(files, symlinks, name, dest_dir, output=None):
             output.write("[")
         for filename, abs_path in sorted(files.items()):
             info = tarfile.TarInfo(name=filename)
-            info.size = os.stat(abs_path).st_size
-            info.mode = os.stat(abs_path).st_mode & mask
+            file_stat = os.stat(abs_path)
+            info.size = file_stat.st_size
+            info.mode = file_stat.st_mode & mask
             if os.path.islink(abs_path):
                 info.type = tarfile.SYMTYPE
                 info.size = 0  # A symlink shouldn't have size
@@ -525,7 +640,9 @@ def compress_files(files, symlinks, name, dest_dir, output=None):
                 tgz.addfile(tarinfo=info)
             else:
                 with open(abs_path, 'rb') as file_handler:
-                    tgz.addfile(tarinfo=info, fileobj=file_handler)
+                    file_hashing = HashingFile(file_handler, algorithm_names=("md5", ))
+                    tgz.addfile(tarinfo=info, fileobj=file_hashing)
+                remember_checksums(abs_path, file_hashing.checksums(), file_stat)
             if output and n_files > 1:
                 i_file = i_file + 1
                 units = min(50, int(50 * i_file / n_files))
@@ -544,6 +661,7 @@ def compress_files(files, symlinks, name, dest_dir, output=None):
                 output.writeln("]")
         tgz.close()
 
+    remember_checksums(tgz_path, tgz_hashing.checksums())
     clean_dirty(tgz_path)
     duration = time.time() - t1
     log_compressed_files(files, duration, tgz_path)
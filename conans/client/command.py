@@ -8,12 +8,8 @@ import six
 from argparse import ArgumentError
 
 from conans import __version__ as client_version
-from conans.client.cmd.uploader import UPLOAD_POLICY_FORCE, \
-    UPLOAD_POLICY_NO_OVERWRITE, UPLOAD_POLICY_NO_OVERWRITE_RECIPE, UPLOAD_POLICY_SKIP
 from conans.client.conan_api import (Conan, default_manifest_folder)
-from conans.client.conan_command_output import CommandOutputer
 from conans.client.output import Color
-from conans.client.printer import Printer
 from conans.errors import ConanException, ConanInvalidConfiguration, NoRemoteAvailable, \
     ConanMigrationError
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
@@ -116,6 +112,7 @@ class Command(object):
 
     @property
     def _outputer(self):
+        from conans.client.conan_command_output import CommandOutputer
         return CommandOutputer(self._user_io.out, self._conan._cache)
 
     def help(self, *args):
@@ -248,6 +245,7 @@ class Command(object):
         attributes = [args.raw, ] if args.raw else args.attribute
 
         result = self._conan.inspect(args.path_or_reference, attributes, args.remote)
+        from conans.client.printer import Printer
         Printer(self._user_io.out).print_inspect(result, raw=args.raw)
         if args.json:
             json_output = json.dumps(result)
@@ -320,6 +318,7 @@ class Command(object):
 
         _add_manifests_arguments(parser)
         _add_common_install_arguments(parser, build_help=_help_build_policies)
+        _add_parallel_argument(parser)
 
         args = parser.parse_args(*args)
         self._warn_python2()
@@ -339,7 +338,8 @@ class Command(object):
                                       args.build, args.keep_source, args.keep_build, args.verify,
                                       args.manifests, args.manifests_interactive,
                                       args.remote, args.update,
-                                      test_build_folder=args.test_build_folder)
+                                      test_build_folder=args.test_build_folder,
+                                      parallel=args.parallel)
         except ConanException as exc:
             info = exc.info
             raise
@@ -434,6 +434,7 @@ class Command(object):
                             'written')
 
         _add_common_install_arguments(parser, build_help=_help_build_policies)
+        _add_parallel_argument(parser)
 
         args = parser.parse_args(*args)
         cwd = get_cwd()
@@ -454,7 +455,8 @@ class Command(object):
                                            build=args.build, profile_names=args.profile,
                                            update=args.update, generators=args.generator,
                                            no_imports=args.no_imports,
-                                           install_folder=args.install_folder)
+                                           install_folder=args.install_folder,
+                                           parallel=args.parallel)
             else:
                 if args.reference:
                     raise ConanException("A full reference was provided as first argument, second "
@@ -470,7 +472,8 @@ class Command(object):
                                                      build=args.build, profile_names=args.profile,
                                                      update=args.update,
                                                      generators=args.generator,
-                                                     install_folder=args.install_folder)
+                                                     install_folder=args.install_folder,
+                                                     parallel=args.parallel)
         except ConanException as exc:
             info = exc.info
             raise
@@ -496,6 +499,10 @@ class Command(object):
         get_subparser = subparsers.add_parser('get', help='Get the value of configuration item')
         install_subparser = subparsers.add_parser('install', help='install a full configuration '
                                                                   'from a local or remote zip file')
+        catalog_subparser = subparsers.add_parser('catalog', help='rebuild the catalog of recipes '
+                                                                  'in the local cache, needed if '
+                                                                  'its folders are modified '
+                                                                  'without conan commands')
         rm_subparser.add_argument("item", help="Item to remove")
         get_subparser.add_argument("item", nargs="?", help="Item to print")
         set_subparser.add_argument("item", help="'item=value' to set")
@@ -514,6 +521,8 @@ class Command(object):
                                        'specified origin')
         install_subparser.add_argument("-tf", "--target-folder",
                                        help='Install to that path in the conan cache')
+        catalog_subparser.add_argument("--verify", default=False, action='store_true',
+                                       help='Check the catalog, without modifying it')
 
         args = parser.parse_args(*args)
 
@@ -535,6 +544,8 @@ class Command(object):
             return self._conan.config_install(args.item, verify_ssl, args.type, args.args,
                                               source_folder=args.source_folder,
                                               target_folder=args.target_folder)
+        elif args.subcommand == "catalog":
+            return self._conan.config_catalog(verify=args.verify)
 
     def info(self, *args):
         """
@@ -1256,6 +1267,9 @@ class Command(object):
                             help="Uploads package only if recipe is the same as the remote one")
         parser.add_argument("-j", "--json", default=None, action=OnceArgument,
                             help='json file path where the upload information will be written to')
+        parser.add_argument("--parallel", type=int, default=None, action=OnceArgument,
+                            help='Number of references to upload concurrently. Overrides the '
+                                 '"general.parallel_upload" configuration')
 
         args = parser.parse_args(*args)
 
@@ -1292,6 +1306,9 @@ class Command(object):
 
         self._warn_python2()
 
+        from conans.client.cmd.uploader import (UPLOAD_POLICY_FORCE, UPLOAD_POLICY_NO_OVERWRITE,
+                                                UPLOAD_POLICY_NO_OVERWRITE_RECIPE,
+                                                UPLOAD_POLICY_SKIP)
         if args.force:
             policy = UPLOAD_POLICY_FORCE
         elif args.no_overwrite == "all":
@@ -1309,7 +1326,8 @@ class Command(object):
                                       query=args.query, remote_name=args.remote,
                                       all_packages=args.all, policy=policy,
                                       confirm=args.confirm, retry=args.retry,
-                                      retry_wait=args.retry_wait, integrity_check=args.check)
+                                      retry_wait=args.retry_wait, integrity_check=args.check,
+                                      parallel=args.parallel)
 
         except ConanException as exc:
             info = exc.info
@@ -1705,12 +1723,14 @@ class Command(object):
         """ returns a list of available commands
         """
         result = {}
-        for m in inspect.getmembers(self, predicate=inspect.ismethod):
-            method_name = m[0]
+        # Not getting the private attributes, the properties would import what they need
+        for method_name in dir(self):
             if not method_name.startswith('_'):
+                method = getattr(self, method_name)
+                if not inspect.ismethod(method):
+                    continue
                 if "export_pkg" == method_name:
                     method_name = "export-pkg"
-                method = m[1]
                 if method.__doc__ and not method.__doc__.startswith('HIDDEN'):
                     result[method_name] = method
         return result
@@ -1848,6 +1868,13 @@ def _add_common_install_arguments(parser, build_help):
                         help="Check updates exist from upstream remotes")
 
 
+def _add_parallel_argument(parser):
+    parser.add_argument("--parallel", type=int, default=None, action=OnceArgument,
+                        help='Number of threads to download concurrently the binary packages of '
+                             'the same dependency graph level. Overrides the '
+                             '"general.parallel_download" configuration')
+
+
 _help_build_policies = '''Optional, use it to choose if you want to build from sources:
 
     --build            Build all from sources, do not use binary packages.
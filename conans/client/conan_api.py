@@ -4,61 +4,23 @@ from collections import OrderedDict
 
 import conans
 from conans import __version__ as client_version
-from conans.client import packager, tools
 from conans.client.cache.cache import ClientCache
-from conans.client.cmd.build import build
-from conans.client.cmd.create import create
-from conans.client.cmd.download import download
-from conans.client.cmd.export import cmd_export, export_alias
-from conans.client.cmd.export_pkg import export_pkg
-from conans.client.cmd.profile import (cmd_profile_create, cmd_profile_delete_key, cmd_profile_get,
-                                       cmd_profile_list, cmd_profile_update)
-from conans.client.cmd.search import Search
-from conans.client.cmd.test import PackageTester
-from conans.client.cmd.uploader import CmdUpload
-from conans.client.cmd.user import user_set, users_clean, users_list
 from conans.client.conf import ConanClientConfigParser
-from conans.client.graph.graph import RECIPE_EDITABLE
-from conans.client.graph.graph_manager import GraphManager
-from conans.client.graph.printer import print_graph
-from conans.client.graph.proxy import ConanProxy
-from conans.client.graph.python_requires import ConanPythonRequire
-from conans.client.graph.range_resolver import RangeResolver
 from conans.client.hook_manager import HookManager
-from conans.client.importer import run_imports, undo_imports
-from conans.client.installer import BinaryInstaller
-from conans.client.loader import ConanFileLoader
-from conans.client.manager import ConanManager
-from conans.client.migrations import ClientMigrator
 from conans.client.output import ConanOutput, colorama_initialize
-from conans.client.profile_loader import profile_from_args, read_profile
 from conans.client.recorder.action_recorder import ActionRecorder
-from conans.client.recorder.search_recorder import SearchRecorder
-from conans.client.recorder.upload_recoder import UploadRecorder
-from conans.client.remote_manager import RemoteManager
-from conans.client.remover import ConanRemover
-from conans.client.rest.auth_manager import ConanApiAuthManager
-from conans.client.rest.conan_requester import ConanRequester
-from conans.client.rest.rest_client import RestApiClient
-from conans.client.runner import ConanRunner
-from conans.client.source import config_source_local
-from conans.client.store.localdb import LocalDB
 from conans.client.userio import UserIO
 from conans.errors import (ConanException, RecipeNotFoundException,
                            PackageNotFoundException, NoRestV2Available, NotFoundException)
-from conans.model.conan_file import get_env_context_manager
-from conans.model.editable_layout import get_editable_abs_path
-from conans.model.graph_info import GraphInfo, GRAPH_INFO_FILE
+from conans.migrations import load_version
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
 from conans.model.version import Version
-from conans.model.workspace import Workspace
 from conans.paths import BUILD_INFO, CONANINFO, get_conan_user_home
-from conans.search.search import search_recipes
-from conans.tools import set_global_instances
 from conans.unicode import get_cwd
+from conans.util.env_reader import environment_append
 from conans.util.files import exception_message_safe, mkdir, save_files
 from conans.util.log import configure_logger
-from conans.util.tracer import log_command, log_exception
+from conans.util.tracer import log_command, log_exception, log_http_connections
 
 
 default_manifest_folder = '.conan_manifests'
@@ -68,10 +30,15 @@ def api_method(f):
     def wrapper(*args, **kwargs):
         api = args[0]
         api.invalidate_caches()
+        connections = api._connections()
         try:
             curdir = get_cwd()
             log_command(f.__name__, kwargs)
-            with tools.environment_append(api._cache.config.env_vars):
+            if "conans.tools" in sys.modules:
+                # The global requester and output of the tools in use have to be the API ones.
+                # Otherwise they are set when the recipes are loaded, importing the tools
+                api._remotes()
+            with environment_append(api._cache.config.env_vars):
                 # Patch the globals in tools
                 return f(*args, **kwargs)
         except Exception as exc:
@@ -83,6 +50,7 @@ def api_method(f):
             raise
         finally:
             os.chdir(curdir)
+            api._log_connections(connections)
     return wrapper
 
 
@@ -148,9 +116,11 @@ class ConanAPIV1(object):
         base_folder = os.path.join(user_home, ".conan")
 
         cache = ClientCache(base_folder, out)
-        # Migration system
-        migrator = ClientMigrator(cache, Version(client_version), out)
-        migrator.migrate()
+        # Migration system, not even imported if the cache is already migrated
+        if load_version(base_folder) != Version(client_version):
+            from conans.client.migrations import ClientMigrator
+            migrator = ClientMigrator(cache, Version(client_version), out)
+            migrator.migrate()
 
         sys.path.append(os.path.join(base_folder, "python"))
 
@@ -160,63 +130,138 @@ class ConanAPIV1(object):
         conans.util.log.logger.debug("INIT: Using config '%s'" % cache.conan_conf_path)
 
         hook_manager = HookManager(cache.hooks_path, config.hooks, user_io.out)
-        # Wraps an http_requester to inject proxies, certs, etc
-        requester = ConanRequester(config)
-        # To handle remote connections
-        put_headers = cache.read_put_headers()
-        rest_api_client = RestApiClient(user_io.out, requester,
-                                        revisions_enabled=config.revisions_enabled,
-                                        put_headers=put_headers)
-        # To store user and token
-        localdb = LocalDB.create(cache.localdb)
-        # Wraps RestApiClient to add authentication support (same interface)
-        auth_manager = ConanApiAuthManager(rest_api_client, user_io, localdb)
-        # Handle remote connections
-        remote_manager = RemoteManager(cache, auth_manager, user_io.out, hook_manager)
-
-        # Adjust global tool variables
-        set_global_instances(out, requester)
 
         # Settings preprocessor
         if interactive is None:
             interactive = not config.non_interactive
 
-        runner = ConanRunner(config.print_commands_to_output, config.generate_run_log_file,
-                             config.log_run_to_output)
-
-        conan = ConanAPIV1(cache, user_io, runner, remote_manager,
-                           hook_manager, requester, interactive=interactive)
+        # The runner and the remotes are created (and imported) by the commands using them
+        conan = ConanAPIV1(cache, user_io, hook_manager=hook_manager, interactive=interactive)
 
         return conan, cache, user_io
 
-    def __init__(self, cache, user_io, runner, remote_manager, hook_manager, requester,
-                 interactive=True):
+    def __init__(self, cache, user_io, runner=None, remote_manager=None, hook_manager=None,
+                 requester=None, interactive=True):
         assert isinstance(user_io, UserIO)
         assert isinstance(cache, ClientCache)
         self._cache = cache
         self._user_io = user_io
-        self._runner = runner
-        self._remote_manager = remote_manager
-        self._requester = requester
+        self._out = user_io.out
+        self._hook_manager = hook_manager
         if not interactive:
             self._user_io.disable_input()
+        # Created the first time they are used if not given, see the properties below. They
+        # use the output of the API when it was created
+        self._runner_instance = runner
+        self._remotes_instances = (remote_manager, requester) if remote_manager else None
+        self._graph_instances = None
+
+    @property
+    def _runner(self):
+        if self._runner_instance is None:
+            from conans.client.runner import ConanRunner
+            config = self._cache.config
+            self._runner_instance = ConanRunner(config.print_commands_to_output,
+                                                config.generate_run_log_file,
+                                                config.log_run_to_output)
+        return self._runner_instance
+
+    def _remotes(self):
+        if self._remotes_instances is None:
+            from conans.client.remote_manager import RemoteManager
+            from conans.client.rest.auth_manager import ConanApiAuthManager
+            from conans.client.rest.conan_requester import ConanRequester
+            from conans.client.rest.rest_client import RestApiClient
+            from conans.client.store.localdb import LocalDB
+            from conans.tools import set_global_instances
+
+            config = self._cache.config
+            out = self._out
+            # Wraps an http_requester to inject proxies, certs, etc
+            requester = ConanRequester(config)
+            # To handle remote connections
+            put_headers = self._cache.read_put_headers()
+            rest_api_client = RestApiClient(out, requester,
+                                            revisions_enabled=config.revisions_enabled,
+                                            put_headers=put_headers)
+            # To store user and token
+            localdb = LocalDB.create(self._cache.localdb)
+            # Wraps RestApiClient to add authentication support (same interface)
+            auth_manager = ConanApiAuthManager(rest_api_client, self._user_io, localdb)
+            # Handle remote connections
+            remote_manager = RemoteManager(self._cache, auth_manager, out, self._hook_manager)
+
+            # Adjust global tool variables
+            set_global_instances(out, requester)
+            self._remotes_instances = remote_manager, requester
+        return self._remotes_instances
+
+    @property
+    def _remote_manager(self):
+        return self._remotes()[0]
+
+    @property
+    def _requester(self):
+        return self._remotes()[1]
+
+    def _connections(self):
+        """ The requests done and the new connections opened so far by the requester, if any
+        """
+        requester = self._remotes_instances[1] if self._remotes_instances else None
+        stats = getattr(requester, "connection_stats", None)
+        return (stats.requests, stats.misses) if stats else (0, 0)
 
-        self._proxy = ConanProxy(cache, self._user_io.out, remote_manager)
-        resolver = RangeResolver(cache, remote_manager)
-        self._python_requires = ConanPythonRequire(self._proxy, resolver)
-        self._loader = ConanFileLoader(self._runner, self._user_io.out, self._python_requires)
-
-        self._graph_manager = GraphManager(self._user_io.out, self._cache,
-                                           self._remote_manager, self._loader, self._proxy,
-                                           resolver)
-        self._hook_manager = hook_manager
+    def _log_connections(self, previous):
+        """ Traces the reuse of the connections in the requests of the command
+        """
+        requests, misses = (current - before
+                            for current, before in zip(self._connections(), previous))
+        if requests > 0:
+            log_http_connections(max(requests - misses, 0), misses)
+
+    def _graph(self):
+        if self._graph_instances is None:
+            from conans.client.graph.graph_manager import GraphManager
+            from conans.client.graph.proxy import ConanProxy
+            from conans.client.graph.python_requires import ConanPythonRequire
+            from conans.client.graph.range_resolver import RangeResolver
+            from conans.client.loader import ConanFileLoader
+
+            out = self._out
+            proxy = ConanProxy(self._cache, out, self._remote_manager)
+            resolver = RangeResolver(self._cache, self._remote_manager)
+            python_requires = ConanPythonRequire(proxy, resolver)
+            loader = ConanFileLoader(self._runner, out, python_requires,
+                                     self._cache.compiled_recipes)
+            graph_manager = GraphManager(out, self._cache, self._remote_manager, loader, proxy,
+                                         resolver)
+            self._graph_instances = proxy, python_requires, loader, graph_manager
+        return self._graph_instances
+
+    @property
+    def _proxy(self):
+        return self._graph()[0]
+
+    @property
+    def _python_requires(self):
+        return self._graph()[1]
+
+    @property
+    def _loader(self):
+        return self._graph()[2]
+
+    @property
+    def _graph_manager(self):
+        return self._graph()[3]
 
     def invalidate_caches(self):
-        self._loader.invalidate_caches()
+        if self._graph_instances is not None:
+            self._loader.invalidate_caches()
         self._cache.invalidate()
 
     def _init_manager(self, action_recorder):
         """Every api call gets a new recorder and new manager"""
+        from conans.client.manager import ConanManager
         return ConanManager(self._cache, self._user_io,
                             self._remote_manager, action_recorder,
                             self._graph_manager, self._hook_manager)
@@ -286,6 +331,7 @@ class ConanAPIV1(object):
     def test(self, path, reference, profile_names=None, settings=None, options=None, env=None,
              remote_name=None, update=False, build_modes=None, cwd=None, test_build_folder=None):
 
+        from conans.client.cmd.test import PackageTester
         settings = settings or []
         options = options or []
         env = env or []
@@ -313,14 +359,18 @@ class ConanAPIV1(object):
                build_modes=None,
                keep_source=False, keep_build=False, verify=None,
                manifests=None, manifests_interactive=None,
-               remote_name=None, update=False, cwd=None, test_build_folder=None):
+               remote_name=None, update=False, cwd=None, test_build_folder=None,
+               parallel=None):
         """
         API method to create a conan package
 
         :param test_folder: default None   - looks for default 'test' or 'test_package' folder),
                                     string - test_folder path
                                     False  - disabling tests
+        :param parallel: Number of threads to download the binaries of the same graph level
         """
+        from conans.client.cmd.create import create
+        from conans.client.cmd.export import cmd_export
         settings = settings or []
         options = options or []
         env = env or []
@@ -356,7 +406,7 @@ class ConanAPIV1(object):
             recorder.add_recipe_being_developed(ref)
             create(ref, manager, self._user_io, graph_info, remotes, update, build_modes,
                    manifest_folder, manifest_verify, manifest_interactive, keep_build,
-                   test_build_folder, test_folder, conanfile_path)
+                   test_build_folder, test_folder, conanfile_path, parallel=parallel)
 
             return recorder.get_info(self._cache.config.revisions_enabled)
 
@@ -370,6 +420,9 @@ class ConanAPIV1(object):
                    package_folder=None, install_folder=None, profile_names=None, settings=None,
                    options=None, env=None, force=False, user=None, version=None, cwd=None):
 
+        from conans.client.cmd.export import cmd_export
+        from conans.client.cmd.export_pkg import export_pkg
+        from conans.model.graph_info import GRAPH_INFO_FILE
         remotes = self._cache.registry.load_remotes()
         self._python_requires.enable_remotes(remotes=remotes)
         settings = settings or []
@@ -422,6 +475,7 @@ class ConanAPIV1(object):
 
     @api_method
     def download(self, reference, remote_name=None, packages=None, recipe=False):
+        from conans.client.cmd.download import download
         if packages and recipe:
             raise ConanException("recipe parameter cannot be used together with packages")
         # Install packages without settings (fixed ids or all)
@@ -447,6 +501,10 @@ class ConanAPIV1(object):
     def workspace_install(self, path, settings=None, options=None, env=None,
                           remote_name=None, build=None, profile_name=None,
                           update=False, cwd=None, install_folder=None):
+        from conans.client.graph.graph import RECIPE_EDITABLE
+        from conans.client.graph.printer import print_graph
+        from conans.client.installer import BinaryInstaller
+        from conans.model.workspace import Workspace
         cwd = cwd or get_cwd()
         abs_path = os.path.normpath(os.path.join(cwd, path))
 
@@ -489,7 +547,8 @@ class ConanAPIV1(object):
     def install_reference(self, reference, settings=None, options=None, env=None,
                           remote_name=None, verify=None, manifests=None,
                           manifests_interactive=None, build=None, profile_names=None,
-                          update=False, generators=None, install_folder=None, cwd=None):
+                          update=False, generators=None, install_folder=None, cwd=None,
+                          parallel=None):
 
         try:
             recorder = ActionRecorder()
@@ -515,7 +574,8 @@ class ConanAPIV1(object):
                             update=update, manifest_folder=manifest_folder,
                             manifest_verify=manifest_verify,
                             manifest_interactive=manifest_interactive,
-                            generators=generators)
+                            generators=generators,
+                            parallel=parallel)
             return recorder.get_info(self._cache.config.revisions_enabled)
         except ConanException as exc:
             recorder.error = True
@@ -527,7 +587,8 @@ class ConanAPIV1(object):
                 settings=None, options=None, env=None,
                 remote_name=None, verify=None, manifests=None,
                 manifests_interactive=None, build=None, profile_names=None,
-                update=False, generators=None, no_imports=False, install_folder=None, cwd=None):
+                update=False, generators=None, no_imports=False, install_folder=None, cwd=None,
+                parallel=None):
 
         try:
             recorder = ActionRecorder()
@@ -556,7 +617,8 @@ class ConanAPIV1(object):
                             manifest_verify=manifest_verify,
                             manifest_interactive=manifest_interactive,
                             generators=generators,
-                            no_imports=no_imports)
+                            no_imports=no_imports,
+                            parallel=parallel)
             return recorder.get_info(self._cache.config.revisions_enabled)
         except ConanException as exc:
             recorder.error = True
@@ -593,7 +655,23 @@ class ConanAPIV1(object):
                                      requester=self._requester, config_type=config_type, args=args,
                                      source_folder=source_folder, target_folder=target_folder)
 
+    @api_method
+    def config_catalog(self, verify=False):
+        missing, stale = self._cache.catalog.rebuild(verify=verify)
+        out = self._user_io.out
+        for ref in missing:
+            out.info("%s: Missing in the recipes catalog" % str(ref))
+        for ref in stale:
+            out.info("%s: Not in the local cache" % str(ref))
+        if verify and (missing or stale):
+            raise ConanException("The recipes catalog is not up to date, "
+                                 "use 'conan config catalog' to rebuild it")
+        if not verify:
+            out.success("Recipes catalog rebuilt")
+        return {"missing": [str(ref) for ref in missing], "stale": [str(ref) for ref in stale]}
+
     def _info_args(self, reference_or_path, install_folder, profile_names, settings, options, env):
+        from conans.model.graph_info import GRAPH_INFO_FILE
         cwd = get_cwd()
         try:
             ref = ConanFileReference.loads(reference_or_path)
@@ -664,6 +742,7 @@ class ConanAPIV1(object):
               install_folder=None, should_configure=True, should_build=True, should_install=True,
               should_test=True, cwd=None):
 
+        from conans.client.cmd.build import build
         remotes = self._cache.registry.load_remotes()
         self._python_requires.enable_remotes(remotes=remotes)
         cwd = cwd or get_cwd()
@@ -682,6 +761,8 @@ class ConanAPIV1(object):
     @api_method
     def package(self, path, build_folder, package_folder, source_folder=None, install_folder=None,
                 cwd=None):
+        from conans.client import packager
+        from conans.model.conan_file import get_env_context_manager
         remotes = self._cache.registry.load_remotes()
         self._python_requires.enable_remotes(remotes=remotes)
 
@@ -705,6 +786,7 @@ class ConanAPIV1(object):
 
     @api_method
     def source(self, path, source_folder=None, info_folder=None, cwd=None):
+        from conans.client.source import config_source_local
         remotes = self._cache.registry.load_remotes()
         self._python_requires.enable_remotes(remotes=remotes)
 
@@ -730,6 +812,7 @@ class ConanAPIV1(object):
         :param cwd: Current working directory
         :return: None
         """
+        from conans.client.importer import run_imports
         cwd = cwd or get_cwd()
         info_folder = _make_abs_path(info_folder, cwd)
         dest = _make_abs_path(dest, cwd)
@@ -744,12 +827,14 @@ class ConanAPIV1(object):
 
     @api_method
     def imports_undo(self, manifest_path):
+        from conans.client.importer import undo_imports
         cwd = get_cwd()
         manifest_path = _make_abs_path(manifest_path, cwd)
         undo_imports(manifest_path, self._user_io.out)
 
     @api_method
     def export(self, path, name, version, user, channel, keep_source=False, cwd=None):
+        from conans.client.cmd.export import cmd_export
         conanfile_path = _get_conanfile_path(path, cwd, py=True)
         remotes = self._cache.registry.load_remotes()
         self._python_requires.enable_remotes(remotes=remotes)
@@ -760,6 +845,7 @@ class ConanAPIV1(object):
     @api_method
     def remove(self, pattern, query=None, packages=None, builds=None, src=False, force=False,
                remote_name=None, outdated=False):
+        from conans.client.remover import ConanRemover
         remotes = self._cache.registry.load_remotes()
         remover = ConanRemover(self._cache, self._remote_manager, self._user_io, remotes)
         remover.remove(pattern, remote_name, src, builds, packages, force=force,
@@ -788,16 +874,19 @@ class ConanAPIV1(object):
 
     @api_method
     def user_set(self, user, remote_name=None):
+        from conans.client.cmd.user import user_set
         remote = (self.get_default_remote() if not remote_name
                   else self.get_remote_by_name(remote_name))
         return user_set(self._cache.localdb, user, remote)
 
     @api_method
     def users_clean(self):
+        from conans.client.cmd.user import users_clean
         users_clean(self._cache.localdb)
 
     @api_method
     def users_list(self, remote_name=None):
+        from conans.client.cmd.user import users_list
         info = {"error": False, "remotes": []}
         remotes = [self.get_remote_by_name(remote_name)] if remote_name else self.remote_list()
         try:
@@ -810,6 +899,8 @@ class ConanAPIV1(object):
 
     @api_method
     def search_recipes(self, pattern, remote_name=None, case_sensitive=False):
+        from conans.client.cmd.search import Search
+        from conans.client.recorder.search_recorder import SearchRecorder
         search_recorder = SearchRecorder()
         remotes = self._cache.registry.load_remotes()
         search = Search(self._cache, self._remote_manager, remotes)
@@ -828,6 +919,8 @@ class ConanAPIV1(object):
 
     @api_method
     def search_packages(self, reference, query=None, remote_name=None, outdated=False):
+        from conans.client.cmd.search import Search
+        from conans.client.recorder.search_recorder import SearchRecorder
         search_recorder = SearchRecorder()
         remotes = self._cache.registry.load_remotes()
         search = Search(self._cache, self._remote_manager, remotes)
@@ -854,9 +947,12 @@ class ConanAPIV1(object):
 
     @api_method
     def upload(self, pattern, package=None, remote_name=None, all_packages=False, confirm=False,
-               retry=None, retry_wait=None, integrity_check=False, policy=None, query=None):
+               retry=None, retry_wait=None, integrity_check=False, policy=None, query=None,
+               parallel=None):
         """ Uploads a package recipe and the generated binary packages to a specified remote
         """
+        from conans.client.cmd.uploader import CmdUpload
+        from conans.client.recorder.upload_recoder import UploadRecorder
         upload_recorder = UploadRecorder()
         uploader = CmdUpload(self._cache, self._user_io, self._remote_manager,
                              self._loader, self._hook_manager)
@@ -865,7 +961,7 @@ class ConanAPIV1(object):
         self._python_requires.enable_remotes(remotes=remotes)
         try:
             uploader.upload(pattern, remotes, upload_recorder, package, all_packages, confirm, retry,
-                            retry_wait, integrity_check, policy, query=query)
+                            retry_wait, integrity_check, policy, query=query, parallel=parallel)
             return upload_recorder.get_info()
         except ConanException as exc:
             upload_recorder.error = True
@@ -970,6 +1066,7 @@ class ConanAPIV1(object):
 
     @api_method
     def remove_system_reqs_by_pattern(self, pattern):
+        from conans.search.search import search_recipes
         for ref in search_recipes(self._cache, pattern=pattern):
             self.remove_system_reqs(ref.full_repr())
 
@@ -979,27 +1076,33 @@ class ConanAPIV1(object):
 
     @api_method
     def profile_list(self):
+        from conans.client.cmd.profile import cmd_profile_list
         return cmd_profile_list(self._cache.profiles_path, self._user_io.out)
 
     @api_method
     def create_profile(self, profile_name, detect=False, force=False):
+        from conans.client.cmd.profile import cmd_profile_create
         return cmd_profile_create(profile_name, self._cache.profiles_path,
                                   self._user_io.out, detect, force)
 
     @api_method
     def update_profile(self, profile_name, key, value):
+        from conans.client.cmd.profile import cmd_profile_update
         return cmd_profile_update(profile_name, key, value, self._cache.profiles_path)
 
     @api_method
     def get_profile_key(self, profile_name, key):
+        from conans.client.cmd.profile import cmd_profile_get
         return cmd_profile_get(profile_name, key, self._cache.profiles_path)
 
     @api_method
     def delete_profile_key(self, profile_name, key):
+        from conans.client.cmd.profile import cmd_profile_delete_key
         return cmd_profile_delete_key(profile_name, key, self._cache.profiles_path)
 
     @api_method
     def read_profile(self, profile=None):
+        from conans.client.profile_loader import read_profile
         p, _ = read_profile(profile, get_cwd(), self._cache.profiles_path)
         return p
 
@@ -1026,6 +1129,7 @@ class ConanAPIV1(object):
 
     @api_method
     def export_alias(self, reference, target_reference):
+        from conans.client.cmd.export import export_alias
         ref = ConanFileReference.loads(reference)
         target_ref = ConanFileReference.loads(target_reference)
 
@@ -1042,9 +1146,10 @@ class ConanAPIV1(object):
                                      " and alias with the same name".format(ref))
 
         package_layout = self._cache.package_layout(ref)
-        return export_alias(package_layout, target_ref,
-                            revisions_enabled=self._cache.config.revisions_enabled,
-                            output=self._user_io.out)
+        export_alias(package_layout, target_ref,
+                     revisions_enabled=self._cache.config.revisions_enabled,
+                     output=self._user_io.out)
+        self._cache.catalog.update(ref)
 
     @api_method
     def get_default_remote(self):
@@ -1137,6 +1242,7 @@ class ConanAPIV1(object):
     @api_method
     def editable_add(self, path, reference, layout, cwd):
         # Retrieve conanfile.py from target_path
+        from conans.model.editable_layout import get_editable_abs_path
         target_path = _get_conanfile_path(path=path, cwd=cwd, py=True)
 
         remotes = self._cache.registry.load_remotes()
@@ -1171,6 +1277,8 @@ Conan = ConanAPIV1
 
 def get_graph_info(profile_names, settings, options, env, cwd, install_folder, cache, output,
                    name=None, version=None, user=None, channel=None):
+    from conans.client.profile_loader import profile_from_args
+    from conans.model.graph_info import GraphInfo
     try:
         graph_info = GraphInfo.load(install_folder)
         graph_info.profile.process_settings(cache, preprocess=False)
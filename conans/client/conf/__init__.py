@@ -105,6 +105,8 @@ print_run_commands = False  # environment CONAN_PRINT_RUN_COMMANDS
 [general]
 default_profile = %s
 compression_level = 9                 # environment CONAN_COMPRESSION_LEVEL
+# compression_threads = 8             # environment CONAN_COMPRESSION_THREADS
+# compression_format = gzip           # environment CONAN_COMPRESSION_FORMAT (gzip/zstd)
 sysrequires_sudo = True               # environment CONAN_SYSREQUIRES_SUDO
 request_timeout = 60                  # environment CONAN_REQUEST_TIMEOUT (seconds)
 default_package_id_mode = semver_direct_mode # environment CONAN_DEFAULT_PACKAGE_ID_MODE
@@ -117,6 +119,7 @@ default_package_id_mode = semver_direct_mode # environment CONAN_DEFAULT_PACKAGE
 # bash_path = ""                      # environment CONAN_BASH_PATH (only windows)
 # recipe_linter = False               # environment CONAN_RECIPE_LINTER
 # read_only_cache = True              # environment CONAN_READ_ONLY_CACHE
+# copy_strategy = reflink             # environment CONAN_COPY_STRATEGY (copy, reflink, hardlink)
 # pylintrc = path/to/pylintrc_file    # environment CONAN_PYLINTRC
 # cache_no_locks = True               # environment CONAN_CACHE_NO_LOCKS
 # user_home_short = your_path         # environment CONAN_USER_HOME_SHORT
@@ -124,6 +127,11 @@ default_package_id_mode = semver_direct_mode # environment CONAN_DEFAULT_PACKAGE
 # skip_vs_projects_upgrade = False    # environment CONAN_SKIP_VS_PROJECTS_UPGRADE
 # non_interactive = False             # environment CONAN_NON_INTERACTIVE
 # skip_broken_symlinks_check = False  # enviornment CONAN_SKIP_BROKEN_SYMLINKS_CHECK
+# parallel_download = 8               # environment CONAN_PARALLEL_DOWNLOAD (number of threads)
+# parallel_upload = 4                 # environment CONAN_PARALLEL_UPLOAD (number of threads)
+# http_pool_connections = 10          # environment CONAN_HTTP_POOL_CONNECTIONS (number of remote hosts kept alive)
+# http_pool_maxsize = 16              # environment CONAN_HTTP_POOL_MAXSIZE (connections kept alive per remote host)
+# remote_search_ttl = 300             # environment CONAN_REMOTE_SEARCH_TTL (seconds the remote searches of the version ranges are reused)
 
 # conan_make_program = make           # environment CONAN_MAKE_PROGRAM (overrides the make program used in AutoToolsBuildEnvironment.make)
 # conan_cmake_program = cmake         # environment CONAN_CMAKE_PROGRAM (overrides the make program used in CMake.cmake_program)
@@ -197,6 +205,7 @@ class ConanClientConfigParser(ConfigParser, object):
                "CONAN_TRACE_FILE": self._env_c("log.trace_file", "CONAN_TRACE_FILE", None),
                "CONAN_PRINT_RUN_COMMANDS": self._env_c("log.print_run_commands", "CONAN_PRINT_RUN_COMMANDS", "False"),
                "CONAN_COMPRESSION_LEVEL": self._env_c("general.compression_level", "CONAN_COMPRESSION_LEVEL", "9"),
+               "CONAN_COMPRESSION_THREADS": self._env_c("general.compression_threads", "CONAN_COMPRESSION_THREADS", None),
                "CONAN_NON_INTERACTIVE": self._env_c("general.non_interactive", "CONAN_NON_INTERACTIVE", "False"),
                "CONAN_SKIP_BROKEN_SYMLINKS_CHECK": self._env_c("general.skip_broken_symlinks_check", "CONAN_SKIP_BROKEN_SYMLINKS_CHECK", "False"),
                "CONAN_PYLINTRC": self._env_c("general.pylintrc", "CONAN_PYLINTRC", None),
@@ -211,6 +220,7 @@ class ConanClientConfigParser(ConfigParser, object):
                "CONAN_RECIPE_LINTER": self._env_c("general.recipe_linter", "CONAN_RECIPE_LINTER", "True"),
                "CONAN_CPU_COUNT": self._env_c("general.cpu_count", "CONAN_CPU_COUNT", None),
                "CONAN_READ_ONLY_CACHE": self._env_c("general.read_only_cache", "CONAN_READ_ONLY_CACHE", None),
+               "CONAN_COPY_STRATEGY": self._env_c("general.copy_strategy", "CONAN_COPY_STRATEGY", None),
                "CONAN_USER_HOME_SHORT": self._env_c("general.user_home_short", "CONAN_USER_HOME_SHORT", None),
                "CONAN_USE_ALWAYS_SHORT_PATHS": self._env_c("general.use_always_short_paths", "CONAN_USE_ALWAYS_SHORT_PATHS", None),
                "CONAN_VERBOSE_TRACEBACK": self._env_c("general.verbose_traceback", "CONAN_VERBOSE_TRACEBACK", None),
@@ -555,6 +565,88 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'retry_wait'")
 
+    @property
+    def parallel_download(self):
+        parallel_download = os.getenv("CONAN_PARALLEL_DOWNLOAD")
+        if not parallel_download:
+            try:
+                parallel_download = self.get_item("general.parallel_download")
+            except ConanException:
+                return None
+
+        try:
+            return int(parallel_download) if parallel_download is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_download'")
+
+    @property
+    def compression_format(self):
+        compression_format = os.getenv("CONAN_COMPRESSION_FORMAT")
+        if not compression_format:
+            try:
+                compression_format = self.get_item("general.compression_format")
+            except ConanException:
+                return "gzip"
+        if compression_format not in ("gzip", "zstd"):
+            raise ConanException("Invalid 'compression_format' value '%s', allowed values are "
+                                 "'gzip' and 'zstd'" % compression_format)
+        return compression_format
+
+    @property
+    def parallel_upload(self):
+        parallel_upload = os.getenv("CONAN_PARALLEL_UPLOAD")
+        if not parallel_upload:
+            try:
+                parallel_upload = self.get_item("general.parallel_upload")
+            except ConanException:
+                return None
+
+        try:
+            return int(parallel_upload) if parallel_upload is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_upload'")
+
+    @property
+    def http_pool_connections(self):
+        return self._http_pool_item("http_pool_connections")
+
+    @property
+    def http_pool_maxsize(self):
+        return self._http_pool_item("http_pool_maxsize")
+
+    def _http_pool_item(self, name):
+        value = os.getenv("CONAN_%s" % name.upper())
+        if not value:
+            try:
+                value = self.get_item("general.%s" % name)
+            except ConanException:
+                return None
+
+        try:
+            value = int(value) if value is not None else None
+        except ValueError:
+            value = 0
+        if value is not None and value < 1:
+            raise ConanException("Specify a positive numeric parameter for '%s'" % name)
+        return value
+
+    @property
+    def remote_search_ttl(self):
+        remote_search_ttl = os.getenv("CONAN_REMOTE_SEARCH_TTL")
+        if not remote_search_ttl:
+            try:
+                remote_search_ttl = self.get_item("general.remote_search_ttl")
+            except ConanException:
+                return 0
+
+        try:
+            remote_search_ttl = int(remote_search_ttl)
+        except ValueError:
+            remote_search_ttl = -1
+        if remote_search_ttl < 0:
+            raise ConanException("Specify a number of seconds for 'remote_search_ttl'")
+        return remote_search_ttl
+
     @property
     def generate_run_log_file(self):
         try:
@@ -0,0 +1,221 @@
+"""
+    Optional local daemon keeping a warm ConanAPIV1 between commands: the imports, the
+    configuration, the loaded hooks, the compiled recipes and the open http sessions survive,
+    so the commands forwarded to it don't pay the startup of a new conan process.
+
+    The daemon is launched with "conan_daemon --socket <path>", and the "conan" command forwards
+    to it when the CONAN_DAEMON_SOCKET environment variable points to its socket. The client
+    passes its standard file descriptors, environment and current directory, so the command
+    output, colors and prompts are the same as running it in the client process. If there is no
+    daemon listening, the command runs in the client process.
+
+    The commands are run one at a time. The API is created again when any of the configuration
+    files of the cache or the CONAN_XXX environment variables change.
+
+    Only the user running the daemon can connect to its socket, and the commands of the
+    processes of other users (SO_PEERCRED) are rejected.
+"""
+import array
+import json
+import os
+import socket
+import struct
+import sys
+import traceback
+
+from conans.unicode import get_cwd
+from conans.util.log import logger
+
+DAEMON_SOCKET_ENV = "CONAN_DAEMON_SOCKET"
+_STD_FDS = (0, 1, 2)
+_FDS_MARKER = b"F"
+
+
+def daemon_supported():
+    """ The standard file descriptors are passed through unix sockets (SCM_RIGHTS), and the user
+    of the client process is checked with SO_PEERCRED
+    """
+    return (hasattr(socket, "AF_UNIX") and hasattr(socket.socket, "sendmsg") and
+            hasattr(socket, "SO_PEERCRED"))
+
+
+def forward_command(socket_path, args):
+    """ Runs the command in the daemon listening in 'socket_path', returning its exit code, or
+    None if there is no daemon available and the command has to run in this process
+    """
+    if not daemon_supported():
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            client.connect(socket_path)
+        except (IOError, OSError):
+            return None
+        sys.stdout.flush()
+        sys.stderr.flush()
+        fds = array.array("i", _STD_FDS)
+        client.sendmsg([_FDS_MARKER], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds.tobytes())])
+        request = {"args": args, "cwd": get_cwd(), "env": dict(os.environ)}
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        response = client.makefile("rb").readline()
+    finally:
+        client.close()
+    if not response:
+        from conans.client.command import ERROR_GENERAL
+        sys.stderr.write("ERROR: The conan daemon at %s stopped running the command\n"
+                         % socket_path)
+        return ERROR_GENERAL
+    response = json.loads(response.decode("utf-8"))
+    if "error" in response:
+        sys.stderr.write("ERROR: %s\n" % response["error"])
+    return response["exit"]
+
+
+def _receive_fds(connection):
+    fds = array.array("i")
+    _, ancdata, _, _ = connection.recvmsg(len(_FDS_MARKER),
+                                          socket.CMSG_LEN(len(_STD_FDS) * fds.itemsize))
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(data[:len(data) - (len(data) % fds.itemsize)])
+    return list(fds)
+
+
+def _peer_uid(connection):
+    """ the uid of the process connected to the unix socket
+    """
+    creds = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)  # pid, uid, gid
+    return uid
+
+
+def _file_state(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime, st.st_size
+
+
+class ConanDaemon(object):
+    """ Runs the "conan" commands received in a unix socket with the same ConanAPIV1, until
+    'max_commands' (if defined) are run
+    """
+
+    def __init__(self, socket_path):
+        self._socket_path = socket_path
+        self._command = None
+        self._cache = None
+        self._state = None
+
+    def serve(self, max_commands=None):
+        if os.path.exists(self._socket_path):  # From a daemon not finished properly
+            os.remove(self._socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            old_umask = os.umask(0o077)  # Created only accessible by the user, since the start
+            try:
+                server.bind(self._socket_path)
+            finally:
+                os.umask(old_umask)
+            server.listen(16)
+            commands = 0
+            while max_commands is None or commands < max_commands:
+                connection, _ = server.accept()
+                try:
+                    self._serve(connection)
+                except Exception as exc:
+                    logger.error("Error in conan daemon: %s" % exc)
+                    sys.stderr.write(traceback.format_exc())
+                finally:
+                    connection.close()
+                commands += 1
+        finally:
+            server.close()
+            if os.path.exists(self._socket_path):
+                os.remove(self._socket_path)
+
+    def _serve(self, connection):
+        client_fds = _receive_fds(connection)
+        try:
+            request = json.loads(connection.makefile("rb").readline().decode("utf-8"))
+            uid = _peer_uid(connection)
+            if uid != os.getuid():
+                from conans.client.command import ERROR_GENERAL
+                logger.warning("Conan daemon rejected a command of the user %s" % uid)
+                response = {"exit": ERROR_GENERAL,
+                            "error": "The conan daemon at %s only runs the commands of its user"
+                                     % self._socket_path}
+            else:
+                response = {"exit": self._run_request(request, client_fds)}
+        finally:
+            for fd in client_fds:
+                os.close(fd)
+        connection.sendall(json.dumps(response).encode("utf-8") + b"\n")
+
+    def _run_request(self, request, client_fds):
+        saved_fds = [os.dup(fd) for fd in _STD_FDS]
+        saved_environ = dict(os.environ)
+        saved_cwd = get_cwd()
+        try:
+            for fd, client_fd in zip(_STD_FDS, client_fds):
+                os.dup2(client_fd, fd)
+            os.environ.clear()
+            os.environ.update(request["env"])
+            os.chdir(request["cwd"])
+            return self._run(request["args"])
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for fd, saved_fd in zip(_STD_FDS, saved_fds):
+                os.dup2(saved_fd, fd)
+                os.close(saved_fd)
+            os.environ.clear()
+            os.environ.update(saved_environ)
+            os.chdir(saved_cwd)
+
+    def _run(self, args):
+        from conans.client.command import ERROR_GENERAL, ERROR_MIGRATION
+        from conans.errors import ConanException, ConanMigrationError
+        try:
+            command = self._get_command()
+        except ConanMigrationError:
+            return ERROR_MIGRATION
+        except ConanException as e:
+            sys.stderr.write("Error in Conan initialization: {}".format(e))
+            return ERROR_GENERAL
+        return command.run(args) or 0
+
+    def _config_state(self):
+        """ Everything the ConanAPIV1 depends on, it is created again when something changes
+        """
+        from conans.client.output import colorama_initialize
+        from conans.migrations import CONAN_VERSION
+        from conans.paths import get_conan_user_home
+
+        conan_vars = sorted((k, v) for k, v in os.environ.items() if k.startswith("CONAN_")
+                            and k != DAEMON_SOCKET_ENV)
+        files = []
+        if self._cache is not None:
+            cache = self._cache
+            paths = [cache.conan_conf_path, cache.settings_path, cache.registry_path,
+                     cache.default_profile_path, cache.localdb,
+                     os.path.join(cache.cache_folder, CONAN_VERSION)]
+            for root, _, filenames in os.walk(cache.hooks_path):
+                paths.extend(os.path.join(root, f) for f in filenames)
+            files = [(path, _file_state(path)) for path in paths]
+        return get_conan_user_home(), colorama_initialize(), conan_vars, files
+
+    def _get_command(self):
+        from conans.client.command import Command
+        from conans.client.conan_api import Conan
+
+        state = self._config_state()
+        if self._command is None or state != self._state:
+            self._command = self._cache = None
+            conan_api, self._cache, _ = Conan.factory()
+            self._command = Command(conan_api)
+            # The factory could have created some of the files (migrations, default files)
+            state = self._config_state()
+        self._state = state
+        return self._command
@@ -1,10 +1,98 @@
 import fnmatch
 import os
+import platform
+import posixpath
+import re
 import shutil
-from collections import defaultdict
+import stat
+import time
+from collections import OrderedDict, defaultdict
 
+from conans.errors import ConanException
+from conans.util.env_reader import get_env
 from conans.util.files import mkdir, walk
 
+COPY_STRATEGIES = ("copy", "reflink", "hardlink")
+_FICLONE = 0x40049409  # Linux ioctl sharing the data of a file (btrfs, xfs...)
+# Coarsest mtime resolution of the file systems (FAT), a folder modified within it after being
+# listed could keep the same mtime
+_MTIME_RESOLUTION = 2
+_compiled_patterns = {}
+
+
+def _pattern_matcher(patterns):
+    """ the compiled "match" of a list of fnmatch patterns, matching the names that
+    fnmatch.fnmatch() matches with any of them
+    """
+    key = tuple(patterns)
+    matcher = _compiled_patterns.get(key)
+    if matcher is None:
+        if len(_compiled_patterns) > 256:
+            _compiled_patterns.clear()
+        regex = "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+        matcher = re.compile(regex).match
+        _compiled_patterns[key] = matcher
+    return matcher
+
+
+def _filter_names(names, matcher, exclude=False):
+    """ the names matching (or not matching if exclude) as fnmatch.filter() does
+    """
+    if os.path is not posixpath:
+        return [n for n in names if bool(matcher(os.path.normcase(n))) is not exclude]
+    if exclude:
+        return [n for n in names if not matcher(n)]
+    return [n for n in names if matcher(n)]
+
+
+def _reflink(src, dst):
+    """ copies the src file to dst sharing its data blocks (copy-on-write), in the Linux file
+    systems supporting it. Returns False if it was not possible
+    """
+    if platform.system() != "Linux":
+        return False
+    import fcntl
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+    except (IOError, OSError):
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _hardlink(src, dst):
+    """ links dst to the src file, returns False if it was not possible (other file system)
+    """
+    if not hasattr(os, "link"):  # Windows python 2
+        return False
+    try:
+        if os.path.lexists(dst):
+            os.remove(dst)
+        os.link(os.path.realpath(src), dst)
+    except OSError:
+        return False
+    return True
+
+
+def _copy_strategy():
+    strategy = get_env("CONAN_COPY_STRATEGY", "copy")
+    if strategy not in COPY_STRATEGIES:
+        raise ConanException("Invalid copy strategy '%s' (CONAN_COPY_STRATEGY), use one of %s"
+                             % (strategy, ", ".join(COPY_STRATEGIES)))
+    return strategy
+
+
+def report_copied_bytes(copied_bytes, output):
+    """ the bytes of the copied files by strategy, only if other than "copy" is configured
+    """
+    if _copy_strategy() == "copy" or not any(copied_bytes.values()):
+        return
+    from conans.client.tools.files import human_size
+    output.info("Copied %s, %s reflinked and %s hardlinked (not copied)"
+                % (human_size(copied_bytes["copy"]), human_size(copied_bytes["reflink"]),
+                   human_size(copied_bytes["hardlink"])))
+
 
 def report_copied_files(copied, output, message_suffix="Copied"):
     ext_files = defaultdict(list)
@@ -32,7 +120,7 @@ class FileCopier(object):
     imports: package folder -> user folder
     export: user folder -> store "export" folder
     """
-    def __init__(self, source_folders, root_destination_folder):
+    def __init__(self, source_folders, root_destination_folder, hardlinks=False):
         """
         Takes the base folders to copy resources src -> dst. These folders names
         will not be used in the relative names while copying
@@ -40,19 +128,34 @@ class FileCopier(object):
                                   store build folder
         param root_destination_folder: The base folder to copy things to, typically the
                                        store package folder
+        param hardlinks: the source files can be hardlinked instead of copied, if the
+                         "hardlink" copy strategy is configured. Only for read-only files, as
+                         the ones of the packages in a read-only cache
         """
         assert isinstance(source_folders, list), "source folders must be a list"
         self._src_folders = source_folders
         self._dst_folder = root_destination_folder
         self._copied = []
+        self._strategy = _copy_strategy()
+        self._hardlinks = hardlinks and self._strategy == "hardlink"
+        self._no_reflink_devices = set()  # (src, dst) devices not supporting reflinks
+        self.copied_bytes = {strategy: 0 for strategy in COPY_STRATEGIES}
+        self.hardlinked_files = []
+        self.copied_from = {}  # {dst file: src file} of the copied files (not symlinks)
+        # {folder: (mtime, listing time, root, subfolders, files, {relative path: names})} of the
+        # walked folders, so the copy() calls of the same FileCopier don't walk them again
+        self._listings = {}
 
     def report(self, output):
+        report_copied_bytes(self.copied_bytes, output)
         return report_copied_files(self._copied, output)
 
     def __call__(self, pattern, dst="", src="", keep_path=True, links=False, symlinks=None,
                  excludes=None, ignore_case=False):
         """
         param pattern: an fnmatch file pattern of the files that should be copied. Eg. *.dll
+                       or a list of them, copying the files that match any of them in a
+                       single pass. Eg. ["*.h", "*.hpp"]
         param dst: the destination local folder, wrt to current conanfile dir, to which
                    the files will be copied. Eg: "bin"
         param src: the source folder in which those files will be searched. This folder
@@ -67,88 +170,130 @@ class FileCopier(object):
         if symlinks is not None:
             links = symlinks
 
+        patterns = list(pattern) if isinstance(pattern, (list, tuple)) else [pattern]
         files = []
         for src_folder in self._src_folders:
             excluded = [self._dst_folder]
             excluded.extend([d for d in self._src_folders if d is not src_folder])
-            fs = self._copy(src_folder, pattern, src, dst, links, ignore_case, excludes,
+            fs = self._copy(src_folder, patterns, src, dst, links, ignore_case, excludes,
                             keep_path, excluded_folders=excluded)
             files.extend(fs)
 
         return files
 
-    def _copy(self, base_src, pattern, src, dst, symlinks, ignore_case, excludes, keep_path,
+    def _copy(self, base_src, patterns, src, dst, symlinks, ignore_case, excludes, keep_path,
               excluded_folders):
         # Check for ../ patterns and allow them
-        if pattern.startswith(".."):
-            rel_dir = os.path.abspath(os.path.join(base_src, pattern))
-            base_src = os.path.dirname(rel_dir)
-            pattern = os.path.basename(rel_dir)
+        base_patterns = OrderedDict()
+        for pattern in patterns:
+            pattern_src = base_src
+            if pattern.startswith(".."):
+                rel_dir = os.path.abspath(os.path.join(base_src, pattern))
+                pattern_src = os.path.dirname(rel_dir)
+                pattern = os.path.basename(rel_dir)
+            base_patterns.setdefault(pattern_src, []).append(pattern)
 
-        src = os.path.join(base_src, src)
         dst = os.path.join(self._dst_folder, dst)
-
-        files_to_copy, link_folders = self._filter_files(src, pattern, symlinks, excludes,
-                                                         ignore_case, excluded_folders)
-        copied_files = self._copy_files(files_to_copy, src, dst, keep_path, symlinks)
-        self.link_folders(src, dst, link_folders)
-        self._copied.extend(files_to_copy)
+        copied_files = []
+        for pattern_src, src_patterns in base_patterns.items():
+            pattern_src = os.path.join(pattern_src, src)
+            files_to_copy, link_folders = self._filter_files(pattern_src, src_patterns, symlinks,
+                                                             excludes, ignore_case,
+                                                             excluded_folders)
+            copied_files.extend(self._copy_files(files_to_copy, pattern_src, dst, keep_path,
+                                                 symlinks))
+            self.link_folders(pattern_src, dst, link_folders)
+            self._copied.extend(files_to_copy)
         return copied_files
 
-    @staticmethod
-    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders):
+    def _list_folder(self, folder):
+        """ the (root, subfolders, files) of the folder as walk() lists them, with the other
+        listing fields, or None if it is not a folder. The listing is reused while the folder
+        mtime doesn't change
+        """
+        try:
+            mtime = os.stat(folder).st_mtime
+        except OSError:
+            return None
+        key = os.path.normpath(folder)
+        listing = self._listings.get(key)
+        # Modified in the same mtime tick it was listed, it could have changed after the listing
+        if listing and listing[0] == mtime and mtime + _MTIME_RESOLUTION < listing[1]:
+            return listing
+        listing_time = time.time()
+        for root, subfolders, files in walk(folder, followlinks=True):
+            break  # Only this folder is listed, the subfolders are listed when visited
+        else:
+            self._listings.pop(key, None)
+            return None
+        listing = (mtime, listing_time, root, subfolders, files, {})
+        self._listings[key] = listing
+        return listing
 
-        """ return a list of the files matching the patterns
-        The list will be relative path names wrt to the root src folder
+    def _walk_files(self, src, links, excludes, excluded_folders):
+        """ the files in src, relative to it, and the linked folders, in the order of walk(),
+        visiting the same folders it visits, with the folders listing cached
         """
         filenames = []
         linked_folders = []
-
-        if excludes:
-            if not isinstance(excludes, (tuple, list)):
-                excludes = (excludes, )
-            if ignore_case:
-                excludes = [e.lower() for e in excludes]
-        else:
-            excludes = []
-
-        for root, subfolders, files in walk(src, followlinks=True):
+        pending = [src]
+        while pending:
+            listing = self._list_folder(pending.pop())
+            if listing is None:
+                continue
+            _, _, root, subfolders, files, relative_names = listing
             if root in excluded_folders:
-                subfolders[:] = []
                 continue
 
             if links and os.path.islink(root):
                 linked_folders.append(os.path.relpath(root, src))
-                subfolders[:] = []
                 continue
             basename = os.path.basename(root)
             # Skip git or svn subfolders
             if basename in [".git", ".svn"]:
-                subfolders[:] = []
                 continue
             if basename == "test_package":  # DO NOT export test_package/build folder
+                subfolders = list(subfolders)
                 try:
                     subfolders.remove("build")
                 except ValueError:
                     pass
 
             relative_path = os.path.relpath(root, src)
-            for exclude in excludes:
-                if fnmatch.fnmatch(relative_path, exclude):
-                    subfolders[:] = []
-                    files = []
-                    break
-            for f in files:
-                relative_name = os.path.normpath(os.path.join(relative_path, f))
-                filenames.append(relative_name)
+            if excludes and _filter_names([relative_path], excludes):
+                continue
+            names = relative_names.get(relative_path)
+            if names is None:
+                names = [os.path.normpath(os.path.join(relative_path, f)) for f in files]
+                relative_names[relative_path] = names
+            filenames.extend(names)
+            pending.extend(os.path.join(root, d) for d in reversed(subfolders))
+        return filenames, linked_folders
+
+    def _filter_files(self, src, patterns, links, excludes, ignore_case, excluded_folders):
+
+        """ return a list of the files matching any of the patterns
+        The list will be relative path names wrt to the root src folder
+        """
+
+        if excludes:
+            if not isinstance(excludes, (tuple, list)):
+                excludes = (excludes, )
+            if ignore_case:
+                excludes = [e.lower() for e in excludes]
+        else:
+            excludes = []
+        excludes = _pattern_matcher(excludes) if excludes else None
+
+        filenames, linked_folders = self._walk_files(src, links, excludes, excluded_folders)
 
         if ignore_case:
             filenames = {f.lower(): f for f in filenames}
-            pattern = pattern.lower()
+            patterns = [p.lower() for p in patterns]
 
-        files_to_copy = fnmatch.filter(filenames, pattern)
-        for exclude in excludes:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f, exclude)]
+        files_to_copy = _filter_names(filenames, _pattern_matcher(patterns))
+        if excludes:
+            files_to_copy = _filter_names(files_to_copy, excludes, exclude=True)
 
         if ignore_case:
             files_to_copy = [filenames[f] for f in files_to_copy]
@@ -196,8 +341,29 @@ class FileCopier(object):
                         break  # not empty
                     base_path = os.path.dirname(base_path)
 
-    @staticmethod
-    def _copy_files(files, src, dst, keep_path, symlinks):
+    def _copy_file(self, src, dst):
+        """ copies the file with the configured strategy: hardlinks (if allowed and the file is
+        read-only), reflinks and then a plain copy, the first one possible
+        """
+        if self._strategy == "copy":
+            shutil.copy2(src, dst)
+            return
+        st = os.stat(src)
+        read_only = not st.st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+        if self._hardlinks and read_only and _hardlink(src, dst):
+            self.copied_bytes["hardlink"] += st.st_size
+            self.hardlinked_files.append(dst)
+            return
+        devices = st.st_dev, os.stat(os.path.dirname(dst)).st_dev
+        if devices not in self._no_reflink_devices:
+            if _reflink(src, dst):
+                self.copied_bytes["reflink"] += st.st_size
+                return
+            self._no_reflink_devices.add(devices)
+        shutil.copy2(src, dst)
+        self.copied_bytes["copy"] += st.st_size
+
+    def _copy_files(self, files, src, dst, keep_path, symlinks):
         """ executes a multiple file copy from [(src_file, dst_file), (..)]
         managing symlinks if necessary
         """
@@ -218,6 +384,7 @@ class FileCopier(object):
                     pass
                 os.symlink(linkto, abs_dst_name)  # @UndefinedVariable
             else:
-                shutil.copy2(abs_src_name, abs_dst_name)
+                self._copy_file(abs_src_name, abs_dst_name)
+                self.copied_from[abs_dst_name] = abs_src_name
             copied_files.append(abs_dst_name)
         return copied_files
@@ -20,7 +20,20 @@ BINARY_SKIP = "Skip"
 BINARY_EDITABLE = "Editable"
 
 
+class GraphVersion(object):
+    """ The changes of a graph, and of the build-requires subgraphs sharing it, that invalidate
+    what was computed from it
+    """
+
+    def __init__(self):
+        # Increased every time a connection in a closure is replaced or a private node becomes
+        # public, the connected closures are not known to be complete anymore
+        self.closures = 0
+        self.edges = 0  # Increased for every added edge, the levels are not valid anymore
+
+
 class Node(object):
+
     def __init__(self, ref, conanfile, recipe=None):
         self.ref = ref
         self._package_id = None
@@ -43,6 +56,10 @@ class Node(object):
         self.public_closure = None  # {ref.name: Node}
         self.inverse_closure = set()  # set of nodes that have this one in their public
         self.ancestors = None  # set{ref.name}
+        # To connect only once the public closure of other nodes, see connect_public_closure()
+        self._closure_version = 0  # Increased when an item of the public_closure is set
+        self._connected_closures = {}  # {node: (node._closure_version, version.closures)}
+        self._graph_version = GraphVersion()  # The one of the graph, when added to a graph
 
     @property
     def package_id(self):
@@ -87,6 +104,8 @@ class Node(object):
         return [edge.dst for edge in self.dependencies if edge.private]
 
     def make_public(self):
+        if self.private:
+            self._graph_version.closures += 1  # Part of the closures connected from now
         self.private = False
         for edge in self.dependencies:
             if not edge.private:
@@ -96,9 +115,36 @@ class Node(object):
         # When 2 nodes of the graph become connected, their closures information has
         # has to remain consistent. This method manages this.
         name = other_node.name
-        self.public_closure[name] = other_node
-        self.public_deps[name] = other_node
-        other_node.inverse_closure.add(self)
+        # Most of the connections already exist when closing diamonds, checking the closure
+        # avoids hashing the nodes to add them again to the inverse closure
+        existing = self.public_closure.get(name)
+        if existing is not other_node:
+            if existing is not None:
+                self._graph_version.closures += 1
+            self.public_closure[name] = other_node
+            self._closure_version += 1
+            other_node.inverse_closure.add(self)
+        existing = self.public_deps.get(name)
+        if existing is not other_node:
+            if existing is not None:
+                self._graph_version.closures += 1
+            self.public_deps[name] = other_node
+
+    def connect_public_closure(self, other_node):
+        """ connects this node to all the nodes of the "other_node" public_closure that are
+        not private or build-requires. Nothing is done if it was already done and nothing
+        changed since then: neither the other_node closure, nor any connection of any node was
+        replaced by a different node, nor any private node became public.
+        """
+        state = other_node._closure_version, self._graph_version.closures
+        if self._connected_closures.get(other_node) == state:
+            return
+        for n in list(other_node.public_closure.values()):
+            if n.build_require or n.private:
+                continue
+            self.connect_closure(n)
+        self._connected_closures[other_node] = (other_node._closure_version,
+                                                self._graph_version.closures)
 
     def inverse_neighbors(self):
         return [edge.src for edge in self.dependants]
@@ -180,14 +226,22 @@ class DepsGraph(object):
         self.aliased = {}
         # These are the nodes with pref (not including PREV) that have been evaluated
         self.evaluated = {}  # {pref: [nodes]}
+        # Shared with the build-requires subgraphs, that connect the closures and add edges to
+        # the same nodes
+        self.version = GraphVersion()
+        # Computed levels {direct: levels}, valid while the nodes and edges don't change
+        self._levels = {}
+        self._levels_key = None
 
     def add_node(self, node):
         if not self.nodes:
             self.root = node
         self.nodes.add(node)
+        node._graph_version = self.version
 
     def add_edge(self, src, dst, private=False, build_require=False):
         assert src in self.nodes and dst in self.nodes
+        self.version.edges += 1
         edge = Edge(src, dst, private, build_require)
         src.add_edge(edge)
         dst.add_edge(edge)
@@ -280,18 +334,40 @@ class DepsGraph(object):
         first level nodes, and so on
         return [[node1, node34], [node3], [node23, node8],...]
         """
-        result = []
-        opened = self.nodes
-        while opened:
-            current_level = []
-            for o in opened:
-                o_neighs = o.neighbors() if direct else o.inverse_neighbors()
-                if not any(n in opened for n in o_neighs):
-                    current_level.append(o)
+        # The nodes can also be added to the set directly, and edges added by the build-requires
+        # subgraphs, sharing the version
+        key = len(self.nodes), self.version.edges
+        if key != self._levels_key:
+            self._levels = {}
+            self._levels_key = key
+        levels = self._levels.get(direct)
+        if levels is None:
+            levels = self._compute_levels(direct)
+            self._levels[direct] = levels
+        return [list(level) for level in levels]
+
+    def _compute_levels(self, direct):
+        pending = {}  # {node: number of neighbors not in the previous levels}
+        waiting = {node: [] for node in self.nodes}  # {node: nodes with it as a neighbor}
+        for node in self.nodes:
+            neighbors = set(node.neighbors() if direct else node.inverse_neighbors())
+            neighbors = [n for n in neighbors if n in waiting]
+            pending[node] = len(neighbors)
+            for n in neighbors:
+                waiting[n].append(node)
 
+        result = []
+        current_level = [node for node, count in pending.items() if not count]
+        while current_level:
             current_level.sort()
             result.append(current_level)
             # now initialize new level
-            opened = opened.difference(current_level)
+            new_level = []
+            for node in current_level:
+                for n in waiting[node]:
+                    pending[n] -= 1
+                    if not pending[n]:
+                        new_level.append(n)
+            current_level = new_level
 
         return result
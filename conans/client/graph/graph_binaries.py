@@ -1,16 +1,20 @@
 import os
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 from conans.client.graph.graph import (BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_MISSING,
                                        BINARY_SKIP, BINARY_UPDATE,
                                        RECIPE_EDITABLE, BINARY_EDITABLE,
                                        RECIPE_CONSUMER, RECIPE_VIRTUAL)
-from conans.errors import NoRemoteAvailable, NotFoundException, \
-    conanfile_exception_formatter
+from conans.errors import NoRemoteAvailable, NoRestV2Available, NotFoundException, \
+    PackageNotFoundException, conanfile_exception_formatter
 from conans.model.info import ConanInfo
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
 from conans.util.files import is_dirty, rmdir
 
+MAX_CONCURRENT_LOOKUPS = 8
+
 
 class GraphBinariesAnalyzer(object):
 
@@ -18,6 +22,8 @@ class GraphBinariesAnalyzer(object):
         self._cache = cache
         self._out = output
         self._remote_manager = remote_manager
+        # {(remote name, pref): (ConanInfo, pref with PREV) or None}, retrieved in bulk
+        self._packages_info = {}
 
     def _check_update(self, upstream_manifest, package_folder, output, node):
         read_manifest = FileTreeManifest.load(package_folder)
@@ -79,14 +85,7 @@ class GraphBinariesAnalyzer(object):
                                 "to the installed recipe revision, removing folder".format(pref))
                     rmdir(package_folder)
 
-        remote = remotes.selected
-        if not remote:
-            # If the remote_name is not given, follow the binary remote, or
-            # the recipe remote
-            # If it is defined it won't iterate (might change in conan2.0)
-            metadata = self._cache.package_layout(pref.ref).load_metadata()
-            remote_name = metadata.packages[pref.id].remote or metadata.recipe.remote
-            remote = remotes.get(remote_name)
+        remote = self._get_remote(pref, remotes)
 
         if os.path.exists(package_folder):
             if update:
@@ -120,7 +119,7 @@ class GraphBinariesAnalyzer(object):
             remote_info = None
             if remote:
                 try:
-                    remote_info, pref = self._remote_manager.get_package_info(pref, remote)
+                    remote_info, pref = self._get_package_info(pref, remote)
                 except NotFoundException:
                     pass
                 except Exception:
@@ -133,7 +132,7 @@ class GraphBinariesAnalyzer(object):
             if not remote or (not remote_info and self._cache.config.revisions_enabled):
                 for r in remotes.values():
                     try:
-                        remote_info, pref = self._remote_manager.get_package_info(pref, r)
+                        remote_info, pref = self._get_package_info(pref, r)
                     except NotFoundException:
                         pass
                     else:
@@ -164,6 +163,89 @@ class GraphBinariesAnalyzer(object):
 
         node.binary_remote = remote
 
+    def _get_remote(self, pref, remotes):
+        remote = remotes.selected
+        if not remote:
+            # If the remote_name is not given, follow the binary remote, or
+            # the recipe remote
+            # If it is defined it won't iterate (might change in conan2.0)
+            metadata = self._cache.package_layout(pref.ref).load_metadata()
+            remote_name = metadata.packages[pref.id].remote or metadata.recipe.remote
+            remote = remotes.get(remote_name)
+        return remote
+
+    def _get_package_info(self, pref, remote):
+        try:
+            package_info = self._packages_info[(remote.name, pref)]
+        except KeyError:
+            return self._remote_manager.get_package_info(pref, remote)
+        if package_info is None:
+            raise PackageNotFoundException(pref)
+        return package_info
+
+    def _prefetch_packages_info(self, nodes, build_mode, remotes):
+        """ Gets the info of the binaries of the nodes that are not in the local cache before
+        evaluating them: with a single request per remote (instead of two requests, PREV and
+        conaninfo, per node), or with concurrent requests if the remote doesn't support it.
+        The failed requests are not stored, they are repeated when evaluating the node, so
+        the errors and the output are the same as without prefetching
+        """
+        if build_mode.all:
+            return
+        prefs_by_remote = OrderedDict()
+        for node in nodes:
+            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL, RECIPE_EDITABLE):
+                continue
+            pref = PackageReference(node.ref, node.package_id)
+            package_layout = self._cache.package_layout(pref.ref,
+                                                        short_paths=node.conanfile.short_paths)
+            if os.path.exists(package_layout.package(pref)):
+                continue
+            remote = self._get_remote(pref, remotes)
+            if remote and (remote.name, pref) not in self._packages_info:
+                prefs_by_remote.setdefault(remote, OrderedDict())[pref] = None
+
+        revisions_enabled = self._cache.config.revisions_enabled
+        for remote, prefs in prefs_by_remote.items():
+            if len(prefs) < 2:
+                continue
+            prefs = list(prefs)
+            if revisions_enabled and all(pref.ref.revision for pref in prefs):
+                try:
+                    packages_info = self._remote_manager.get_packages_info(prefs, remote)
+                except NoRestV2Available:
+                    pass
+                except Exception:
+                    continue
+                else:
+                    for pref, package_info in zip(prefs, packages_info):
+                        self._packages_info[(remote.name, pref)] = package_info
+                    continue
+            self._lookup_packages_info(prefs, remote)
+
+    def _lookup_packages_info(self, prefs, remote):
+        def lookup(pref):
+            try:
+                return self._remote_manager.get_package_info(pref, remote)
+            except NotFoundException:
+                return None
+            except Exception as exc:
+                return exc
+
+        # The first one in this thread, it might need to request the user credentials
+        first = lookup(prefs[0])
+        if isinstance(first, Exception):
+            return
+        thread_pool = ThreadPool(min(len(prefs) - 1, MAX_CONCURRENT_LOOKUPS))
+        try:
+            results = [first] + thread_pool.map(lookup, prefs[1:])
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+        for pref, package_info in zip(prefs, results):
+            if not isinstance(package_info, Exception):
+                self._packages_info[(remote.name, pref)] = package_info
+
     @staticmethod
     def _compute_package_id(node, default_package_id_mode):
         conanfile = node.conanfile
@@ -214,9 +296,14 @@ class GraphBinariesAnalyzer(object):
     def evaluate_graph(self, deps_graph, build_mode, update, remotes):
         default_package_id_mode = self._cache.config.default_package_id_mode
         evaluated = deps_graph.evaluated
-        for node in deps_graph.ordered_iterate():
-            self._compute_package_id(node, default_package_id_mode)
-            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
-                continue
-            self._evaluate_node(node, build_mode, update, evaluated, remotes)
-            self._handle_private(node)
+        self._packages_info = {}
+        for level in deps_graph.by_levels():
+            for node in level:
+                self._compute_package_id(node, default_package_id_mode)
+            # The package_id of the nodes of a level only depends on the previous levels
+            self._prefetch_packages_info(level, build_mode, remotes)
+            for node in level:
+                if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                    continue
+                self._evaluate_node(node, build_mode, update, evaluated, remotes)
+                self._handle_private(node)
@@ -53,6 +53,7 @@ class DepsGraphBuilder(object):
         scope = conanfile.display_name
         requires = [Requirement(ref) for ref in build_requires_refs]
         self._resolve_ranges(graph, requires, scope, update, remotes)
+        self._prefetch_recipes(node, requires, remotes)
 
         for require in requires:
             name = require.ref.name
@@ -69,12 +70,19 @@ class DepsGraphBuilder(object):
         subgraph = DepsGraph()
         subgraph.aliased = graph.aliased
         subgraph.evaluated = graph.evaluated
+        subgraph.version = graph.version
         subgraph.nodes = new_nodes
         for n in subgraph.nodes:
             n.build_require = True
 
         return subgraph
 
+    def _prefetch_recipes(self, node, requires, remotes):
+        refs = [require.ref for require in requires
+                if not require.override and require.ref.name not in node.public_deps]
+        if refs:
+            self._proxy.prefetch_recipes(refs, remotes)
+
     def _resolve_ranges(self, graph, requires, consumer, update, remotes):
         for require in requires:
             self._resolver.resolve(require, consumer, update, remotes)
@@ -116,6 +124,9 @@ class DepsGraphBuilder(object):
         # if there are version-ranges, resolve them before expanding each of the requirements
         self._resolve_deps(dep_graph, node, update, remotes)
 
+        # Download in the background the recipes that will be needed to expand this node
+        self._prefetch_recipes(node, node.conanfile.requires.values(), remotes)
+
         # Expand each one of the current requirements
         for name, require in node.conanfile.requires.items():
             if require.override:
@@ -191,12 +202,9 @@ class DepsGraphBuilder(object):
             dep_graph.add_edge(node, previous, require.private, require.build_require)
             # All the upstream dependencies (public_closure) of the previously existing node
             # now will be also connected to the node and to all its dependants
-            for name, n in previous.public_closure.items():
-                if n.build_require or n.private:
-                    continue
-                node.connect_closure(n)
-                for dep_node in node.inverse_closure:
-                    dep_node.connect_closure(n)
+            node.connect_public_closure(previous)
+            for dep_node in node.inverse_closure:
+                dep_node.connect_public_closure(previous)
 
             # Recursion is only necessary if the inputs conflict with the current "previous"
             # configuration of upstream versions and options
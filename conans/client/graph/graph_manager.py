@@ -141,12 +141,15 @@ class GraphManager(object):
             root_node = Node(ref, conanfile, recipe=RECIPE_CONSUMER)
 
         build_mode = BuildMode(build_mode, self._output)
-        deps_graph = self._load_graph(root_node, check_updates, update,
-                                      build_mode=build_mode, remotes=remotes,
-                                      profile_build_requires=profile.build_requires,
-                                      recorder=recorder,
-                                      processed_profile=processed_profile,
-                                      apply_build_requires=apply_build_requires)
+        try:
+            deps_graph = self._load_graph(root_node, check_updates, update,
+                                          build_mode=build_mode, remotes=remotes,
+                                          profile_build_requires=profile.build_requires,
+                                          recorder=recorder,
+                                          processed_profile=processed_profile,
+                                          apply_build_requires=apply_build_requires)
+        finally:
+            self._proxy.finish_prefetch()
 
         # THIS IS NECESSARY to store dependencies options in profile, for consumer
         # FIXME: This is a hack. Might dissapear if the graph for local commands is always recomputed
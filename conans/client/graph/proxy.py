@@ -20,6 +20,7 @@ class ConanProxy(object):
         self._cache = cache
         self._out = output
         self._remote_manager = remote_manager
+        self._prefetching = False
 
     def get_recipe(self, ref, check_updates, update, remotes, recorder):
         if self._cache.installed_as_editable(ref):
@@ -39,6 +40,24 @@ class ConanProxy(object):
 
         return conanfile_path, status, remote, new_ref
 
+    def prefetch_recipes(self, refs, remotes):
+        """ Starts downloading in the background the recipes that are not in the local cache,
+        from the remote get_recipe() will try first
+        """
+        remote = remotes.selected or next(iter(remotes.values()), None)
+        if not remote:
+            return
+        refs = [ref for ref in refs if not self._cache.installed_as_editable(ref) and
+                not os.path.exists(self._cache.package_layout(ref).conanfile())]
+        if refs:
+            self._prefetching = True
+            self._remote_manager.prefetch_recipes(refs, remote)
+
+    def finish_prefetch(self):
+        if self._prefetching:
+            self._prefetching = False
+            self._remote_manager.finish_prefetch()
+
     def _get_recipe(self, ref, check_updates, update, remotes, recorder):
         output = ScopedOutput(str(ref), self._out)
         # check if it is in disk
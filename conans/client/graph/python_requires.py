@@ -52,7 +52,9 @@ class ConanPythonRequire(object):
                                             remotes=self._remotes,
                                             recorder=ActionRecorder())
             path, _, _, new_ref = result
-            module, conanfile = parse_conanfile(conanfile_path=path, python_requires=self)
+            compiled_recipes = self._proxy._cache.compiled_recipes
+            module, conanfile = parse_conanfile(conanfile_path=path, python_requires=self,
+                                                compiled_recipes=compiled_recipes)
 
             # Check for alias
             if getattr(conanfile, "alias", None):
@@ -1,4 +1,5 @@
 import re
+from functools import cmp_to_key
 
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference
@@ -56,30 +57,88 @@ def satisfying(list_versions, versionexpr, result):
     if some version cannot be converted to loose SemVer, it is discarded with a msg
     This provides some workaround for failing comparisons like "2.1" not matching "<=2.1"
     """
-    from semver import SemVer, Range, max_satisfying
+    return VersionRangeCache().satisfying(list_versions, versionexpr, result)
 
-    version_range, loose, include_prerelease = _parse_versionexpr(versionexpr, result)
 
-    # Check version range expression
-    try:
-        act_range = Range(version_range, loose)
-    except ValueError:
-        raise ConanException("version range expression '%s' is not valid" % version_range)
+class VersionRangeCache(object):
+    """ Keeps the parsed version ranges, and the candidate versions parsed and sorted, so
+    resolving the same ranges against the same versions many times is cheap
+    """
 
-    # Validate all versions
-    candidates = {}
-    for v in list_versions:
-        try:
-            ver = SemVer(v, loose=loose)
-            candidates[ver] = v
-        except (ValueError, AttributeError):
-            result.append("WARN: Version '%s' is not semver, cannot be compared with a range"
-                          % str(v))
+    def __init__(self):
+        self._ranges = {}  # {versionexpr: (Range, loose, include_prerelease, messages)}
+        self._semvers = {}  # {(version, loose): SemVer, None if not valid}
+        self._candidates = {}  # {(versions, loose): ([(SemVer, version)] higher first, messages)}
+        self._resolved = {}  # {(versionexpr, versions): (version, messages)}
 
-    # Search best matching version in range
-    result = max_satisfying(candidates, act_range, loose=loose,
-                            include_prerelease=include_prerelease)
-    return candidates.get(result)
+    def satisfying(self, list_versions, versionexpr, result):
+        versions = tuple(list_versions)
+        try:
+            version, messages = self._resolved[(versionexpr, versions)]
+        except KeyError:
+            messages = []
+            act_range, loose, include_prerelease = self._parse_range(versionexpr, messages)
+            candidates = self._sorted_candidates(versions, loose, messages)
+            # The first one in the range is the maximum, as max_satisfying() it is the first
+            # of the input versions if several compare equal (the sort is stable)
+            version = next((v for semver, v in candidates
+                            if act_range.test(semver, include_prerelease=include_prerelease)),
+                           None)
+            self._resolved[(versionexpr, versions)] = version, messages
+        for message in messages:
+            result.append(message)
+        return version
+
+    def _parse_range(self, versionexpr, result):
+        try:
+            act_range, loose, include_prerelease, messages = self._ranges[versionexpr]
+        except KeyError:
+            from semver import Range
+
+            messages = []
+            version_range, loose, include_prerelease = _parse_versionexpr(versionexpr, messages)
+            # Check version range expression
+            try:
+                act_range = Range(version_range, loose)
+            except ValueError:
+                raise ConanException("version range expression '%s' is not valid"
+                                     % version_range)
+            self._ranges[versionexpr] = act_range, loose, include_prerelease, messages
+        for message in messages:
+            result.append(message)
+        return act_range, loose, include_prerelease
+
+    def _semver(self, version, loose):
+        try:
+            return self._semvers[(version, loose)]
+        except KeyError:
+            from semver import SemVer
+
+            try:
+                ver = SemVer(version, loose=loose)
+            except (ValueError, AttributeError):
+                ver = None
+            self._semvers[(version, loose)] = ver
+            return ver
+
+    def _sorted_candidates(self, versions, loose, result):
+        try:
+            candidates, messages = self._candidates[(versions, loose)]
+        except KeyError:
+            # Validate all versions
+            candidates, messages = [], []
+            for v in versions:
+                ver = self._semver(v, loose)
+                if ver is None:
+                    messages.append("WARN: Version '%s' is not semver, cannot be compared with a "
+                                    "range" % str(v))
+                else:
+                    candidates.append((ver, v))
+            candidates.sort(key=cmp_to_key(lambda a, b: a[0].compare(b[0])), reverse=True)
+            self._candidates[(versions, loose)] = candidates, messages
+        for message in messages:
+            result.append(message)
+        return candidates
 
 
 class RangeResolver(object):
@@ -89,6 +148,7 @@ class RangeResolver(object):
         self._remote_manager = remote_manager
         self._cached_remote_found = {}
         self._result = []
+        self._versions_cache = VersionRangeCache()
 
     @property
     def output(self):
@@ -119,11 +179,11 @@ class RangeResolver(object):
         search_ref = str(ConanFileReference(ref.name, "*", ref.user, ref.channel))
 
         if update:
-            resolved_ref = (self._resolve_remote(search_ref, version_range, remotes) or
+            resolved_ref = (self._resolve_remote(search_ref, version_range, remotes, update) or
                             self._resolve_local(search_ref, version_range))
         else:
             resolved_ref = (self._resolve_local(search_ref, version_range) or
-                            self._resolve_remote(search_ref, version_range, remotes))
+                            self._resolve_remote(search_ref, version_range, remotes, update))
 
         if resolved_ref:
             self._result.append("Version range '%s' required by '%s' resolved to '%s'"
@@ -134,38 +194,57 @@ class RangeResolver(object):
                                  "could not be resolved" % (version_range, require, base_conanref))
 
     def _resolve_local(self, search_ref, version_range):
-        local_found = search_recipes(self._cache, search_ref)
+        local_found = search_recipes(self._cache, search_ref, ignorecase=False)
         if local_found:
             return self._resolve_version(version_range, local_found)
 
-    def search_remotes(self, pattern, remotes):
+    def search_remotes(self, pattern, remotes, update=False):
+        """ The references found for the pattern in the selected remote, or in the first of
+        the remotes that has any. The results are reused for the configured remote_search_ttl,
+        unless updating
+        """
+        ttl = self._cache.config.remote_search_ttl
+        search_cache = self._cache.remote_search_cache
         remote = remotes.selected
-        if remote:
-            search_result = self._remote_manager.search_recipes(remote, pattern, ignorecase=False)
-            return search_result
+        remotes = [remote] if remote else list(remotes.values())
 
-        for remote in remotes.values():
-            search_result = self._remote_manager.search_recipes(remote, pattern, ignorecase=False)
+        # Only the remotes before the first one known to have results have to be searched
+        found = []
+        for remote in remotes:
+            search_result = search_cache.get(remote, pattern, ttl) if ttl and not update else None
+            found.append(search_result)
             if search_result:
-                return search_result
-
-    def _resolve_remote(self, search_ref, version_range, remotes):
+                break
+        to_search = [remote for remote, search_result in zip(remotes, found)
+                     if search_result is None]
+        searches = self._remote_manager.search_recipes_in_remotes(to_search, pattern,
+                                                                  ignorecase=False)
+        try:
+            for remote, search_result in zip(remotes, found):
+                if search_result is None:
+                    # We don't want here to resolve the revision that should be done in the
+                    # proxy as any other regular flow. Empty list, just in case it returns None
+                    search_result = [ref.copy_clear_rev() for ref in next(searches) or []]
+                    if ttl:
+                        search_cache.set(remote, pattern, search_result, ttl)
+                if search_result:
+                    return search_result
+        finally:
+            searches.close()
+
+    def _resolve_remote(self, search_ref, version_range, remotes, update):
         remote = remotes.selected
         remote_name = remote.name if remote else None
         remote_cache = self._cached_remote_found.setdefault(remote_name, {})
         # We should use ignorecase=False, we want the exact case!
         remote_found = remote_cache.get(search_ref)
         if remote_found is None:
-            remote_found = self.search_remotes(search_ref, remotes)
-            # We don't want here to resolve the revision that should be done in the proxy
-            # as any other regular flow
-            remote_found = [ref.copy_clear_rev() for ref in remote_found or []]
-            # Empty list, just in case it returns None
+            remote_found = self.search_remotes(search_ref, remotes, update) or []
             remote_cache[search_ref] = remote_found
         if remote_found:
             return self._resolve_version(version_range, remote_found)
 
     def _resolve_version(self, version_range, refs_found):
         versions = {ref.version: ref for ref in refs_found}
-        result = satisfying(versions, version_range, self._result)
+        result = self._versions_cache.satisfying(versions, version_range, self._result)
         return versions.get(result)
@@ -1,11 +1,11 @@
 import os
 import sys
+import threading
 import traceback
 import uuid
 from collections import defaultdict
 
 from conans.client.output import ScopedOutput
-from conans.client.tools.files import chdir
 from conans.errors import ConanException, NotFoundException
 from conans.util.files import save
 
@@ -40,15 +40,26 @@ class HookManager(object):
         self.hooks = defaultdict(list)
         self.output = output
         self._attribute_checker_path = os.path.join(self._hooks_folder, "attribute_checker.py")
+        self._lock = threading.Lock()  # Hooks can be executed from several threads
 
     def create_default_hooks(self):
         save(self._attribute_checker_path, attribute_checker_hook)
 
+    def _initialize(self):
+        with self._lock:
+            if not os.path.exists(self._attribute_checker_path):
+                self.create_default_hooks()
+            if not self.hooks:
+                self.load_hooks()
+
+    def has_hooks(self, method_name):
+        """ If any of the hooks defines the method
+        """
+        self._initialize()
+        return bool(self.hooks.get(method_name))
+
     def execute(self, method_name, **kwargs):
-        if not os.path.exists(self._attribute_checker_path):
-            self.create_default_hooks()
-        if not self.hooks:
-            self.load_hooks()
+        self._initialize()
 
         assert method_name in valid_hook_methods, \
             "Method '{}' not in valid hooks methods".format(method_name)
@@ -90,6 +101,7 @@ class HookManager(object):
         filename = os.path.splitext(os.path.basename(hook_path))[0]
         current_dir = os.path.dirname(hook_path)
 
+        from conans.client.tools.files import chdir
         try:
             sys.path.append(current_dir)
             old_modules = list(sys.modules.keys())
@@ -5,7 +5,8 @@ import stat
 import time
 
 from conans.client import tools
-from conans.client.file_copier import FileCopier, report_copied_files
+from conans.client.file_copier import (COPY_STRATEGIES, FileCopier, report_copied_bytes,
+                                       report_copied_files)
 from conans.client.output import ScopedOutput
 from conans.errors import ConanException
 from conans.model.conan_file import get_env_context_manager
@@ -81,8 +82,10 @@ def run_imports(conanfile, dest_folder):
         with tools.chdir(dest_folder):
             conanfile.imports()
     copied_files = file_importer.copied_files
-    _make_files_writable(copied_files)
+    # The hardlinked files are the read-only ones of the cache
+    _make_files_writable(copied_files.difference(file_importer.hardlinked_files))
     import_output = ScopedOutput("%s imports()" % conanfile.display_name, conanfile.output)
+    report_copied_bytes(file_importer.copied_bytes, import_output)
     _report_save_manifest(copied_files, import_output, dest_folder, IMPORTS_MANIFESTS)
     return copied_files
 
@@ -98,13 +101,15 @@ def remove_imports(conanfile, copied_files, output):
 
 def run_deploy(conanfile, install_folder):
     deploy_output = ScopedOutput("%s deploy()" % conanfile.display_name, conanfile.output)
-    file_importer = _FileImporter(conanfile, install_folder)
+    # The deployed files are made writable, they cannot be hardlinks of the cache ones
+    file_importer = _FileImporter(conanfile, install_folder, hardlinks=False)
     package_copied = set()
 
     # This is necessary to capture FileCopier full destination paths
     # Maybe could be improved in FileCopier
+    file_copy = FileCopier([conanfile.package_folder], install_folder)
+
     def file_copier(*args, **kwargs):
-        file_copy = FileCopier([conanfile.package_folder], install_folder)
         copied = file_copy(*args, **kwargs)
         _make_files_writable(copied)
         package_copied.update(copied)
@@ -118,6 +123,10 @@ def run_deploy(conanfile, install_folder):
 
     copied_files = file_importer.copied_files
     copied_files.update(package_copied)
+    copied_bytes = file_importer.copied_bytes
+    for strategy, size in file_copy.copied_bytes.items():
+        copied_bytes[strategy] += size
+    report_copied_bytes(copied_bytes, deploy_output)
     _report_save_manifest(copied_files, deploy_output, install_folder, "deploy_manifest.txt")
 
 
@@ -131,15 +140,33 @@ class _FileImporter(object):
     It can be also used for Golang projects, in which the packages are always
     source based and need to be copied to the user folder to be built
     """
-    def __init__(self, conanfile, dst_folder):
+    def __init__(self, conanfile, dst_folder, hardlinks=None):
         self._conanfile = conanfile
         self._dst_folder = dst_folder
         self.copied_files = set()
+        self._file_copiers = {}  # Reused, so they don't walk the same package folders again
+        # The files of the packages can be hardlinked only if they are read-only
+        if hardlinks is None:
+            hardlinks = get_env("CONAN_READ_ONLY_CACHE", False)
+        self._hardlinks = hardlinks
+
+    @property
+    def hardlinked_files(self):
+        return set(f for copier in self._file_copiers.values() for f in copier.hardlinked_files)
+
+    @property
+    def copied_bytes(self):
+        copied_bytes = {strategy: 0 for strategy in COPY_STRATEGIES}
+        for copier in self._file_copiers.values():
+            for strategy, size in copier.copied_bytes.items():
+                copied_bytes[strategy] += size
+        return copied_bytes
 
     def __call__(self, pattern, dst="", src="", root_package=None, folder=False,
                  ignore_case=False, excludes=None, keep_path=True):
         """
         param pattern: an fnmatch file pattern of the files that should be copied. Eg. *.dll
+                       or a list of them. Eg. ["*.dll", "*.so"]
         param dst: the destination local folder, wrt to current conanfile dir, to which
                    the files will be copied. Eg: "bin"
         param src: the source folder in which those files will be searched. This folder
@@ -155,7 +182,11 @@ class _FileImporter(object):
         matching_paths = self._get_folders(root_package)
         for name, matching_path in matching_paths.items():
             final_dst_path = os.path.join(real_dst_folder, name) if folder else real_dst_folder
-            file_copier = FileCopier([matching_path], final_dst_path)
+            file_copier = self._file_copiers.get((matching_path, final_dst_path))
+            if file_copier is None:
+                file_copier = FileCopier([matching_path], final_dst_path,
+                                         hardlinks=self._hardlinks)
+                self._file_copiers[(matching_path, final_dst_path)] = file_copier
             files = file_copier(pattern, src=src, links=True, ignore_case=ignore_case,
                                 excludes=excludes, keep_path=keep_path)
             self.copied_files.update(files)
@@ -1,6 +1,8 @@
 import os
 import shutil
 import time
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 from conans.client import tools
 from conans.client.file_copier import report_copied_files
@@ -154,7 +156,7 @@ class _PackageBuilder(object):
             install_folder = build_folder  # While installing, the infos goes to build folder
             create_package(conanfile, package_id, source_folder, build_folder,
                            package_folder, install_folder, self._hook_manager,
-                           conanfile_path, pref.ref)
+                           conanfile_path, pref.ref, file_hashes=self._cache.file_hashes)
 
         # Update package metadata
         package_hash = package_layout.package_summary_hash(pref)
@@ -298,17 +300,21 @@ class BinaryInstaller(object):
         self._recorder = recorder
         self._hook_manager = hook_manager
 
-    def install(self, deps_graph, remotes, keep_build=False, graph_info=None):
+    def install(self, deps_graph, remotes, keep_build=False, graph_info=None, parallel=None):
         # order by levels and separate the root node (ref=None) from the rest
         nodes_by_level = deps_graph.by_levels()
         root_level = nodes_by_level.pop()
         root_node = root_level[0]
+        if parallel is None:
+            parallel = self._cache.config.parallel_download
         # Get the nodes in order and if we have to build them
-        self._build(nodes_by_level, keep_build, root_node, graph_info, remotes)
+        self._build(nodes_by_level, keep_build, root_node, graph_info, remotes, parallel)
 
-    def _build(self, nodes_by_level, keep_build, root_node, graph_info, remotes):
+    def _build(self, nodes_by_level, keep_build, root_node, graph_info, remotes, parallel=None):
         processed_package_refs = set()
         for level in nodes_by_level:
+            if parallel and parallel > 1:
+                self._download_level(level, parallel, processed_package_refs)
             for node in level:
                 ref, conan_file = node.ref, node.conanfile
                 output = conan_file.output
@@ -331,6 +337,59 @@ class BinaryInstaller(object):
         # Finally, propagate information to root node (ref=None)
         self._propagate_info(root_node)
 
+    def _download_level(self, level, parallel, processed_package_refs):
+        """ The nodes of the same level are independent, so their binaries can be retrieved
+        concurrently. Only the download is done in the thread pool, the rest of the
+        installation (package_info(), builds...) will happen sequentially later, and will
+        skip these already processed package references
+        """
+        downloads = OrderedDict()
+        for node in level:
+            if node.binary in (BINARY_DOWNLOAD, BINARY_UPDATE) and \
+                    node.pref not in processed_package_refs:
+                downloads.setdefault(node.pref, node)
+        if len(downloads) < 2:
+            return
+
+        downloads = list(downloads.values())
+        for node in downloads:
+            assert node.prev, "PREV for %s is None" % str(node.pref)
+            assert node.pref.revision is not None, "Installer should receive #PREV always"
+            processed_package_refs.add(node.pref)
+
+        parallel = min(parallel, len(downloads))
+        self._out.info("Downloading %s binary packages in %s parallel threads"
+                       % (len(downloads), parallel))
+        thread_pool = ThreadPool(parallel)
+        try:
+            # map() re-raises the first error, after waiting for all the other downloads
+            thread_pool.map(self._download_node, downloads)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+
+    def _download_node(self, node):
+        pref = node.pref
+        conanfile = node.conanfile
+        layout = self._cache.package_layout(pref.ref, conanfile.short_paths)
+        package_folder = layout.package(pref)
+        with layout.package_lock(pref):
+            self._download_package(node, pref, package_folder, conanfile.output)
+
+    def _download_package(self, node, pref, package_folder, output):
+        if not self._node_concurrently_installed(node, package_folder):
+            set_dirty(package_folder)
+            self._remote_manager.get_package(pref, package_folder, node.binary_remote, output,
+                                             self._recorder)
+            output.info("Downloaded package revision %s" % pref.revision)
+            with self._cache.package_layout(pref.ref).update_metadata() as metadata:
+                metadata.packages[pref.id].remote = node.binary_remote.name
+            clean_dirty(package_folder)
+        else:
+            output.success('Download skipped. Probable concurrent download')
+            log_package_got_from_local_cache(pref)
+            self._recorder.package_fetched_from_cache(pref)
+
     def _node_concurrently_installed(self, node, package_folder):
         if node.binary == BINARY_DOWNLOAD and os.path.exists(package_folder):
             return True
@@ -392,20 +451,8 @@ class BinaryInstaller(object):
                     assert pref.revision is not None, "PREV for %s to be built is None" % str(pref)
                 elif node.binary in (BINARY_UPDATE, BINARY_DOWNLOAD):
                     assert node.prev, "PREV for %s is None" % str(pref)
-                    if not self._node_concurrently_installed(node, package_folder):
-                        set_dirty(package_folder)
-                        assert pref.revision is not None, "Installer should receive #PREV always"
-                        self._remote_manager.get_package(pref, package_folder,
-                                                         node.binary_remote, output,
-                                                         self._recorder)
-                        output.info("Downloaded package revision %s" % pref.revision)
-                        with self._cache.package_layout(pref.ref).update_metadata() as metadata:
-                            metadata.packages[pref.id].remote = node.binary_remote.name
-                        clean_dirty(package_folder)
-                    else:
-                        output.success('Download skipped. Probable concurrent download')
-                        log_package_got_from_local_cache(pref)
-                        self._recorder.package_fetched_from_cache(pref)
+                    assert pref.revision is not None, "Installer should receive #PREV always"
+                    self._download_package(node, pref, package_folder, output)
                 elif node.binary == BINARY_CACHE:
                     assert node.prev, "PREV for %s is None" % str(pref)
                     output.success('Already installed!')
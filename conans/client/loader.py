@@ -2,8 +2,10 @@ import imp
 import inspect
 import os
 import sys
+import types
 import uuid
 
+import six
 import yaml
 
 from conans.client.generators import registered_generators
@@ -32,10 +34,11 @@ class ProcessedProfile(object):
 
 
 class ConanFileLoader(object):
-    def __init__(self, runner, output, python_requires):
+    def __init__(self, runner, output, python_requires, compiled_recipes=None):
         self._runner = runner
         self._output = output
         self._python_requires = python_requires
+        self._compiled_recipes = compiled_recipes  # CompiledRecipesCache, persistent
         sys.modules["conans"].python_requires = python_requires
         self.cached_conanfiles = {}
 
@@ -50,7 +53,8 @@ class ConanFileLoader(object):
 
         try:
             self._python_requires.valid = True
-            _, conanfile = parse_conanfile(conanfile_path, self._python_requires)
+            _, conanfile = parse_conanfile(conanfile_path, self._python_requires,
+                                           self._compiled_recipes)
             self._python_requires.valid = False
             self.cached_conanfiles[conanfile_path] = conanfile
             conanfile.conan_data = self._load_data(conanfile_path)
@@ -64,7 +68,10 @@ class ConanFileLoader(object):
             return None
 
         try:
-            data = yaml.safe_load(load(data_path))
+            if self._compiled_recipes is not None:
+                data = self._compiled_recipes.data(data_path, load(data_path, binary=True))
+            else:
+                data = yaml.safe_load(load(data_path))
         except Exception as e:
             raise ConanException("Invalid yml format at {}: {}".format(DATA_YML, e))
 
@@ -248,9 +255,9 @@ def _parse_module(conanfile_module, module_id):
     return result
 
 
-def parse_conanfile(conanfile_path, python_requires):
+def parse_conanfile(conanfile_path, python_requires, compiled_recipes=None):
     with python_requires.capture_requires() as py_requires:
-        module, filename = _parse_conanfile(conanfile_path)
+        module, filename = _parse_conanfile(conanfile_path, compiled_recipes)
         try:
             conanfile = _parse_module(module, filename)
 
@@ -270,7 +277,25 @@ def parse_conanfile(conanfile_path, python_requires):
             raise ConanException("%s: %s" % (conanfile_path, str(e)))
 
 
-def _parse_conanfile(conan_file_path):
+def _load_source(module_id, conan_file_path, compiled_recipes):
+    """ As imp.load_source(), but the compiled code is obtained from the cache
+    """
+    if compiled_recipes is None:
+        return imp.load_source(module_id, conan_file_path)
+
+    code = compiled_recipes.code(conan_file_path, load(conan_file_path, binary=True))
+    module = types.ModuleType(module_id)
+    module.__file__ = conan_file_path
+    sys.modules[module_id] = module
+    try:
+        six.exec_(code, module.__dict__)
+    except BaseException:
+        del sys.modules[module_id]
+        raise
+    return module
+
+
+def _parse_conanfile(conan_file_path, compiled_recipes=None):
     """ From a given path, obtain the in memory python import module
     """
 
@@ -284,7 +309,7 @@ def _parse_conanfile(conan_file_path):
         old_modules = list(sys.modules.keys())
         with chdir(current_dir):
             sys.dont_write_bytecode = True
-            loaded = imp.load_source(module_id, conan_file_path)
+            loaded = _load_source(module_id, conan_file_path, compiled_recipes)
             sys.dont_write_bytecode = False
 
         # These lines are necessary, otherwise local conanfile imports with same name
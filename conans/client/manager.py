@@ -32,7 +32,7 @@ class ConanManager(object):
     def install(self, ref_or_path, install_folder, graph_info, remotes=None, build_modes=None,
                 update=False, manifest_folder=None, manifest_verify=False,
                 manifest_interactive=False, generators=None, no_imports=False, create_reference=None,
-                keep_build=False):
+                keep_build=False, parallel=None):
         """ Fetch and build all dependencies for the given reference
         @param ref_or_path: ConanFileReference or path to user space conanfile
         @param install_folder: where the output files will be saved
@@ -47,6 +47,7 @@ class ConanManager(object):
         @param generators: List of generators from command line. If False, no generator will be
         written
         @param no_imports: Install specified packages but avoid running imports
+        @param parallel: Number of threads to download the binaries of the same graph level
         """
 
         if generators is not False:
@@ -77,7 +78,8 @@ class ConanManager(object):
         installer = BinaryInstaller(self._cache, self._user_io.out, self._remote_manager,
                                     recorder=self._recorder,
                                     hook_manager=self._hook_manager)
-        installer.install(deps_graph, remotes, keep_build=keep_build, graph_info=graph_info)
+        installer.install(deps_graph, remotes, keep_build=keep_build, graph_info=graph_info,
+                          parallel=parallel)
 
         if manifest_folder:
             manifest_manager = ManifestManager(manifest_folder, user_io=self._user_io,
@@ -1,7 +1,7 @@
 import os
 import shutil
 
-from conans.client.file_copier import FileCopier, report_copied_files
+from conans.client.file_copier import FileCopier, report_copied_bytes, report_copied_files
 from conans.client.output import ScopedOutput
 from conans.client.tools.files import chdir
 from conans.errors import (ConanException, ConanExceptionInUserConanfileMethod,
@@ -13,7 +13,7 @@ from conans.util.log import logger
 
 
 def export_pkg(conanfile, package_id, src_package_folder, package_folder, hook_manager,
-               conanfile_path, ref):
+               conanfile_path, ref, file_hashes=None):
     mkdir(package_folder)
     conanfile.package_folder = src_package_folder
     output = conanfile.output
@@ -24,9 +24,10 @@ def export_pkg(conanfile, package_id, src_package_folder, package_folder, hook_m
 
     copier = FileCopier([src_package_folder], package_folder)
     copier("*", symlinks=True)
+    report_copied_bytes(copier.copied_bytes, output)
 
     save(os.path.join(package_folder, CONANINFO), conanfile.info.dumps())
-    digest = FileTreeManifest.create(package_folder)
+    digest = FileTreeManifest.create(package_folder, file_hashes=file_hashes)
     digest.save(package_folder)
 
     _report_files_from_manifest(output, package_folder)
@@ -39,7 +40,7 @@ def export_pkg(conanfile, package_id, src_package_folder, package_folder, hook_m
 
 def create_package(conanfile, package_id, source_folder, build_folder, package_folder,
                    install_folder, hook_manager, conanfile_path, ref, local=False,
-                   copy_info=False):
+                   copy_info=False, file_hashes=None):
     """ copies built artifacts, libs, headers, data, etc. from build_folder to
     package folder
     """
@@ -62,10 +63,12 @@ def create_package(conanfile, package_id, source_folder, build_folder, package_f
         output.highlight("Calling package()")
 
         folders = [source_folder, build_folder] if source_folder != build_folder else [build_folder]
-        conanfile.copy = FileCopier(folders, package_folder)
+        copier = FileCopier(folders, package_folder)
+        conanfile.copy = copier
         with conanfile_exception_formatter(str(conanfile), "package"):
             with chdir(build_folder):
                 conanfile.package()
+        report_copied_bytes(copier.copied_bytes, package_output)
     except Exception as e:
         if not local:
             os.chdir(build_folder)
@@ -79,7 +82,7 @@ def create_package(conanfile, package_id, source_folder, build_folder, package_f
             raise
         raise ConanException(e)
 
-    _create_aux_files(install_folder, package_folder, conanfile, copy_info)
+    _create_aux_files(install_folder, package_folder, conanfile, copy_info, file_hashes)
     _report_files_from_manifest(package_output, package_folder)
     package_id = package_id or os.path.basename(package_folder)
     output.success("Package '%s' created" % package_id)
@@ -87,7 +90,7 @@ def create_package(conanfile, package_id, source_folder, build_folder, package_f
                          reference=ref, package_id=package_id)
 
 
-def _create_aux_files(install_folder, package_folder, conanfile, copy_info):
+def _create_aux_files(install_folder, package_folder, conanfile, copy_info, file_hashes):
     """ auxiliary method that creates CONANINFO and manifest in
     the package_folder
     """
@@ -103,7 +106,7 @@ def _create_aux_files(install_folder, package_folder, conanfile, copy_info):
         save(os.path.join(package_folder, CONANINFO), conanfile.info.dumps())
 
     # Create the digest for the package
-    digest = FileTreeManifest.create(package_folder)
+    digest = FileTreeManifest.create(package_folder, file_hashes=file_hashes)
     digest.save(package_folder)
 
 
@@ -44,6 +44,14 @@ class UploadRecorder(object):
     def add_package(self, pref, remote_name, remote_url):
         self._info[str(pref.ref)]["packages"].append(_UploadElement(pref, remote_name, remote_url))
 
+    def update(self, other):
+        """ Appends the results recorded by another recorder, keeping their order
+        """
+        for ref, item in other._info.items():
+            packages = self._info.setdefault(ref, {"recipe": item["recipe"],
+                                                   "packages": []})["packages"]
+            packages.extend(item["packages"])
+
     def get_info(self):
         info = {"error": self.error, "uploaded": []}
 
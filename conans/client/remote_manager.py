@@ -1,19 +1,25 @@
 import os
+import tempfile
 import traceback
 
 import shutil
 import time
+from multiprocessing.pool import ThreadPool
+
 from requests.exceptions import ConnectionError
+from six import StringIO
 
 from conans import DEFAULT_REVISION_V1
 from conans.client.cache.remote_registry import Remote
+from conans.client.output import ConanOutput
 from conans.client.source import merge_directories
-from conans.errors import ConanConnectionError, ConanException, NotFoundException, \
-    NoRestV2Available, PackageNotFoundException
+from conans.errors import AuthenticationException, ConanConnectionError, ConanException, \
+    NotFoundException, NoRestV2Available, PackageNotFoundException
 from conans.paths import EXPORT_SOURCES_DIR_OLD, \
-    EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, rm_conandir
+    EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME, rm_conandir
 from conans.search.search import filter_packages
 from conans.util import progress_bar
+from conans.util.compression import zstd_available, zstd_tar_open
 from conans.util.env_reader import get_env
 from conans.util.files import make_read_only, mkdir, rmdir, tar_extract, touch_folder
 from conans.util.log import logger
@@ -22,6 +28,9 @@ from conans.util.tracer import (log_package_download,
                                 log_recipe_download, log_recipe_sources_download,
                                 log_uncompressed_file)
 
+MAX_CONCURRENT_PREFETCH = 8
+MAX_CONCURRENT_SEARCHES = 8
+
 
 class RemoteManager(object):
     """ Will handle the remotes to get recipes, packages etc """
@@ -31,10 +40,15 @@ class RemoteManager(object):
         self._output = output
         self._auth_manager = auth_manager
         self._hook_manager = hook_manager
+        self._prefetch_pool = None
+        self._prefetched = {}  # {(ref, remote name): AsyncResult}
 
     def check_credentials(self, remote):
         self._call_remote(remote, "check_credentials")
 
+    def server_capabilities(self, remote):
+        return self._call_remote(remote, "server_capabilities")
+
     def get_recipe_snapshot(self, ref, remote):
         assert ref.revision, "get_recipe_snapshot requires revision"
         return self._call_remote(remote, "get_recipe_snapshot", ref)
@@ -48,6 +62,7 @@ class RemoteManager(object):
         assert ref.revision, "upload_recipe requires RREV"
         self._call_remote(remote, "upload_recipe", ref, files_to_upload, deleted,
                           retry, retry_wait)
+        self._cache.remote_search_cache.invalidate(remote)
 
     def upload_package(self, pref, files_to_upload, deleted, remote, retry, retry_wait):
         assert pref.ref.revision, "upload_package requires RREV"
@@ -69,6 +84,14 @@ class RemoteManager(object):
         pref = self._resolve_latest_pref(pref, remote)
         return self._call_remote(remote, "get_package_info", pref), pref
 
+    def get_packages_info(self, prefs, remote):
+        """ Read the ConanInfo of many packages from a remote in a single request. Returns a list
+        with a (ConanInfo, pref with PREV) for every pref, or None for the packages not found.
+        Raises NoRestV2Available if the remote can't do it
+        """
+        assert all(pref.ref.revision for pref in prefs), "get_packages_info requires RREV"
+        return self._call_remote(remote, "get_packages_info", prefs)
+
     def get_recipe(self, ref, remote):
         """
         Read the conans from remotes
@@ -80,10 +103,13 @@ class RemoteManager(object):
         dest_folder = self._cache.package_layout(ref).export()
         rmdir(dest_folder)
 
-        ref = self._resolve_latest_ref(ref, remote)
-
         t1 = time.time()
-        zipped_files = self._call_remote(remote, "get_recipe", ref, dest_folder)
+        prefetched = self._take_prefetched_recipe(ref, remote, dest_folder)
+        if prefetched:
+            ref, zipped_files = prefetched
+        else:
+            ref = self._resolve_latest_ref(ref, remote)
+            zipped_files = self._call_remote(remote, "get_recipe", ref, dest_folder)
         duration = time.time() - t1
         log_recipe_download(ref, duration, remote.name, zipped_files)
 
@@ -96,12 +122,72 @@ class RemoteManager(object):
 
         with package_layout.update_metadata() as metadata:
             metadata.recipe.revision = ref.revision
+        self._cache.catalog.update(ref)
 
         self._hook_manager.execute("post_download_recipe", conanfile_path=conanfile_path,
                                    reference=ref, remote=remote)
 
         return ref
 
+    def prefetch_recipes(self, refs, remote):
+        """ Starts downloading the recipes to temporary folders in background threads.
+        The get_recipe() of these references from the same remote will use them instead of
+        downloading them again. The prefetched recipes not used are discarded by
+        finish_prefetch()
+        """
+        for ref in refs:
+            key = (ref, remote.name)
+            if key in self._prefetched:
+                continue
+            if self._prefetch_pool is None:
+                self._prefetch_pool = ThreadPool(MAX_CONCURRENT_PREFETCH)
+            self._prefetched[key] = self._prefetch_pool.apply_async(self._prefetch_recipe,
+                                                                    (ref, remote))
+
+    def _prefetch_recipe(self, ref, remote):
+        tmp_folder = tempfile.mkdtemp(suffix=".conan_prefetch")
+        stream = StringIO()
+        try:
+            with self._auth_manager.background(ConanOutput(stream)):
+                ref = self._resolve_latest_ref(ref, remote)
+                zipped_files = self._call_remote(remote, "get_recipe", ref, tmp_folder)
+        except BaseException:
+            rmdir(tmp_folder)
+            raise
+        return ref, zipped_files, tmp_folder, stream.getvalue()
+
+    def _take_prefetched_recipe(self, ref, remote, dest_folder):
+        async_result = self._prefetched.pop((ref, remote.name), None)
+        if async_result is None:
+            return None
+        try:
+            ref, zipped_files, tmp_folder, output = async_result.get()
+        except Exception:
+            return None  # Downloaded again, failures are handled and reported as usual
+        self._output.write(output)
+        mkdir(dest_folder)
+        ret = {}
+        for filename, path in zipped_files.items():
+            ret[filename] = os.path.join(dest_folder, filename)
+            shutil.move(path, ret[filename])
+        rmdir(tmp_folder)
+        return ref, ret
+
+    def finish_prefetch(self):
+        """ Waits for the recipe downloads started by prefetch_recipes() and removes the ones
+        that were not used
+        """
+        thread_pool, self._prefetch_pool = self._prefetch_pool, None
+        if thread_pool is not None:
+            thread_pool.close()
+            thread_pool.join()
+        for async_result in self._prefetched.values():
+            try:
+                rmdir(async_result.get()[2])
+            except Exception:
+                pass
+        self._prefetched = {}
+
     def get_recipe_sources(self, ref, export_folder, export_sources_folder, remote):
         assert ref.revision, "get_recipe_sources requires RREV"
         t1 = time.time()
@@ -144,7 +230,8 @@ class RemoteManager(object):
 
             duration = time.time() - t1
             log_package_download(pref, duration, remote, zipped_files)
-            unzip_and_get_files(zipped_files, dest_folder, PACKAGE_TGZ_NAME, output=self._output)
+            tgz_name = PACKAGE_TZST_NAME if PACKAGE_TZST_NAME in zipped_files else PACKAGE_TGZ_NAME
+            unzip_and_get_files(zipped_files, dest_folder, tgz_name, output=self._output)
             # Issue #214 https://github.com/conan-io/conan/issues/214
             touch_folder(dest_folder)
             if get_env("CONAN_READ_ONLY_CACHE", False):
@@ -175,6 +262,38 @@ class RemoteManager(object):
         returns (dict str(ref): {packages_info}"""
         return self._call_remote(remote, "search", pattern, ignorecase)
 
+    def search_recipes_in_remotes(self, remotes, pattern=None, ignorecase=True):
+        """ Searches concurrently in all the remotes. Generator of the results of every remote,
+        in the same order, raising the exception of the failed searches. The searches that
+        need the user credentials are done again in this thread, that can ask for them
+        """
+        if len(remotes) < 2:
+            for remote in remotes:
+                yield self.search_recipes(remote, pattern, ignorecase)
+            return
+
+        thread_pool = ThreadPool(min(len(remotes), MAX_CONCURRENT_SEARCHES))
+        try:
+            searches = [thread_pool.apply_async(self._search_recipes_background,
+                                                (remote, pattern, ignorecase))
+                        for remote in remotes]
+            for remote, search in zip(remotes, searches):
+                try:
+                    result, output = search.get()
+                except AuthenticationException:
+                    yield self.search_recipes(remote, pattern, ignorecase)
+                else:
+                    self._output.write(output)
+                    yield result
+        finally:
+            thread_pool.close()  # The remaining searches are not waited for
+
+    def _search_recipes_background(self, remote, pattern, ignorecase):
+        stream = StringIO()
+        with self._auth_manager.background(ConanOutput(stream)):
+            result = self.search_recipes(remote, pattern, ignorecase)
+        return result, stream.getvalue()
+
     def search_packages(self, remote, ref, query):
         packages = self._call_remote(remote, "search_packages", ref, query)
         packages = filter_packages(query, packages)
@@ -184,6 +303,7 @@ class RemoteManager(object):
         """
         Removed conans or packages from remote
         """
+        self._cache.remote_search_cache.invalidate(remote)
         return self._call_remote(remote, "remove", ref)
 
     def remove_packages(self, ref, remove_ids, remote):
@@ -262,6 +382,11 @@ def check_compressed_files(tgz_name, files):
     for f in files:
         if f == tgz_name:
             continue
+        if f == PACKAGE_TZST_NAME and tgz_name == PACKAGE_TGZ_NAME:
+            if not zstd_available():
+                raise ConanException("The '%s' file is compressed with zstd. Please install the "
+                                     "'zstandard' python package to handle it." % f)
+            continue
         if bare_name == os.path.splitext(f)[0]:
             raise ConanException("This Conan version is not prepared to handle '%s' file format. "
                                  "Please upgrade conan client." % f)
@@ -283,7 +408,10 @@ def uncompress_file(src_path, dest_folder, output):
     try:
         with progress_bar.open_binary(src_path, desc="Decompressing %s" % os.path.basename(src_path),
                                       output=output) as file_handler:
-            tar_extract(file_handler, dest_folder)
+            if os.path.basename(src_path) == PACKAGE_TZST_NAME:
+                tar_extract(file_handler, dest_folder, tar_open=zstd_tar_open)
+            else:
+                tar_extract(file_handler, dest_folder)
     except Exception as e:
         error_msg = "Error while downloading/extracting files to %s\n%s\n" % (dest_folder, str(e))
         # try to remove the files
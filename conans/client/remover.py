@@ -230,6 +230,9 @@ class ConanRemover(object):
 
         if not remote_name:
             self._cache.delete_empty_dirs(deleted_refs)
+            if deleted_refs:  # Forget the files and folders of the removed refs
+                self._cache.compiled_recipes.prune()
+                self._cache.file_hashes.prune()
 
     def _ask_permission(self, ref, src, build_ids, package_ids_filter, force):
         def stringlist(alist):
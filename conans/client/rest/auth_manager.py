@@ -13,6 +13,8 @@ Flow:
 """
 
 import hashlib
+import threading
+from contextlib import contextmanager
 from uuid import getnode as get_mac
 
 from conans.client.cmd.user import update_localdb
@@ -36,6 +38,8 @@ def input_credentials_if_unauthorized(func):
         except AuthenticationException:
             # User valid but not enough permissions
             if self.user is None or self._rest_client.token is None:
+                if not self._state.interactive:
+                    raise
                 # token is None when you change user with user command
                 # Anonymous is not enough, ask for a user
                 remote = self.remote
@@ -60,7 +64,7 @@ def input_credentials_if_unauthorized(func):
         we can get a valid token from api_client. If a token is returned,
         credentials are stored in localdb and rest method is called"""
         for _ in range(LOGIN_RETRIES):
-            user, password = self._user_io.request_login(self._remote.name, self.user)
+            user, password = self._user_io.request_login(self.remote.name, self.user)
             try:
                 token, _, _, _ = self.authenticate(user, password)
             except AuthenticationException:
@@ -83,28 +87,56 @@ def input_credentials_if_unauthorized(func):
     return wrapper
 
 
+class _AuthState(threading.local):
+    def __init__(self):
+        self.remote = None
+        self.user = None
+        self.interactive = True
+
+
 class ConanApiAuthManager(object):
 
     def __init__(self, rest_client, user_io, localdb):
         self._user_io = user_io
         self._rest_client = rest_client
         self._localdb = localdb
-        self._remote = None
+        self._state = _AuthState()  # Per thread, to allow concurrent calls to different remotes
 
     @property
     def remote(self):
-        return self._remote
+        return self._state.remote
 
     @remote.setter
     def remote(self, remote):
-        self._remote = remote
+        self._state.remote = remote
         self._rest_client.remote_url = remote.url
         self._rest_client.verify_ssl = remote.verify_ssl
         self.user, self._rest_client.token = self._localdb.get_login(remote.url)
 
+    @contextmanager
+    def background(self, output):
+        """ The calls done by the current thread won't ask the user for credentials, and the
+        output of their transfers will be written to "output"
+        """
+        self._state.interactive = False
+        self._rest_client.output = output
+        try:
+            yield
+        finally:
+            self._state.interactive = True
+            self._rest_client.output = None
+
+    @property
+    def user(self):
+        return self._state.user
+
+    @user.setter
+    def user(self, user):
+        self._state.user = user
+
     def _store_login(self, login):
         try:
-            self._localdb.set_login(login, self._remote.url)
+            self._localdb.set_login(login, self.remote.url)
         except Exception as e:
             self._user_io.out.error(
                 'Your credentials could not be stored in local cache\n')
@@ -212,11 +244,18 @@ class ConanApiAuthManager(object):
     def get_latest_package_revision(self, pref):
         return self._rest_client.get_latest_package_revision(pref)
 
+    @input_credentials_if_unauthorized
+    def get_packages_info(self, prefs):
+        return self._rest_client.get_packages_info(prefs)
+
+    def server_capabilities(self):
+        return self._rest_client.server_capabilities()
+
     def authenticate(self, user, password):
         if user is None:  # The user is already in DB, just need the passwd
-            prev_user = self._localdb.get_username(self._remote.url)
+            prev_user = self._localdb.get_username(self.remote.url)
             if prev_user is None:
-                raise ConanException("User for remote '%s' is not defined" % self._remote.name)
+                raise ConanException("User for remote '%s' is not defined" % self.remote.name)
             else:
                 user = prev_user
 
@@ -226,5 +265,5 @@ class ConanApiAuthManager(object):
             raise ConanException("Password contains not allowed symbols")
 
         # Store result in DB
-        remote_name, prev_user, user = update_localdb(self._localdb, user, token, self._remote)
+        remote_name, prev_user, user = update_localdb(self._localdb, user, token, self.remote)
         return token, remote_name, prev_user, user
@@ -182,6 +182,10 @@ class ClientV2Router(ClientCommonRouter):
         """get revisions for a package url"""
         return self.base_url + _format_pref(routes.package_revisions, pref)
 
+    def packages_info(self):
+        """Get the latest revision and conaninfo of many packages"""
+        return self.base_url + routes.packages_info
+
     def package_latest(self, pref):
         """Get the latest of a package"""
         assert pref.ref.revision is not None, "Cannot get the latest package without RREV"
@@ -1,18 +1,117 @@
 import fnmatch
 import os
 import platform
-import requests
+import re
+import threading
 import time
 
+import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
 from conans import __version__ as client_version
+from conans.client.rest.uploader_downloader import MAX_CONCURRENT_TRANSFERS
 from conans.util.files import save
+from conans.util.log import logger
 from conans.util.tracer import log_client_rest_api_call
 
 
+class ConnectionPoolStats(object):
+    """ Counts the requests that reused an alive connection (hits) and the ones that had to
+    open a new one (misses), with its TCP and TLS handshakes
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.misses = 0
+
+    @property
+    def hits(self):
+        return max(self.requests - self.misses, 0)
+
+    def request(self):
+        with self._lock:
+            self.requests += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def __str__(self):
+        return "%d hits, %d misses" % (self.hits, self.misses)
+
+
+class _CountingPoolMixin(object):
+    stats = None
+
+    def urlopen(self, *args, **kwargs):
+        self.stats.request()
+        return super(_CountingPoolMixin, self).urlopen(*args, **kwargs)
+
+    def _new_conn(self):
+        self.stats.miss()
+        logger.debug("REST: new connection to %s (connection pool: %s)" % (self.host, self.stats))
+        return super(_CountingPoolMixin, self)._new_conn()
+
+
+class ConanHTTPAdapter(HTTPAdapter):
+    """ HTTPAdapter whose connection pools (one per remote host) count the reused connections
+    """
+
+    def __init__(self, stats, **kwargs):
+        self._stats = stats
+        self._counting_classes = {}  # {pool class: counting subclass}
+        super(ConanHTTPAdapter, self).__init__(**kwargs)
+
+    def _counting_pool_classes(self, manager):
+        """ The counting subclasses of the pool classes of the manager, so the specific ones,
+        like the SOCKS pools of the SOCKSProxyManager, keep working
+        """
+        pool_classes = {}
+        for scheme, pool_class in manager.pool_classes_by_scheme.items():
+            counting_class = self._counting_classes.get(pool_class)
+            if counting_class is None:
+                counting_class = type("Counting%s" % pool_class.__name__,
+                                      (_CountingPoolMixin, pool_class), {"stats": self._stats})
+                self._counting_classes[pool_class] = counting_class
+            pool_classes[scheme] = counting_class
+        manager.pool_classes_by_scheme = pool_classes
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(ConanHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self._counting_pool_classes(self.poolmanager)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        manager = super(ConanHTTPAdapter, self).proxy_manager_for(*args, **kwargs)
+        if not issubclass(manager.pool_classes_by_scheme["http"], _CountingPoolMixin):
+            self._counting_pool_classes(manager)
+        return manager
+
+
+def _user_agent():
+    return "Conan/%s (Python %s) %s" % (client_version, platform.python_version(),
+                                        requests.utils.default_user_agent())
+
+
 class ConanRequester(object):
+    # The environment proxies are removed while requesting, only once for all the threads
+    _environ_lock = threading.Lock()
+    _environ_users = 0
+    _environ_backup = None
 
     def __init__(self, config, http_requester=None):
-        self._http_requester = http_requester if http_requester else requests.Session()
+        self.connection_stats = ConnectionPoolStats()
+        if http_requester:
+            self._http_requester = http_requester
+        else:
+            self._http_requester = requests.Session()
+            adapter = ConanHTTPAdapter(self.connection_stats,
+                                       pool_connections=(config.http_pool_connections or
+                                                         DEFAULT_POOLSIZE),
+                                       pool_maxsize=self._pool_maxsize(config))
+            self._http_requester.mount("http://", adapter)
+            self._http_requester.mount("https://", adapter)
+        self._user_agent = _user_agent()
         self._timeout_seconds = config.request_timeout
         self.proxies = config.proxies or {}
         self._cacert_path = config.cacert_path
@@ -23,6 +122,9 @@ class ConanRequester(object):
 
         self._no_proxy_match = [el.strip() for el in
                                 self.proxies.pop("no_proxy_match", "").split(",") if el]
+        # Translated once, instead of in every fnmatch() call
+        self._no_proxy_regexes = [re.compile(fnmatch.translate(os.path.normcase(entry)))
+                                  for entry in self._no_proxy_match]
 
         # Retrocompatibility with deprecated no_proxy
         # Account for the requests NO_PROXY env variable, not defined as a proxy like http=
@@ -45,6 +147,16 @@ class ConanRequester(object):
             else:
                 self._client_certificates = self._client_cert_path
 
+    @staticmethod
+    def _pool_maxsize(config):
+        """ Connections kept alive per remote host. By default enough for all the concurrent
+        transfers of the parallel uploads and downloads
+        """
+        if config.http_pool_maxsize:
+            return config.http_pool_maxsize
+        threads = max(config.parallel_download or 1, config.parallel_upload or 1)
+        return max(DEFAULT_POOLSIZE, threads * MAX_CONCURRENT_TRANSFERS)
+
     @property
     def retry(self):
         return self._retry
@@ -54,12 +166,10 @@ class ConanRequester(object):
         return self._retry_wait
 
     def _should_skip_proxy(self, url):
-
-        for entry in self._no_proxy_match:
-            if fnmatch.fnmatch(url, entry):
-                return True
-
-        return False
+        if not self._no_proxy_regexes:
+            return False
+        url = os.path.normcase(url)
+        return any(regex.match(url) for regex in self._no_proxy_regexes)
 
     def _add_kwargs(self, url, kwargs):
         if kwargs.get("verify", None) is True:
@@ -75,9 +185,7 @@ class ConanRequester(object):
         if not kwargs.get("headers"):
             kwargs["headers"] = {}
 
-        user_agent = "Conan/%s (Python %s) %s" % (client_version, platform.python_version(),
-                                                  requests.utils.default_user_agent())
-        kwargs["headers"]["User-Agent"] = user_agent
+        kwargs["headers"]["User-Agent"] = self._user_agent
         return kwargs
 
     def get(self, url, **kwargs):
@@ -93,13 +201,9 @@ class ConanRequester(object):
         return self._call_method("post", url, **kwargs)
 
     def _call_method(self, method, url, **kwargs):
-        popped = False
-        if self.proxies or self._no_proxy_match:
-            old_env = dict(os.environ)
-            # Clean the proxies from the environ and use the conan specified proxies
-            for var_name in ("http_proxy", "https_proxy", "no_proxy"):
-                popped = True if os.environ.pop(var_name, None) else popped
-                popped = True if os.environ.pop(var_name.upper(), None) else popped
+        clean_environ = bool(self.proxies or self._no_proxy_match)
+        if clean_environ:
+            self._pop_environ_proxies()
         try:
             t1 = time.time()
             all_kwargs = self._add_kwargs(url, kwargs)
@@ -108,6 +212,28 @@ class ConanRequester(object):
             log_client_rest_api_call(url, method.upper(), duration, all_kwargs.get("headers"))
             return tmp
         finally:
-            if popped:
+            if clean_environ:
+                self._restore_environ_proxies()
+
+    @classmethod
+    def _pop_environ_proxies(cls):
+        # Clean the proxies from the environ and use the conan specified proxies. Concurrent
+        # requests share it, the first one cleans it and the last one restores it
+        with cls._environ_lock:
+            if cls._environ_users == 0:
+                old_env = dict(os.environ)
+                popped = False
+                for var_name in ("http_proxy", "https_proxy", "no_proxy"):
+                    popped = True if os.environ.pop(var_name, None) else popped
+                    popped = True if os.environ.pop(var_name.upper(), None) else popped
+                cls._environ_backup = old_env if popped else None
+            cls._environ_users += 1
+
+    @classmethod
+    def _restore_environ_proxies(cls):
+        with cls._environ_lock:
+            cls._environ_users -= 1
+            if cls._environ_users == 0 and cls._environ_backup is not None:
                 os.environ.clear()
-                os.environ.update(old_env)
+                os.environ.update(cls._environ_backup)
+                cls._environ_backup = None
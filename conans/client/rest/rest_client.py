@@ -1,9 +1,23 @@
+import threading
 from collections import defaultdict
 
-from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2
+from conans import BULK_PACKAGES_INFO, CHECKSUM_DEPLOY, REVISIONS, ONLY_V2
 from conans.client.rest.rest_client_v1 import RestV1Methods
 from conans.client.rest.rest_client_v2 import RestV2Methods
-from conans.errors import OnlyV2Available
+from conans.errors import NoRestV2Available, OnlyV2Available
+
+
+class _RemoteState(threading.local):
+    """ The remote being accessed, and its credentials, are per thread, so different threads
+    can be talking to different remotes at the same time
+    """
+    def __init__(self):
+        self.token = None
+        self.remote_url = None
+        self.custom_headers = {}  # Can set custom headers to each request
+        # Remote manager will set it to True or False dynamically depending on the remote
+        self.verify_ssl = True
+        self.output = None  # To redirect the output of the transfers of this thread
 
 
 class RestApiClient(object):
@@ -14,22 +28,53 @@ class RestApiClient(object):
     def __init__(self, output, requester, revisions_enabled, put_headers=None):
 
         # Set to instance
-        self.token = None
-        self.remote_url = None
-        self.custom_headers = {}  # Can set custom headers to each request
+        self._state = _RemoteState()
         self._output = output
         self.requester = requester
-
-        # Remote manager will set it to True or False dynamically depending on the remote
-        self.verify_ssl = True
         self._put_headers = put_headers
         self._revisions_enabled = revisions_enabled
 
         self._cached_capabilities = defaultdict(list)
 
+    @property
+    def token(self):
+        return self._state.token
+
+    @token.setter
+    def token(self, token):
+        self._state.token = token
+
+    @property
+    def remote_url(self):
+        return self._state.remote_url
+
+    @remote_url.setter
+    def remote_url(self, remote_url):
+        self._state.remote_url = remote_url
+
+    @property
+    def verify_ssl(self):
+        return self._state.verify_ssl
+
+    @verify_ssl.setter
+    def verify_ssl(self, verify_ssl):
+        self._state.verify_ssl = verify_ssl
+
+    @property
+    def custom_headers(self):
+        return self._state.custom_headers
+
+    @property
+    def output(self):
+        return self._state.output or self._output
+
+    @output.setter
+    def output(self, output):
+        self._state.output = output
+
     def _get_api(self):
         if self.remote_url not in self._cached_capabilities:
-            tmp = RestV1Methods(self.remote_url, self.token, self.custom_headers, self._output,
+            tmp = RestV1Methods(self.remote_url, self.token, self.custom_headers, self.output,
                                 self.requester, self.verify_ssl, self._put_headers)
             _, _, cap = tmp.server_info()
             self._cached_capabilities[self.remote_url] = cap
@@ -38,11 +83,11 @@ class RestApiClient(object):
 
         if self._revisions_enabled and REVISIONS in self._cached_capabilities[self.remote_url]:
             checksum_deploy = CHECKSUM_DEPLOY in self._cached_capabilities[self.remote_url]
-            return RestV2Methods(self.remote_url, self.token, self.custom_headers, self._output,
+            return RestV2Methods(self.remote_url, self.token, self.custom_headers, self.output,
                                  self.requester, self.verify_ssl, self._put_headers,
                                  checksum_deploy)
         else:
-            return RestV1Methods(self.remote_url, self.token, self.custom_headers, self._output,
+            return RestV1Methods(self.remote_url, self.token, self.custom_headers, self.output,
                                  self.requester, self.verify_ssl, self._put_headers)
 
     def get_recipe_manifest(self, ref):
@@ -103,6 +148,10 @@ class RestApiClient(object):
     def server_info(self):
         return self._get_api().server_info()
 
+    def server_capabilities(self):
+        self._get_api()  # Retrieves and caches the capabilities the first time
+        return self._cached_capabilities[self.remote_url]
+
     def get_recipe_revisions(self, ref):
         return self._get_api().get_recipe_revisions(ref)
 
@@ -114,3 +163,9 @@ class RestApiClient(object):
 
     def get_latest_package_revision(self, pref):
         return self._get_api().get_latest_package_revision(pref)
+
+    def get_packages_info(self, prefs):
+        api = self._get_api()
+        if BULK_PACKAGES_INFO not in self._cached_capabilities[self.remote_url]:
+            raise NoRestV2Available("The remote doesn't support getting many packages info")
+        return api.get_packages_info(prefs)
@@ -303,3 +303,6 @@ class RestV1Methods(RestCommonMethods):
 
     def get_latest_package_revision(self, pref):
         raise NoRestV2Available("The remote doesn't support revisions")
+
+    def get_packages_info(self, prefs):
+        raise NoRestV2Available("The remote doesn't support revisions")
@@ -6,16 +6,19 @@ import time
 from conans.client.remote_manager import check_compressed_files
 from conans.client.rest.client_routes import ClientV2Router
 from conans.client.rest.rest_client_common import RestCommonMethods, get_exception_from_error
-from conans.client.rest.uploader_downloader import FileDownloader, FileUploader
+from conans.client.rest.uploader_downloader import FileDownloader, FileUploader, \
+    TransferProgress, run_concurrent_transfers
 from conans.errors import ConanException, NotFoundException, PackageNotFoundException, \
     RecipeNotFoundException, AuthenticationException, ForbiddenException
 from conans.model.info import ConanInfo
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
 from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, \
-    PACKAGE_TGZ_NAME
+    PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME
+from conans.util.compression import tar_stream_open, zstd_tar_open
 from conans.util.files import decode_text
 from conans.util.log import logger
+from conans.util.tracer import log_uncompressed_file
 
 
 class RestV2Methods(RestCommonMethods):
@@ -112,11 +115,13 @@ class RestV2Methods(RestCommonMethods):
         url = self.router.package_snapshot(pref)
         data = self._get_file_list_json(url)
         files = data["files"]
-        check_compressed_files(PACKAGE_TGZ_NAME, files)
+        tgz_name = PACKAGE_TZST_NAME if PACKAGE_TZST_NAME in files else PACKAGE_TGZ_NAME
+        check_compressed_files(tgz_name, files)
         # If we didn't indicated reference, server got the latest, use absolute now, it's safer
         urls = {fn: self.router.package_file(pref, fn) for fn in files}
-        self._download_and_save_files(urls, dest_folder, files)
-        ret = {fn: os.path.join(dest_folder, fn) for fn in files}
+        # The package tgz is extracted while downloading, it is never saved to disk
+        self._download_and_save_files(urls, dest_folder, files, extract=tgz_name)
+        ret = {fn: os.path.join(dest_folder, fn) for fn in files if fn != tgz_name}
         return ret
 
     def get_recipe_path(self, ref, path):
@@ -177,20 +182,33 @@ class RestV2Methods(RestCommonMethods):
         uploader = FileUploader(self.requester, self._output, self.verify_ssl)
         # conan_package.tgz and conan_export.tgz are uploaded first to avoid uploading conaninfo.txt
         # or conanamanifest.txt with missing files due to a network failure
-        for filename in sorted(files):
-            self._output.rewrite_line("Uploading %s" % filename)
-            resource_url = urls[filename]
-            try:
-                uploader.upload(resource_url, files[filename], auth=self.auth,
+        compressed = sorted(f for f in files if f.endswith((".tgz", ".tzst")))
+        others = sorted(f for f in files if not f.endswith((".tgz", ".tzst")))
+        for filenames in (compressed, others):
+            if not filenames:
+                continue
+            progress = TransferProgress(self._output,
+                                        sum(os.stat(files[f]).st_size for f in filenames))
+            for filename in filenames:
+                self._output.writeln("Uploading %s" % filename)
+
+            def _upload(filename):
+                uploader.upload(urls[filename], files[filename], auth=self.auth,
                                 dedup=self._checksum_deploy, retry=retry,
                                 retry_wait=retry_wait,
-                                headers=self._put_headers)
-                self._output.writeln("")
-            except (AuthenticationException, ForbiddenException):
-                raise
-            except Exception as exc:
-                self._output.error("\nError uploading file: %s, '%s'" % (filename, exc))
-                failed.append(filename)
+                                headers=dict(self._put_headers or {}), progress=progress)
+
+            results = run_concurrent_transfers(_upload, filenames)
+            progress.finish()
+            for filename, (_, exc) in zip(filenames, results):
+                if isinstance(exc, (AuthenticationException, ForbiddenException)):
+                    raise exc
+                if exc is not None:
+                    self._output.error("\nError uploading file: %s, '%s'" % (filename, exc))
+                    failed.append(filename)
+            if failed:
+                # Never upload the metadata files if some compressed file didn't land
+                break
 
         if failed:
             raise ConanException("Execute upload again to retry upload the failed files: %s"
@@ -198,18 +216,37 @@ class RestV2Methods(RestCommonMethods):
         else:
             logger.debug("\nUPLOAD: All uploaded! Total time: %s\n" % str(time.time() - t1))
 
-    def _download_and_save_files(self, urls, dest_folder, files):
+    def _download_and_save_files(self, urls, dest_folder, files, extract=None):
+        """ extract: the name of the compressed file, if any, that has to be extracted into
+        the "dest_folder" while being downloaded, instead of saved
+        """
         downloader = FileDownloader(self.requester, self._output, self.verify_ssl)
+        progress = TransferProgress(self._output)
         # Take advantage of filenames ordering, so that conan_package.tgz and conan_export.tgz
         # can be < conanfile, conaninfo, and sent always the last, so smaller files go first
-        for filename in sorted(files, reverse=True):
-            if self._output:
+        filenames = sorted(files, reverse=True)
+        if self._output:
+            for filename in filenames:
                 self._output.writeln("Downloading %s" % filename)
-            resource_url = urls[filename]
-            abs_path = os.path.join(dest_folder, filename)
-            downloader.download(resource_url, abs_path, auth=self.auth)
-            if self._output:
-                self._output.writeln("")
+
+        def _download(filename):
+            if filename == extract:
+                tar_open = zstd_tar_open if filename == PACKAGE_TZST_NAME else tar_stream_open
+                t1 = time.time()
+                downloader.download(urls[filename], auth=self.auth, progress=progress,
+                                    extract_folder=dest_folder, tar_open=tar_open)
+                # The extraction finishes with the download, it is the duration of both
+                log_uncompressed_file(os.path.join(dest_folder, filename), time.time() - t1,
+                                      dest_folder)
+            else:
+                abs_path = os.path.join(dest_folder, filename)
+                downloader.download(urls[filename], abs_path, auth=self.auth, progress=progress)
+
+        results = run_concurrent_transfers(_download, filenames)
+        progress.finish()
+        for _, exc in results:
+            if exc is not None:
+                raise exc
 
     def _remove_conanfile_files(self, ref, files):
         # V2 === revisions, do not remove files, it will create a new revision if the files changed
@@ -309,3 +346,18 @@ class RestV2Methods(RestCommonMethods):
         prev = data["revision"]
         # Ignored data["time"]
         return pref.copy_with_revs(pref.ref.revision, prev)
+
+    def get_packages_info(self, prefs):
+        """ Returns a list with a (ConanInfo, pref with PREV) for every package reference, or None
+        if the package is not in the remote. The latest PREV is used for the prefs without it
+        """
+        url = self.router.packages_info()
+        data = self.get_json(url, data={"packages": [pref.full_repr() for pref in prefs]})
+        ret = []
+        for pref, package in zip(prefs, data["packages"]):
+            if package is None:
+                ret.append(None)
+            else:
+                pref = pref.copy_with_revs(pref.ref.revision, package["revision"])
+                ret.append((ConanInfo.loads(package["conaninfo"]), pref))
+        return ret
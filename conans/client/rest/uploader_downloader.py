@@ -1,17 +1,23 @@
 import os
+import threading
 import traceback
+from multiprocessing.pool import ThreadPool
 
 import time
 
 from conans.client.rest import response_to_str
-from conans.client.tools.files import human_size
 from conans.errors import AuthenticationException, ConanConnectionError, ConanException, \
     NotFoundException, ForbiddenException, RequestErrorException
-from conans.util.files import mkdir, save_append, sha1sum, to_file_bytes
+from conans.util.files import TarExtractionStream, mkdir, save_append, sha1sum, to_file_bytes
 from conans.util.log import logger
 from conans.util.tracer import log_download
 
 
+class ExtractionError(ConanException):
+    """ The downloaded data couldn't be extracted, downloading it again won't fix it
+    """
+
+
 class FileUploader(object):
 
     def __init__(self, requester, output, verify, chunk_size=1000):
@@ -21,7 +27,7 @@ class FileUploader(object):
         self.verify = verify
 
     def upload(self, url, abs_path, auth=None, dedup=False, retry=None, retry_wait=None,
-               headers=None):
+               headers=None, progress=None):
         retry = retry if retry is not None else self.requester.retry
         retry = retry if retry is not None else 1
         retry_wait = retry_wait if retry_wait is not None else self.requester.retry_wait
@@ -47,23 +53,29 @@ class FileUploader(object):
                     raise AuthenticationException(response_to_str(response))
                 raise ForbiddenException(response_to_str(response))
             if response.status_code == 201:  # Artifactory returns 201 if the file is there
+                if progress is not None:
+                    progress.update(os.stat(abs_path).st_size)
                 return response
 
-        self.output.info("")
         # Actual transfer of the real content
+        ret = call_with_retry(self.output, retry, retry_wait, self._upload_file, url,
+                              abs_path=abs_path, headers=headers, auth=auth, progress=progress)
+
+        return ret
+
+    def _upload_file(self, url, abs_path, headers, auth, progress):
+        # The file is read again in every attempt, a retry cannot reuse a consumed iterator
         it = load_in_chunks(abs_path, self.chunk_size)
         # Now it is a chunked read file
         file_size = os.stat(abs_path).st_size
-        it = upload_with_progress(file_size, it, self.chunk_size, self.output)
+        if progress is not None:
+            it = progress.track(it)
+        else:
+            self.output.info("")
+            it = upload_with_progress(file_size, it, self.chunk_size, self.output)
         # Now it will print progress in each iteration
-        iterable_to_file = IterableToFileAdapter(it, file_size)
+        data = IterableToFileAdapter(it, file_size)
         # Now it is prepared to work with request
-        ret = call_with_retry(self.output, retry, retry_wait, self._upload_file, url,
-                              data=iterable_to_file, headers=headers, auth=auth)
-
-        return ret
-
-    def _upload_file(self, url, data,  headers, auth):
         try:
             response = self.requester.put(url, data=data, verify=self.verify,
                                           headers=headers, auth=auth)
@@ -152,7 +164,11 @@ class FileDownloader(object):
         self.verify = verify
 
     def download(self, url, file_path=None, auth=None, retry=None, retry_wait=None, overwrite=False,
-                 headers=None):
+                 headers=None, progress=None, extract_folder=None, tar_open=None):
+        """ extract_folder: instead of saving the file, it is extracted while downloaded, in a
+        streaming way. It has to be a compressed tar, opened with "tar_open" (tar_stream_open by
+        default)
+        """
         retry = retry if retry is not None else self.requester.retry
         retry = retry if retry is not None else 2
         retry_wait = retry_wait if retry_wait is not None else self.requester.retry_wait
@@ -171,9 +187,10 @@ class FileDownloader(object):
                 raise ConanException("Error, the file to download already exists: '%s'" % file_path)
 
         return call_with_retry(self.output, retry, retry_wait, self._download_file, url, auth,
-                               headers, file_path)
+                               headers, file_path, progress, extract_folder, tar_open)
 
-    def _download_file(self, url, auth, headers, file_path):
+    def _download_file(self, url, auth, headers, file_path, progress=None, extract_folder=None,
+                       tar_open=None):
         t1 = time.time()
 
         try:
@@ -195,10 +212,12 @@ class FileDownloader(object):
 
         try:
             logger.debug("DOWNLOAD: %s" % url)
-            data = self._download_data(response, file_path)
+            data = self._download_data(response, file_path, progress, extract_folder, tar_open)
             duration = time.time() - t1
             log_download(url, duration)
             return data
+        except ExtractionError:
+            raise
         except Exception as e:
             logger.debug(e.__class__)
             logger.debug(traceback.format_exc())
@@ -206,21 +225,32 @@ class FileDownloader(object):
             raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
                                        % str(e))
 
-    def _download_data(self, response, file_path):
+    def _download_data(self, response, file_path, progress=None, extract_folder=None,
+                       tar_open=None):
         ret = bytearray()
         total_length = response.headers.get('content-length')
+        to_memory = not file_path and not extract_folder
 
         if total_length is None:  # no content length header
-            if not file_path:
+            if to_memory:
                 ret += response.content
             else:
-                if self.output:
+                if progress is not None:
+                    progress.add_total(len(response.content))
+                    progress.update(len(response.content))
+                elif self.output:
                     total_length = len(response.content)
-                    progress = human_readable_progress(total_length, total_length)
-                    print_progress(self.output, 50, progress)
-                save_append(file_path, response.content)
+                    readable = human_readable_progress(total_length, total_length)
+                    print_progress(self.output, 50, readable)
+                if extract_folder:
+                    self._download_extracting(extract_folder, tar_open,
+                                              lambda stream: stream.write(response.content))
+                else:
+                    save_append(file_path, response.content)
         else:
             total_length = int(total_length)
+            if progress is not None:
+                progress.add_total(total_length)
             encoding = response.headers.get('content-encoding')
             gzip = (encoding == "gzip")
             # chunked can be a problem:
@@ -229,7 +259,7 @@ class FileDownloader(object):
 
             def download_chunks(file_handler=None, ret_buffer=None):
                 """Write to a buffer or to a file handler"""
-                chunk_size = 1024 if not file_path else 1024 * 100
+                chunk_size = 1024 if to_memory else 1024 * 100
                 download_size = 0
                 last_progress = None
                 for data in response.iter_content(chunk_size):
@@ -238,15 +268,23 @@ class FileDownloader(object):
                         ret_buffer.extend(data)
                     if file_handler is not None:
                         file_handler.write(to_file_bytes(data))
-                    if self.output:
+                    if progress is not None:
+                        progress.update(len(data))
+                    elif self.output:
                         units = progress_units(download_size, total_length)
-                        progress = human_readable_progress(download_size, total_length)
+                        readable = human_readable_progress(download_size, total_length)
                         if last_progress != units:  # Avoid screen refresh if nothing has change
-                            print_progress(self.output, units, progress)
+                            print_progress(self.output, units, readable)
                             last_progress = units
                 return download_size
 
-            if file_path:
+            if extract_folder:
+                def download_extracting(stream):
+                    size = download_chunks(file_handler=stream)
+                    self._check_transfer_complete(size, total_length, gzip)
+                    return size
+                dl_size = self._download_extracting(extract_folder, tar_open, download_extracting)
+            elif file_path:
                 mkdir(os.path.dirname(file_path))
                 with open(file_path, 'wb') as handle:
                     dl_size = download_chunks(file_handler=handle)
@@ -255,15 +293,108 @@ class FileDownloader(object):
 
             response.close()
 
-            if dl_size != total_length and not gzip:
-                raise ConanException("Transfer interrupted before "
-                                     "complete: %s < %s" % (dl_size, total_length))
+            self._check_transfer_complete(dl_size, total_length, gzip)
 
-        if not file_path:
+        if to_memory:
             return bytes(ret)
         else:
             return
 
+    @staticmethod
+    def _check_transfer_complete(dl_size, total_length, gzip):
+        if dl_size != total_length and not gzip:
+            raise ConanException("Transfer interrupted before "
+                                 "complete: %s < %s" % (dl_size, total_length))
+
+    @staticmethod
+    def _download_extracting(extract_folder, tar_open, download):
+        """ Calls download(stream), with a stream extracting into the extract_folder. If it fails,
+        the extracted files are removed, so a retry doesn't extract on top of them. The errors
+        extracting the data are raised as ExtractionError, not to be retried
+        """
+        mkdir(extract_folder)
+        if tar_open is None:
+            stream = TarExtractionStream(extract_folder)
+        else:
+            stream = TarExtractionStream(extract_folder, tar_open)
+        try:
+            with stream:
+                return download(stream)
+        except Exception as exc:
+            try:
+                stream.remove_extracted()
+            except Exception as remove_exc:
+                raise ExtractionError("Error while downloading/extracting files to %s\n%s\n"
+                                      "Files not removed (%s), files/package might be damaged, "
+                                      "remove manually" % (extract_folder, str(exc),
+                                                           str(remove_exc)))
+            if stream.error is not None:
+                raise ExtractionError("Error while downloading/extracting files to %s\n%s\n"
+                                      "Files removed" % (extract_folder, str(stream.error)))
+            raise
+
+
+class TransferProgress(object):
+    """ Single progress bar aggregating the transferred bytes of several files, that can
+    be transferred concurrently from different threads
+    """
+
+    def __init__(self, output, total_size=0):
+        self._output = output
+        self._lock = threading.Lock()
+        self._total_size = total_size
+        self._transferred = 0
+        self._last_units = None
+
+    def add_total(self, size):
+        with self._lock:
+            self._total_size += size
+
+    def update(self, size):
+        with self._lock:
+            self._transferred += size
+            if not self._output:
+                return
+            transferred = min(self._transferred, self._total_size)
+            units = progress_units(transferred, self._total_size)
+            if units != self._last_units:  # Avoid screen refresh if nothing has change
+                progress = human_readable_progress(transferred, self._total_size)
+                print_progress(self._output, units, progress)
+                self._last_units = units
+
+    def track(self, chunks):
+        for chunk in chunks:
+            self.update(len(chunk))
+            yield chunk
+
+    def finish(self):
+        if self._output and self._output.is_terminal and self._last_units is not None:
+            self._output.writeln("")
+
+
+MAX_CONCURRENT_TRANSFERS = 4
+
+
+def run_concurrent_transfers(transfer, items):
+    """ Calls transfer(item) for every item, in a bounded pool of threads. It never raises, it
+    returns a list of (result, exception) tuples, in the same order as the given items
+    """
+    def _call(item):
+        try:
+            return transfer(item), None
+        except Exception as exc:
+            return None, exc
+
+    if len(items) < 2:
+        return [_call(item) for item in items]
+
+    thread_pool = ThreadPool(min(len(items), MAX_CONCURRENT_TRANSFERS))
+    try:
+        return thread_pool.map(_call, items)
+    finally:
+        thread_pool.close()
+        thread_pool.join()
+
 
 def progress_units(progress, total):
     if total == 0:
@@ -272,6 +403,8 @@ def progress_units(progress, total):
 
 
 def human_readable_progress(bytes_transferred, total_bytes):
+    # Not imported globally, the tools import this module
+    from conans.client.tools.files import human_size
     return "%s/%s" % (human_size(bytes_transferred), human_size(total_bytes))
 
 
@@ -285,7 +418,7 @@ def call_with_retry(out, retry, retry_wait, method, *args, **kwargs):
         try:
             return method(*args, **kwargs)
         except (NotFoundException, ForbiddenException, AuthenticationException,
-                RequestErrorException):
+                RequestErrorException, ExtractionError):
             raise
         except ConanException as exc:
             if counter == retry:
@@ -1,9 +1,16 @@
+import os
 import sys
 
-from conans.client.command import main
-
 
 def run():
+    socket_path = os.getenv("CONAN_DAEMON_SOCKET")
+    if socket_path:
+        # Not importing the commands, the daemon runs them
+        from conans.client.daemon import forward_command
+        exit_code = forward_command(socket_path, sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+    from conans.client.command import main
     main(sys.argv[1:])
 
 
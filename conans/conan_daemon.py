@@ -0,0 +1,24 @@
+import argparse
+import os
+
+from conans.client.daemon import ConanDaemon, daemon_supported
+
+
+def run():
+    parser = argparse.ArgumentParser(description='Launch a conan daemon, running the conan '
+                                                 'commands forwarded to it with the '
+                                                 'CONAN_DAEMON_SOCKET environment variable')
+    parser.add_argument('--socket', default=os.getenv("CONAN_DAEMON_SOCKET"),
+                        help='Path of the unix socket to listen to. Default: the '
+                             'CONAN_DAEMON_SOCKET environment variable')
+    args = parser.parse_args()
+    if not daemon_supported():
+        parser.error("The conan daemon is not supported in this platform")
+    if not args.socket:
+        parser.error("The path of the socket is needed, with --socket or CONAN_DAEMON_SOCKET")
+    print("Conan daemon listening at %s" % args.socket)
+    ConanDaemon(os.path.abspath(args.socket)).serve()
+
+
+if __name__ == '__main__':
+    run()
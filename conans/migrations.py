@@ -7,6 +7,16 @@ from conans.util.files import load, save
 CONAN_VERSION = "version.txt"
 
 
+def load_version(conf_path):
+    """ The version of conan that last migrated the given folder, None if unknown
+    """
+    try:
+        tmp = load(os.path.join(conf_path, CONAN_VERSION))
+        return Version(tmp)
+    except Exception:
+        return None
+
+
 class Migrator(object):
 
     def __init__(self, conf_path, store_path, current_version, out):
@@ -37,9 +47,4 @@ class Migrator(object):
             raise ConanException("Can't write version file in %s" % self.file_version_path)
 
     def _load_old_version(self):
-        try:
-            tmp = load(self.file_version_path)
-            old_version = Version(tmp)
-        except Exception:
-            old_version = None
-        return old_version
+        return load_version(self.conf_path)
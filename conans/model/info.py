@@ -1,4 +1,6 @@
+import copy
 import os
+import weakref
 
 from conans.client.build.cppstd_flags import cppstd_default
 from conans.client.tools.win import MSVS_DEFAULT_TOOLSETS_INVERSE
@@ -109,32 +111,63 @@ class RequirementInfo(object):
         self.package_id = self.full_package_id
 
 
+# {(pref, default_package_id_mode, indirect): RequirementInfo} shared by the RequirementsInfo
+_requirement_infos = weakref.WeakValueDictionary()
+
+
+def _requirement_info(pref, default_package_id_mode, indirect=False):
+    key = pref, default_package_id_mode, indirect
+    result = _requirement_infos.get(key)
+    if result is None:
+        result = RequirementInfo(pref, default_package_id_mode, indirect=indirect)
+        _requirement_infos[key] = result
+    return result
+
+
 class RequirementsInfo(object):
+    """ The RequirementInfo of the same requirements and mode are shared by all the
+    RequirementsInfo, and copied only when they are going to be modified (copy-on-write)
+    """
     def __init__(self, prefs, default_package_id_mode):
         # {PackageReference: RequirementInfo}
-        self._data = {pref: RequirementInfo(pref, default_package_id_mode=default_package_id_mode)
-                      for pref in prefs}
+        self._data = {pref: _requirement_info(pref, default_package_id_mode) for pref in prefs}
+        self._owned = set()  # The prefs of the RequirementInfo not shared
 
     def copy(self):
         # For build_id() implementation
         result = RequirementsInfo([], None)
         result._data = {pref: req_info.copy() for pref, req_info in self._data.items()}
+        result._owned = set(result._data)
         return result
 
+    def _own(self, pref):
+        """ the RequirementInfo of the pref, to be modified, copied if it is shared
+        """
+        if pref not in self._owned:
+            self._data[pref] = copy.copy(self._data[pref])
+            self._owned.add(pref)
+        return self._data[pref]
+
+    def _own_all(self):
+        return [self._own(pref) for pref in self._data]
+
     def clear(self):
         self._data = {}
+        self._owned = set()
 
     def remove(self, *args):
         for name in args:
-            del self._data[self._get_key(name)]
+            key = self._get_key(name)
+            del self._data[key]
+            self._owned.discard(key)
 
     def add(self, prefs_indirect, default_package_id_mode):
         """ necessary to propagate from upstream the real
         package requirements
         """
         for r in prefs_indirect:
-            self._data[r] = RequirementInfo(r, indirect=True,
-                                            default_package_id_mode=default_package_id_mode)
+            self._data[r] = _requirement_info(r, default_package_id_mode, indirect=True)
+            self._owned.discard(r)
 
     def refs(self):
         """ used for updating downstream requirements with this
@@ -152,7 +185,7 @@ class RequirementsInfo(object):
         Necessary to access from conaninfo
         self.requires["Boost"].version = "2.X"
         """
-        return self._data[self._get_key(item)]
+        return self._own(self._get_key(item))
 
     @property
     def pkg_names(self):
@@ -180,39 +213,39 @@ class RequirementsInfo(object):
         self.clear()
 
     def semver_direct_mode(self):
-        for r in self._data.values():
+        for r in self._own_all():
             r.semver_direct_mode()
 
     def semver_mode(self):
-        for r in self._data.values():
+        for r in self._own_all():
             r.semver_mode()
 
     def patch_mode(self):
-        for r in self._data.values():
+        for r in self._own_all():
             r.patch_mode()
 
     def minor_mode(self):
-        for r in self._data.values():
+        for r in self._own_all():
             r.minor_mode()
 
     def major_mode(self):
-        for r in self._data.values():
+        for r in self._own_all():
             r.major_mode()
 
     def base_mode(self):
-        for r in self._data.values():
+        for r in self._own_all():
             r.base_mode()
 
     def full_version_mode(self):
-        for r in self._data.values():
+        for r in self._own_all():
             r.full_version_mode()
 
     def full_recipe_mode(self):
-        for r in self._data.values():
+        for r in self._own_all():
             r.full_recipe_mode()
 
     def full_package_mode(self):
-        for r in self._data.values():
+        for r in self._own_all():
             r.full_package_mode()
 
 
@@ -4,7 +4,8 @@ import os
 import time
 
 from conans.errors import ConanException
-from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
+from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, \
+    PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME
 from conans.util.env_reader import get_env
 from conans.util.files import load, md5, md5sum, save, walk
 
@@ -110,22 +111,27 @@ class FileTreeManifest(object):
         save(path, repr(self))
 
     @classmethod
-    def create(cls, folder, exports_sources_folder=None):
+    def create(cls, folder, exports_sources_folder=None, file_hashes=None):
         """ Walks a folder and create a FileTreeManifest for it, reading file contents
         from disk, and capturing current time
+        file_hashes: FileHashesCache, to not hash again the files not modified
         """
+        def md5sums(root, root_files):
+            if file_hashes is not None:
+                return file_hashes.md5sums(root, root_files)
+            return {name: md5sum(filepath) for name, filepath in root_files.items()}
+
         files, _ = gather_files(folder)
-        for f in (PACKAGE_TGZ_NAME, EXPORT_TGZ_NAME, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME):
+        for f in (PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME, EXPORT_TGZ_NAME, CONAN_MANIFEST,
+                  EXPORT_SOURCES_TGZ_NAME):
             files.pop(f, None)
 
-        file_dict = {}
-        for name, filepath in files.items():
-            file_dict[name] = md5sum(filepath)
+        file_dict = md5sums(folder, files)
 
         if exports_sources_folder:
             export_files, _ = gather_files(exports_sources_folder)
-            for name, filepath in export_files.items():
-                file_dict["export_source/%s" % name] = md5sum(filepath)
+            for name, file_md5 in md5sums(exports_sources_folder, export_files).items():
+                file_dict["export_source/%s" % name] = file_md5
 
         date = calendar.timegm(time.gmtime())
 
@@ -59,6 +59,7 @@ class PackageOptionValues(object):
     def __init__(self):
         self._dict = {}  # {option_name: PackageOptionValue}
         self._modified = {}
+        self._sha = None  # Computed only once, as they are shared by many OptionsValues
 
     def __bool__(self):
         return bool(self._dict)
@@ -75,14 +76,17 @@ class PackageOptionValues(object):
         if attr not in self._dict:
             return
         del self._dict[attr]
+        self._sha = None
 
     def clear(self):
         self._dict.clear()
+        self._sha = None
 
     def __setattr__(self, attr, value):
         if attr[0] == "_":
             return super(PackageOptionValues, self).__setattr__(attr, value)
         self._dict[attr] = PackageOptionValue(value)
+        self._sha = None
 
     def copy(self):
         result = PackageOptionValues()
@@ -104,16 +108,20 @@ class PackageOptionValues(object):
         assert isinstance(option_text, six.string_types)
         name, value = option_text.split("=")
         self._dict[name.strip()] = PackageOptionValue(value.strip())
+        self._sha = None
 
     def add_option(self, option_name, option_value):
         self._dict[option_name] = PackageOptionValue(option_value)
+        self._sha = None
 
     def update(self, other):
         assert isinstance(other, PackageOptionValues)
         self._dict.update(other._dict)
+        self._sha = None
 
     def remove(self, option_name):
         del self._dict[option_name]
+        self._sha = None
 
     def freeze(self):
         self._freeze = True
@@ -142,30 +150,38 @@ class PackageOptionValues(object):
             else:
                 self._modified[name] = (value, down_ref)
                 self._dict[name] = value
+                self._sha = None
 
     def serialize(self):
         return self.items()
 
     @property
     def sha(self):
-        result = []
-        for name, value in self.items():
-            # It is important to discard None values, so migrations in settings can be done
-            # without breaking all existing packages SHAs, by adding a first "None" option
-            # that doesn't change the final sha
-            if value:
-                result.append("%s=%s" % (name, value))
-        return sha1('\n'.join(result).encode())
+        if self._sha is None:
+            result = []
+            for name, value in self.items():
+                # It is important to discard None values, so migrations in settings can be done
+                # without breaking all existing packages SHAs, by adding a first "None" option
+                # that doesn't change the final sha
+                if value:
+                    result.append("%s=%s" % (name, value))
+            self._sha = sha1('\n'.join(result).encode())
+        return self._sha
 
 
 class OptionsValues(object):
     """ static= True,
     Boost.static = False,
     Poco.optimized = True
+
+    The PackageOptionValues of the requirements are shared with the copies and the Options
+    they come from, and copied only when they are going to be modified (copy-on-write), so
+    the options of the whole graph are not copied for every node
     """
     def __init__(self, values=None):
         self._package_values = PackageOptionValues()
         self._reqs_options = {}  # {name("Boost": PackageOptionValues}
+        self._shared = set()  # names of the _reqs_options shared with other objects
         if not values:
             return
 
@@ -190,19 +206,36 @@ class OptionsValues(object):
             else:
                 self._package_values.add_option(k, v)
 
+    def _own(self, name):
+        """ the PackageOptionValues of the 'name' requirement, to be modified, copied if shared
+        """
+        package_values = self._reqs_options.get(name)
+        if package_values is None:
+            package_values = self._reqs_options[name] = PackageOptionValues()
+        elif name in self._shared:
+            package_values = self._reqs_options[name] = package_values.copy()
+        self._shared.discard(name)
+        return package_values
+
+    def _share(self, reqs_options):
+        """ sets the given PackageOptionValues, shared with their current owner
+        """
+        self._reqs_options = dict(reqs_options)
+        self._shared = set(self._reqs_options)
+
     def update(self, other):
         self._package_values.update(other._package_values)
         for package_name, package_values in other._reqs_options.items():
-            pkg_values = self._reqs_options.setdefault(package_name, PackageOptionValues())
-            pkg_values.update(package_values)
+            self._own(package_name).update(package_values)
 
     def scope_options(self, name):
         if self._package_values:
-            self._reqs_options.setdefault(name, PackageOptionValues()).update(self._package_values)
+            self._own(name).update(self._package_values)
             self._package_values = PackageOptionValues()
 
     def descope_options(self, name):
         package_values = self._reqs_options.pop(name, None)
+        self._shared.discard(name)
         if package_values:
             self._package_values.update(package_values)
 
@@ -210,17 +243,24 @@ class OptionsValues(object):
         self._package_values.clear()
 
     def __getitem__(self, item):
-        return self._reqs_options.setdefault(item, PackageOptionValues())
+        return self._own(item)
 
     def __setitem__(self, item, value):
         self._reqs_options[item] = value
+        self._shared.discard(item)
 
     def pop(self, item):
-        return self._reqs_options.pop(item, None)
+        if item not in self._reqs_options:
+            return None
+        package_values = self._own(item)
+        del self._reqs_options[item]
+        return package_values
 
     def remove(self, name, package=None):
         if package:
-            self._reqs_options[package].remove(name)
+            if package not in self._reqs_options:
+                raise KeyError(package)
+            self._own(package).remove(name)
         else:
             self._package_values.remove(name)
 
@@ -233,8 +273,8 @@ class OptionsValues(object):
     def copy(self):
         result = OptionsValues()
         result._package_values = self._package_values.copy()
-        for k, v in self._reqs_options.items():
-            result._reqs_options[k] = v.copy()
+        result._share(self._reqs_options)
+        self._shared = set(self._reqs_options)
         return result
 
     def __setattr__(self, attr, value):
@@ -246,11 +286,13 @@ class OptionsValues(object):
         delattr(self._package_values, attr)
 
     def clear_indirect(self):
-        for v in self._reqs_options.values():
-            v.clear()
+        empty = PackageOptionValues()
+        self._share({k: empty for k in self._reqs_options})
 
     def filter_used(self, used_pkg_names):
+        used_pkg_names = set(used_pkg_names)
         self._reqs_options = {k: v for k, v in self._reqs_options.items() if k in used_pkg_names}
+        self._shared.intersection_update(self._reqs_options)
 
     def as_list(self):
         result = []
@@ -297,6 +339,7 @@ class OptionsValues(object):
     def clear(self):
         self._package_values.clear()
         self._reqs_options.clear()
+        self._shared.clear()
 
 
 class PackageOption(object):
@@ -502,6 +545,7 @@ class Options(object):
         # if more than 1 is present, 1 should be "private" requirement and its options
         # are not public, not overridable
         self._deps_package_values = {}  # {name("Boost": PackageOptionValues}
+        self._shared = set()  # names of the _deps_package_values shared with OptionsValues
 
     def freeze(self):
         self._package_options.freeze()
@@ -518,8 +562,19 @@ class Options(object):
     def __contains__(self, option):
         return option in self._package_options
 
+    def _own(self, name):
+        """ the PackageOptionValues of the 'name' requirement, to be modified, copied if shared
+        """
+        package_values = self._deps_package_values.get(name)
+        if package_values is None:
+            package_values = self._deps_package_values[name] = PackageOptionValues()
+        elif name in self._shared:
+            package_values = self._deps_package_values[name] = package_values.copy()
+        self._shared.discard(name)
+        return package_values
+
     def __getitem__(self, item):
-        return self._deps_package_values.setdefault(item, PackageOptionValues())
+        return self._own(item)
 
     def __getattr__(self, attr):
         return getattr(self._package_options, attr)
@@ -539,17 +594,17 @@ class Options(object):
     def values(self):
         result = OptionsValues()
         result._package_values = self._package_options.values
-        for k, v in self._deps_package_values.items():
-            result._reqs_options[k] = v.copy()
+        result._share(self._deps_package_values)
+        self._shared = set(self._deps_package_values)
         return result
 
     @values.setter
     def values(self, v):
         assert isinstance(v, OptionsValues)
         self._package_options.values = v._package_values
-        self._deps_package_values.clear()
-        for k, v in v._reqs_options.items():
-            self._deps_package_values[k] = v.copy()
+        self._deps_package_values = dict(v._reqs_options)
+        self._shared = set(self._deps_package_values)
+        v._shared = set(v._reqs_options)
 
     def propagate_upstream(self, down_package_values, down_ref, own_ref):
         """ used to propagate from downstream the options to the upper requirements
@@ -581,7 +636,7 @@ class Options(object):
         # Upstream propagation to deps
         for name, option_values in sorted(list(down_package_values.items())):
             if name != own_ref.name:
-                pkg_values = self._deps_package_values.setdefault(name, PackageOptionValues())
+                pkg_values = self._own(name)
                 pkg_values.propagate_upstream(option_values, down_ref, own_ref, name)
 
     def initialize_upstream(self, user_values, name=None):
@@ -597,9 +652,7 @@ class Options(object):
             # Then, the normal assignment of values, which could override patterns
             self._package_options.values = user_values._package_values
             for package_name, package_values in user_values._reqs_options.items():
-                pkg_values = self._deps_package_values.setdefault(package_name,
-                                                                  PackageOptionValues())
-                pkg_values.update(package_values)
+                self._own(package_name).update(package_values)
 
     def validate(self):
         return self._package_options.validate()
@@ -607,13 +660,16 @@ class Options(object):
     def propagate_downstream(self, ref, options):
         assert isinstance(options, OptionsValues)
         self._deps_package_values[ref.name] = options._package_values
-        for k, v in options._reqs_options.items():
-            self._deps_package_values[k] = v.copy()
+        self._shared.add(ref.name)
+        self._deps_package_values.update(options._reqs_options)
+        self._shared.update(options._reqs_options)
+        options._shared = set(options._reqs_options)
 
     def clear_unused(self, references):
         """ remove all options not related to the passed references,
         that should be the upstream requirements
         """
-        existing_names = [r.ref.name for r in references]
+        existing_names = set(r.ref.name for r in references)
         self._deps_package_values = {k: v for k, v in self._deps_package_values.items()
                                      if k in existing_names}
+        self._shared.intersection_update(self._deps_package_values)
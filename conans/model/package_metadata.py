@@ -30,7 +30,7 @@ class _RecipeMetadata(object):
         ret = _RecipeMetadata()
         ret.revision = data["revision"]
         ret.remote = data.get("remote")
-        ret.properties = data["properties"]
+        ret.properties = dict(data["properties"])
         ret.time = data.get("time")
         return ret
 
@@ -71,7 +71,8 @@ class _BinaryPackageMetadata(object):
         ret = _BinaryPackageMetadata()
         ret.revision = data.get("revision")
         ret.recipe_revision = data.get("recipe_revision")
-        ret.properties = data.get("properties")
+        properties = data.get("properties")
+        ret.properties = dict(properties) if properties is not None else None
         ret.remote = data.get("remote")
         return ret
 
@@ -85,8 +86,13 @@ class PackageMetadata(object):
 
     @staticmethod
     def loads(content):
+        return PackageMetadata.from_dict(json.loads(content))
+
+    @staticmethod
+    def from_dict(data):
+        """ the returned object doesn't share anything modifiable with 'data'
+        """
         ret = PackageMetadata()
-        data = json.loads(content)
         ret.recipe = _RecipeMetadata.loads(data.get("recipe"))
         for pid, v in data.get("packages").items():
             ret.packages[pid] = _BinaryPackageMetadata.loads(v)
@@ -66,6 +66,11 @@ class RestRoutes(object):
     def package_revision_file(self):
         return '%s/files/{path}' % self.package_revision
 
+    @property
+    def packages_info(self):
+        """Route to get the latest revision and conaninfo of many packages at once"""
+        return 'conans/packages/info'
+
     # ONLY V1
     @property
     def v1_updown_file(self):
@@ -31,10 +31,13 @@ class SettingsItem(object):
     - "ANY", as string to accept any value
     - List ["None", "ANY"] to accept None or any value
     - A dict {subsetting: definition}, e.g. {version: [], runtime: []} for VS
+
+    The copies share the definition until one of them has to modify it (copy-on-write)
     """
     def __init__(self, definition, name):
         self._name = name  # settings.compiler
         self._value = None  # gcc
+        self._shared = False  # The definition is shared with other copies
         if isinstance(definition, dict):
             self._definition = {}
             # recursive
@@ -51,16 +54,24 @@ class SettingsItem(object):
         return value in (self._value or "")
 
     def copy(self):
-        """ deepcopy, recursive
+        """ deepcopy, recursive. The definition is copied only when it is modified
         """
         result = SettingsItem({}, name=self._name)
         result._value = self._value
-        if self.is_final:
-            result._definition = self._definition[:]
-        else:
-            result._definition = {k: v.copy() for k, v in self._definition.items()}
+        result._definition = self._definition
+        result._shared = self._shared = True
         return result
 
+    def _own_definition(self):
+        """ makes a copy of the shared definition, before modifying it or returning a child
+        """
+        if self._shared:
+            if self.is_final:
+                self._definition = self._definition[:]
+            else:
+                self._definition = {k: v.copy() for k, v in self._definition.items()}
+            self._shared = False
+
     def copy_values(self):
         if self._value is None and "None" not in self._definition:
             return None
@@ -114,6 +125,7 @@ class SettingsItem(object):
     def remove(self, values):
         if not isinstance(values, (list, tuple, set)):
             values = [values]
+        self._own_definition()
         for v in values:
             v = str(v)
             if isinstance(self._definition, dict):
@@ -132,6 +144,7 @@ class SettingsItem(object):
             raise undefined_field(self._name, item, None, self._value)
         if self._value is None:
             raise undefined_value(self._name)
+        self._own_definition()
         return self._definition[self._value]
 
     def __getattr__(self, item):
@@ -149,6 +162,7 @@ class SettingsItem(object):
 
     def __getitem__(self, value):
         value = str(value)
+        self._own_definition()
         try:
             return self._definition[value]
         except Exception:
@@ -193,6 +207,9 @@ class SettingsItem(object):
 
 
 class Settings(object):
+    """ The copies share the items until they are accessed, so copying the full settings.yml
+    definition for every conanfile is cheap (copy-on-write)
+    """
     def __init__(self, definition=None, name="settings", parent_value=None):
         if parent_value == "None" and definition:
             raise ConanException("settings.yml: None setting can't have subsettings")
@@ -201,6 +218,7 @@ class Settings(object):
         self._parent_value = parent_value  # gcc, x86
         self._data = {str(k): SettingsItem(v, "%s.%s" % (name, k))
                       for k, v in definition.items()}
+        self._owned = set(self._data)  # The items not shared with other copies
 
     def get_safe(self, name):
         try:
@@ -214,13 +232,21 @@ class Settings(object):
         return None
 
     def copy(self):
-        """ deepcopy, recursive
+        """ deepcopy, recursive. The items are copied when they are accessed
         """
         result = Settings({}, name=self._name, parent_value=self._parent_value)
-        for k, v in self._data.items():
-            result._data[k] = v.copy()
+        result._data = dict(self._data)
+        self._owned = set()
         return result
 
+    def _item(self, field):
+        """ the item of the field, copied if it is shared, as it can be modified by the caller
+        """
+        if field not in self._owned:
+            self._data[field] = self._data[field].copy()
+            self._owned.add(field)
+        return self._data[field]
+
     def copy_values(self):
         """ deepcopy, recursive
         """
@@ -229,6 +255,7 @@ class Settings(object):
             value = v.copy_values()
             if value is not None:
                 result._data[k] = value
+                result._owned.add(k)
         return result
 
     @staticmethod
@@ -250,9 +277,11 @@ class Settings(object):
         for it in item:
             it = str(it)
             self._data.pop(it, None)
+            self._owned.discard(it)
 
     def clear(self):
         self._data = {}
+        self._owned = set()
 
     def _check_field(self, field):
         if field not in self._data:
@@ -261,19 +290,20 @@ class Settings(object):
     def __getattr__(self, field):
         assert field[0] != "_", "ERROR %s" % field
         self._check_field(field)
-        return self._data[field]
+        return self._item(field)
 
     def __delattr__(self, field):
         assert field[0] != "_", "ERROR %s" % field
         self._check_field(field)
         del self._data[field]
+        self._owned.discard(field)
 
     def __setattr__(self, field, value):
         if field[0] == "_" or field.startswith("values"):
             return super(Settings, self).__setattr__(field, value)
 
         self._check_field(field)
-        self._data[field].value = value
+        self._item(field).value = value
 
     @property
     def values(self):
@@ -322,10 +352,11 @@ class Settings(object):
             constraint_def = {str(k): v for k, v in constraint_def.items()}
 
         fields_to_remove = []
-        for field, config_item in self._data.items():
+        for field in list(self._data):
             if field not in constraint_def:
                 fields_to_remove.append(field)
                 continue
+            config_item = self._item(field)
 
             other_field_def = constraint_def[field]
             if other_field_def is None:  # Means leave it as is
@@ -3,37 +3,46 @@ from conans.util.sha import sha1
 
 
 class Values(object):
+    """ The copies share the children values until they are accessed (copy-on-write)
+    """
     def __init__(self, value="values"):
         self._value = str(value)
         self._dict = {}  # {key: Values()}
+        self._owned = set()  # The keys of the children not shared with other copies
         self._modified = {}  # {"compiler.version.arch": (old_value, old_reference)}
 
     def __getattr__(self, attr):
         if attr not in self._dict:
             return None
+        if attr not in self._owned:  # It can be modified by the caller
+            self._dict[attr] = self._dict[attr].copy()
+            self._owned.add(attr)
         return self._dict[attr]
 
     def __delattr__(self, attr):
         if attr not in self._dict:
             return
         del self._dict[attr]
+        self._owned.discard(attr)
 
     def clear(self):
         # TODO: Test. DO not delete, might be used by package_id() to clear settings values
         self._dict.clear()
+        self._owned.clear()
         self._value = ""
 
     def __setattr__(self, attr, value):
         if attr[0] == "_":
             return super(Values, self).__setattr__(attr, value)
         self._dict[attr] = Values(value)
+        self._owned.add(attr)
 
     def copy(self):
-        """ deepcopy, recursive
+        """ deepcopy, recursive. The children are copied when they are accessed
         """
         result = Values(self._value)
-        for k, v in self._dict.items():
-            result._dict[k] = v.copy()
+        result._dict = dict(self._dict)
+        self._owned = set()
         return result
 
     @property
@@ -70,7 +79,7 @@ class Values(object):
     def as_list(self, list_all=True):
         result = []
         for field in self.fields:
-            value = getattr(self, field)
+            value = self._dict[field]
             if value or list_all:
                 result.append((field, str(value)))
                 child_lines = value.as_list()
@@ -42,6 +42,7 @@ CONANENV = "conanenv.txt"
 SYSTEM_REQS = "system_reqs.txt"
 PUT_HEADERS = "artifacts.properties"
 PACKAGE_TGZ_NAME = "conan_package.tgz"
+PACKAGE_TZST_NAME = "conan_package.tzst"  # Only if the remote has the "zstd" capability
 EXPORT_TGZ_NAME = "conan_export.tgz"
 EXPORT_SOURCES_TGZ_NAME = "conan_sources.tgz"
 EXPORT_SOURCES_DIR_OLD = ".c_src"
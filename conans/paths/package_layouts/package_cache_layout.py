@@ -2,6 +2,7 @@
 
 import os
 import platform
+import threading
 from contextlib import contextmanager
 
 
@@ -20,6 +21,9 @@ from conans.util.files import load, save, rmdir
 from conans.util.locks import Lock, NoLock, ReadLock, SimpleLock, WriteLock
 from conans.util.log import logger
 
+# The inter-process locks are not exclusive among threads of the same process
+_metadata_thread_lock = threading.RLock()
+
 
 def short_path(func):
     if platform.system() == "Windows":
@@ -37,12 +41,15 @@ def short_path(func):
 class PackageCacheLayout(object):
     """ This is the package layout for Conan cache """
 
-    def __init__(self, base_folder, ref, short_paths, no_lock):
+    def __init__(self, base_folder, ref, short_paths, no_lock, file_hashes=None,
+                 metadata_cache=None):
         assert isinstance(ref, ConanFileReference)
         self._ref = ref
         self._base_folder = os.path.normpath(base_folder)
         self._short_paths = short_paths
         self._no_lock = no_lock
+        self._file_hashes = file_hashes
+        self._metadata_cache = metadata_cache
 
     @property
     def ref(self):
@@ -117,7 +124,8 @@ class PackageCacheLayout(object):
     def package_manifests(self, pref):
         package_folder = self.package(pref)
         readed_manifest = FileTreeManifest.load(package_folder)
-        expected_manifest = FileTreeManifest.create(package_folder)
+        expected_manifest = FileTreeManifest.create(package_folder,
+                                                    file_hashes=self._file_hashes)
         return readed_manifest, expected_manifest
 
     def recipe_exists(self):
@@ -164,6 +172,8 @@ class PackageCacheLayout(object):
     # Metadata
     def load_metadata(self):
         try:
+            if self._metadata_cache is not None:
+                return self._metadata_cache.load(self.package_metadata())
             text = load(self.package_metadata())
         except IOError:
             raise RecipeNotFoundException(self._ref)
@@ -171,14 +181,21 @@ class PackageCacheLayout(object):
 
     @contextmanager
     def update_metadata(self):
+        """ The metadata is written only if it has been modified, so several updates of the
+        packages of the reference are better done in the same update_metadata()
+        """
         lockfile = self.package_metadata() + ".lock"
-        with fasteners.InterProcessLock(lockfile, logger=logger):
+        with _metadata_thread_lock, fasteners.InterProcessLock(lockfile, logger=logger):
             try:
                 metadata = self.load_metadata()
+                current = metadata.dumps()
             except RecipeNotFoundException:
                 metadata = PackageMetadata()
+                current = None
             yield metadata
-            save(self.package_metadata(), metadata.dumps())
+            new = metadata.dumps()
+            if new != current:
+                save(self.package_metadata(), new)
 
     # Revisions
     def package_summary_hash(self, pref):
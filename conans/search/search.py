@@ -89,16 +89,26 @@ def evaluate(prop_name, prop_value, conan_vars_info):
         return compatible_prop(info_options.get(prop_name, None), prop_value)
 
 
+def _pattern_name(pattern):
+    """ The name of the references matching the pattern, if it is not a pattern itself
+    """
+    name = pattern.split("/", 1)[0]
+    if name and not any(c in name for c in "*?[]@#"):
+        return name
+    return None
+
+
 def search_recipes(cache, pattern=None, ignorecase=True):
     # Conan references in main storage
+    name = None
     if pattern:
         if isinstance(pattern, ConanFileReference):
             pattern = str(pattern)
+        name = _pattern_name(pattern)
         pattern = translate(pattern)
         pattern = re.compile(pattern, re.IGNORECASE) if ignorecase else re.compile(pattern)
 
-    subdirs = list_folder_subdirs(basedir=cache.store, level=4)
-    refs = [ConanFileReference(*folder.split("/")) for folder in subdirs]
+    refs = cache.catalog.refs(name, ignorecase)
     refs.extend(cache.editable_packages.edited_refs.keys())
     if pattern:
         refs = [r for r in refs if _partial_match(pattern, r)]
@@ -3,6 +3,8 @@ def get_mime_type(filepath):
         mimetype = "x-gzip"
     elif filepath.endswith(".txz"):
         mimetype = "x-xz"
+    elif filepath.endswith(".tzst"):
+        mimetype = "application/zstd"
     else:
         mimetype = "auto"
 
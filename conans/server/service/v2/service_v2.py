@@ -3,10 +3,11 @@ import os
 from bottle import FileUpload, static_file
 
 from conans.errors import RecipeNotFoundException, PackageNotFoundException
+from conans.paths import CONANINFO
 from conans.server.service.common.common import CommonService
 from conans.server.service.mime import get_mime_type
 from conans.server.store.server_store import ServerStore
-from conans.util.files import mkdir
+from conans.util.files import load, mkdir
 
 
 class ConanServiceV2(CommonService):
@@ -71,6 +72,31 @@ class ConanServiceV2(CommonService):
             raise PackageNotFoundException(pref, print_rev=True)
         return tmp
 
+    def get_packages_info(self, prefs, auth_user):
+        """ For every package reference returns its conaninfo.txt contents, and its latest
+        package revision if it doesn't have one. None for the packages not found
+        """
+        ret = []
+        for pref in prefs:
+            self._authorizer.check_read_conan(auth_user, pref.ref)
+            if pref.revision is None:
+                latest = self._server_store.get_last_package_revision(pref)
+                if not latest:
+                    ret.append(None)
+                    continue
+                pref = pref.copy_with_revs(pref.ref.revision, latest.revision)
+                revision_time = latest.time
+            else:
+                revision_time = self._server_store.get_package_revision_time(pref)
+            path = self._server_store.get_package_file_path(pref, CONANINFO)
+            if not self._server_store.path_exists(path):
+                ret.append(None)
+                continue
+            ret.append({"revision": pref.revision,
+                        "time": revision_time,
+                        "conaninfo": load(path)})
+        return ret
+
     # PACKAGE METHODS
     def get_package_file_list(self, pref, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
@@ -1,7 +1,9 @@
 import os
+import shutil
 import unittest
 
-from conans.test.utils.tools import TestClient
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import GenConanfile, TestClient
 from conans.util.files import load
 
 
@@ -90,3 +92,24 @@ class ConfigTest(unittest.TestCase):
     def missing_subarguments_test(self):
         self.client.run("config", assert_error=True)
         self.assertIn("ERROR: Exiting with code: 2", self.client.out)
+
+    def catalog_test(self):
+        self.client.save({"conanfile.py": GenConanfile()})
+        self.client.run("create . lib/1.0@user/testing")
+        self.client.run("config catalog --verify")
+        self.assertNotIn("lib/1.0@user/testing", self.client.out)
+
+        # Copied without conan commands
+        ref = ConanFileReference.loads("lib/1.0@user/testing")
+        new_ref = ConanFileReference.loads("lib/2.0@user/testing")
+        shutil.copytree(self.client.cache.package_layout(ref).base_folder(),
+                        self.client.cache.package_layout(new_ref).base_folder())
+        self.client.run("config catalog --verify", assert_error=True)
+        self.assertIn("lib/2.0@user/testing: Missing in the recipes catalog", self.client.out)
+        self.assertIn("ERROR: The recipes catalog is not up to date", self.client.out)
+
+        self.client.run("config catalog")
+        self.assertIn("Recipes catalog rebuilt", self.client.out)
+        self.client.run("config catalog --verify")
+        self.client.run("search lib")
+        self.assertIn("lib/2.0@user/testing", self.client.out)
@@ -7,7 +7,7 @@ from conans.model.info import ConanInfo
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import CONANFILE, CONANFILE_TXT, CONANINFO
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
-from conans.test.utils.tools import TestClient, TestServer
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
 from conans.util.files import load, mkdir, rmdir
 from conans.test.utils.conanfile import TestConanFile
 
@@ -102,6 +102,36 @@ class MyPkg(ConanFile):
         client.run("install Pkg/0.1@lasote/testing")
         self.assertIn("Running system requirements!!", client.out)
 
+    def test_install_parallel_download(self):
+        servers = {"default": TestServer()}
+        client = TestClient(servers=servers, users={"default": [("lasote", "mypass")]})
+        client.save({"conanfile.py": GenConanfile().with_package_file("file.h", "header")})
+        for name in ("PkgA", "PkgB", "PkgC"):
+            client.run("create . %s/0.1@lasote/testing" % name)
+        consumer = GenConanfile()
+        for name in ("PkgA", "PkgB", "PkgC"):
+            consumer.with_requirement(ConanFileReference.loads("%s/0.1@lasote/testing" % name))
+        client.save({"conanfile.py": consumer})
+        client.run("upload * --all --confirm")
+        client.run('remove "*" -f')
+
+        client.run("install . --parallel=2")
+        self.assertIn("Downloading 3 binary packages in 2 parallel threads", client.out)
+        for name in ("PkgA", "PkgB", "PkgC"):
+            self.assertIn("%s/0.1@lasote/testing: Package installed" % name, client.out)
+            pkg_folder = client.cache.package_layout(
+                ConanFileReference.loads("%s/0.1@lasote/testing" % name)).packages()
+            package_id = os.listdir(pkg_folder)[0]
+            self.assertEqual("header", load(os.path.join(pkg_folder, package_id, "file.h")))
+
+        # Configuration is also used, and everything already installed
+        client.run('remove "*" -f')
+        client.run("config set general.parallel_download=3")
+        client.run("install .")
+        self.assertIn("Downloading 3 binary packages in 3 parallel threads", client.out)
+        client.run("install .")
+        self.assertNotIn("parallel threads", client.out)
+
     def install_transitive_pattern_test(self):
         # Make sure a simple conan install doesn't fire package_info() so self.package_folder breaks
         client = TestClient()
@@ -4,7 +4,9 @@ import unittest
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
 from conans.test.utils.test_files import uncompress_packaged_files
-from conans.test.utils.tools import TestClient, TestServer
+from conans.test.utils.tools import GenConanfile, NO_SETTINGS_PACKAGE_ID, TestClient, TestServer
+from conans.util.compression import zstd_available
+from conans.util.files import load
 
 
 class UploadCompressionTest(unittest.TestCase):
@@ -107,3 +109,35 @@ class UploadCompressionTest(unittest.TestCase):
     def _assert_library_files(self, path):
         libraries = os.listdir(os.path.join(path, "lib"))
         self.assertEqual(len(libraries), 1)
+
+    @unittest.skipUnless(zstd_available(), "Requires zstandard")
+    def upload_zstd_test(self):
+        self.client.save({"conanfile.py": GenConanfile().with_package_file("include/hello.h",
+                                                                            "hello")})
+        self.client.run("create . Hello0/0.1@lasote/stable")
+        self.client.run("config set general.compression_format=zstd")
+        self.client.run("config set general.compression_threads=2")
+        self.client.run("upload Hello0/0.1@lasote/stable --all")
+        self.assertIn("Uploading conan_package.tzst", self.client.out)
+        self.assertNotIn("conan_package.tgz", self.client.out)
+
+        client2 = TestClient(servers=self.servers, users={"default": [("lasote", "mypass")]})
+        client2.run("install Hello0/0.1@lasote/stable")
+        self.assertIn("Hello0/0.1@lasote/stable: Package installed", client2.out)
+        ref = ConanFileReference.loads("Hello0/0.1@lasote/stable")
+        pref = PackageReference(ref, NO_SETTINGS_PACKAGE_ID)
+        package_folder = client2.cache.package_layout(ref).package(pref)
+        self.assertEqual("hello", load(os.path.join(package_folder, "include/hello.h")))
+        self.assertFalse(os.path.exists(os.path.join(package_folder, "conan_package.tzst")))
+
+        # Falls back to gzip if the remote doesn't have the capability
+        server = TestServer(server_capabilities=[])
+        client3 = TestClient(servers={"default": server},
+                             users={"default": [("lasote", "mypass")]})
+        client3.run("config set general.compression_format=zstd")
+        client3.save({"conanfile.py": GenConanfile()})
+        client3.run("create . Hello0/0.1@lasote/stable")
+        client3.run("upload Hello0/0.1@lasote/stable --all")
+        self.assertIn("WARN: Remote 'default' doesn't support 'zstd' compression, using 'gzip'",
+                      client3.out)
+        self.assertIn("Uploading conan_package.tgz", client3.out)
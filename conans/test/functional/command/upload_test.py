@@ -1,7 +1,9 @@
+import json
 import os
 import platform
 import stat
 import unittest
+import textwrap
 from collections import OrderedDict
 
 import itertools
@@ -17,7 +19,7 @@ from conans.test.utils.conanfile import TestConanFile
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
 from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient, TestServer, \
     TurboTestClient, GenConanfile
-from conans.util.files import gzopen_without_timestamps, is_dirty, save
+from conans.util.files import gzopen_without_timestamps, is_dirty, load, save
 
 conanfile = """from conans import ConanFile
 class MyPkg(ConanFile):
@@ -701,6 +703,59 @@ class Pkg(ConanFile):
             self.assertIn("Recipe is up to date, upload skipped", client2.out)
             self.assertNotIn("WARN", client2.out)
 
+    def test_upload_parallel(self):
+        client = self._client()
+        client.save({"conanfile.py": GenConanfile().with_option("shared", [True, False])
+                                                   .with_default_option("shared", False)
+                                                   .with_package_file("file.h", "header")})
+        for name in ("PkgA", "PkgB", "PkgC"):
+            client.run("create . %s/0.1@lasote/testing" % name)
+            client.run("create . %s/0.1@lasote/testing -o %s:shared=True" % (name, name))
+
+        client.run("upload * --all --confirm --parallel=2 --json=upload.json")
+        self.assertIn("Uploading 3 references in 2 parallel threads", client.out)
+        uploaded = json.loads(load(os.path.join(client.current_folder, "upload.json")))["uploaded"]
+        # Results are recorded in the same order as a serial upload
+        self.assertEqual(["PkgA/0.1@lasote/testing", "PkgB/0.1@lasote/testing",
+                          "PkgC/0.1@lasote/testing"], [item["recipe"]["id"] for item in uploaded])
+        for item in uploaded:
+            self.assertEqual(2, len(item["packages"]))
+
+        client2 = self._client()
+        for name in ("PkgA", "PkgB", "PkgC"):
+            client2.run("install %s/0.1@lasote/testing" % name)
+            client2.run("install %s/0.1@lasote/testing -o %s:shared=True" % (name, name))
+            self.assertIn("%s/0.1@lasote/testing: Package installed" % name, client2.out)
+
+        # Configuration is also used, nothing to upload
+        client.run("config set general.parallel_upload=3")
+        client.run("upload * --all --confirm")
+        self.assertIn("Uploading 3 references in 3 parallel threads", client.out)
+        self.assertEqual(3, str(client.out).count("Recipe is up to date, upload skipped"))
+        self.assertEqual(6, str(client.out).count("Package is up to date, upload skipped"))
+
+    def test_upload_parallel_package_hooks_order(self):
+        client = self._client()
+        client.save({"conanfile.py": GenConanfile().with_option("shared", [True, False])
+                                                   .with_default_option("shared", False)})
+        client.run("create . Pkg/0.1@lasote/testing")
+        client.run("create . Pkg/0.1@lasote/testing -o Pkg:shared=True")
+        save(os.path.join(client.cache.hooks_path, "my_hook.py"), textwrap.dedent("""
+            def pre_upload_package(output, package_id, **kwargs):
+                output.info("Before compressing %s" % package_id)
+            """))
+        client.run("config set hooks.my_hook")
+
+        client.run("upload Pkg/0.1@lasote/testing --all --confirm --parallel=2")
+        out = str(client.out)
+        for index in (1, 2):
+            uploading = out.index("Uploading package %d/2: " % index)
+            package_id = out[uploading:].split()[3]
+            hook = out.index("pre_upload_package(): Before compressing %s" % package_id)
+            compressing = out.index("Compressing package...", uploading)
+            self.assertLess(uploading, hook)
+            self.assertLess(hook, compressing)
+
     def upload_with_pref_and_query_test(self):
         client = self._client()
         client.save({"conanfile.py": conanfile})
@@ -0,0 +1,131 @@
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import unittest
+
+import six
+from mock import patch
+
+import conans
+from conans.client.command import ERROR_GENERAL
+from conans.client.daemon import ConanDaemon, daemon_supported, forward_command
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save
+
+_DAEMON = textwrap.dedent("""
+    import sys
+    from conans.client.daemon import ConanDaemon
+    ConanDaemon(sys.argv[1]).serve(max_commands=int(sys.argv[2]))
+    """)
+
+_CLIENT = textwrap.dedent("""
+    import sys
+    from conans.conan import run
+    sys.argv = ["conan"] + sys.argv[1:]
+    run()
+    """)
+
+
+@unittest.skipUnless(daemon_supported(), "Needs unix sockets with file descriptors passing")
+class ConanDaemonTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = temp_folder()
+        self.socket_path = os.path.join(self.folder, "conan.sock")
+        self.env = dict(os.environ)
+        self.env["CONAN_USER_HOME"] = os.path.join(self.folder, "home")
+        repo_folder = os.path.dirname(os.path.dirname(os.path.abspath(conans.__file__)))
+        self.env["PYTHONPATH"] = os.pathsep.join([repo_folder, self.env.get("PYTHONPATH", "")])
+        self.env["PYTHONWARNINGS"] = "ignore"
+        self.env["CONAN_DAEMON_SOCKET"] = self.socket_path
+
+    def _launch(self, max_commands):
+        daemon = subprocess.Popen([sys.executable, "-c", _DAEMON, self.socket_path,
+                                   str(max_commands)], env=self.env,
+                                  stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        for _ in range(100):
+            if os.path.exists(self.socket_path):
+                break
+            time.sleep(0.1)
+        self.assertTrue(os.path.exists(self.socket_path))
+        return daemon
+
+    def _conan(self, *args):
+        process = subprocess.Popen([sys.executable, "-c", _CLIENT] + list(args), env=self.env,
+                                   cwd=self.folder, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT)
+        out, _ = process.communicate()
+        return process.returncode, out.decode()
+
+    def test_forward_commands(self):
+        daemon = self._launch(max_commands=6)
+
+        ret, out = self._conan("--version")
+        self.assertEqual(0, ret)
+        self.assertIn("Conan version %s" % conans.__version__, out)
+
+        # The current directory of the client is used
+        save(os.path.join(self.folder, "conanfile.py"), textwrap.dedent("""
+            from conans import ConanFile
+
+            class Pkg(ConanFile):
+                name = "pkg"
+                version = "0.1"
+
+                def build(self):
+                    print("BUILDING IN DAEMON")
+                    self.run("echo RUNNING IN DAEMON")
+            """))
+        ret, out = self._conan("create", ".", "user/testing")
+        self.assertEqual(0, ret, out)
+        self.assertIn("BUILDING IN DAEMON", out)
+        self.assertIn("RUNNING IN DAEMON", out)
+
+        # The changes in the configuration are used
+        ret, out = self._conan("config", "set", "general.my_value=1")
+        self.assertEqual(0, ret, out)
+        ret, out = self._conan("config", "get", "general.my_value")
+        self.assertEqual(0, ret, out)
+        self.assertEqual("1", out.strip())
+        conan_conf = os.path.join(self.folder, "home", ".conan", "conan.conf")
+        save(conan_conf, load(conan_conf).replace("my_value = 1", "my_value = 2"))
+        ret, out = self._conan("config", "get", "general.my_value")
+        self.assertEqual("2", out.strip())
+
+        # And the errors are returned
+        ret, out = self._conan("config", "get", "general.missing_value")
+        self.assertEqual(1, ret)
+        self.assertIn("'missing_value' doesn't exist in [general]", out)
+
+        # All the commands have been run by the daemon, that finishes after them
+        daemon.communicate()
+        self.assertEqual(0, daemon.returncode)
+        self.assertFalse(os.path.exists(self.socket_path))
+
+    def test_no_daemon(self):
+        ret, out = self._conan("--version")
+        self.assertEqual(0, ret)
+        self.assertIn("Conan version %s" % conans.__version__, out)
+
+    def test_other_users_rejected(self):
+        daemon = ConanDaemon(self.socket_path)
+        with patch("conans.client.daemon._peer_uid", return_value=os.getuid() + 1):
+            thread = threading.Thread(target=daemon.serve, kwargs={"max_commands": 1})
+            thread.start()
+            try:
+                for _ in range(100):
+                    if os.path.exists(self.socket_path):
+                        break
+                    time.sleep(0.1)
+                # Only the user of the daemon can connect
+                self.assertEqual(0, os.stat(self.socket_path).st_mode & 0o077)
+                with patch("sys.stderr", new_callable=six.StringIO) as stderr:
+                    ret = forward_command(self.socket_path, ["--version"])
+            finally:
+                thread.join(10)
+        self.assertEqual(ERROR_GENERAL, ret)
+        self.assertIn("only runs the commands of its user", stderr.getvalue())
+        self.assertFalse(thread.is_alive())
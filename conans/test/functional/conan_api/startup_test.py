@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+import unittest
+
+from nose.plugins.attrib import attr
+
+import conans
+from conans.test.utils.test_files import temp_folder
+
+_RUN_COMMAND = textwrap.dedent("""
+    import json, sys
+    from conans.client.command import main
+    try:
+        main(sys.argv[1:])
+    except SystemExit:
+        pass
+    modules = ["conans.client.tools", "conans.client.graph.graph_manager",
+               "conans.client.remote_manager", "conans.client.build.cmake", "requests"]
+    sys.stderr.write(json.dumps([m for m in modules if m in sys.modules]))
+    """)
+
+
+class StartupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.env = dict(os.environ)
+        self.env["CONAN_USER_HOME"] = temp_folder()
+        repo_folder = os.path.dirname(os.path.dirname(os.path.abspath(conans.__file__)))
+        self.env["PYTHONPATH"] = os.pathsep.join([repo_folder, self.env.get("PYTHONPATH", "")])
+        self.env["PYTHONWARNINGS"] = "ignore"
+        self._run("profile", "list")  # Migrates the new cache and creates the default files
+
+    def _run(self, *args):
+        process = subprocess.Popen([sys.executable, "-c", _RUN_COMMAND] + list(args),
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self.env)
+        out, err = process.communicate()
+        return out.decode(), json.loads(err.decode().splitlines()[-1])
+
+    def test_lazy_imports(self):
+        # The commands not using recipes or remotes don't import them
+        for args in (["--version"], ["config", "get", "general.default_profile"],
+                     ["profile", "list"]):
+            out, modules = self._run(*args)
+            self.assertTrue(out, "Running %s" % args)
+            self.assertEqual([], modules, "Running %s" % args)
+
+    @attr("slow")
+    def test_startup_time(self):
+        # Every run of the "conan --version" command imported everything, about 0.35 seconds
+        times = []
+        for _ in range(5):
+            start = time.time()
+            out, _ = self._run("--version")
+            times.append(time.time() - start)
+            self.assertIn("Conan version %s" % conans.__version__, out)
+        self.assertLess(min(times), 2)
@@ -1,17 +1,23 @@
 # coding=utf-8
 
+import json
 import os
+import socket
+import struct
+import threading
 import unittest
 
 import six
 from mock import Mock
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
 
-from conans.client.conan_api import Conan
+from conans.client.conan_api import Conan, api_method
 from conans.client.tools import environment_append
 from conans.client.tools.files import replace_in_file, save
 from conans.errors import ConanException
 from conans.paths import CACERT_FILE
 from conans.test.utils.tools import TestBufferConanOutput, temp_folder
+from conans.util.files import load
 from conans.client.rest.conan_requester import ConanRequester
 from conans.client.cache.cache import ClientCache
 
@@ -84,3 +90,180 @@ class ConanRequesterCacertPathTests(unittest.TestCase):
         requester.get(url="aaa", verify=True)
         self.assertEqual(mocked_requester.verify, cache.config.cacert_path)
         self.assertEqual(cache.config.cacert_path, default_cacert_path)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class _Socks5Proxy(object):
+    """ Minimal SOCKS5 proxy (no authentication, IPv4 CONNECT only) counting its connections
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(5)
+        self.url = "socks5://127.0.0.1:%s" % self._server.getsockname()[1]
+        thread = threading.Thread(target=self._serve)
+        thread.daemon = True
+        thread.start()
+
+    def close(self):
+        self._server.close()
+
+    def _serve(self):
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except (OSError, socket.error):
+                return
+            self.connections += 1
+            thread = threading.Thread(target=self._handle, args=(client, ))
+            thread.daemon = True
+            thread.start()
+
+    @staticmethod
+    def _recv(sock, size):
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise socket.error("Connection closed")
+            data += chunk
+        return data
+
+    def _handle(self, client):
+        try:
+            _, methods = struct.unpack("BB", self._recv(client, 2))
+            self._recv(client, methods)
+            client.sendall(b"\x05\x00")
+            _, _, _, address_type = struct.unpack("BBBB", self._recv(client, 4))
+            assert address_type == 1, "Only IPv4 addresses"
+            host = socket.inet_ntoa(self._recv(client, 4))
+            port = struct.unpack(">H", self._recv(client, 2))[0]
+            upstream = socket.create_connection((host, port))
+            client.sendall(b"\x05\x00\x00\x01" + b"\x00" * 6)
+        except Exception:
+            client.close()
+            return
+
+        def pipe(source, target):
+            try:
+                while True:
+                    data = source.recv(8192)
+                    if not data:
+                        break
+                    target.sendall(data)
+            except (OSError, socket.error):
+                pass
+            try:  # Closing would not wake up the other direction, blocked reading
+                target.shutdown(socket.SHUT_WR)
+            except (OSError, socket.error):
+                pass
+
+        thread = threading.Thread(target=pipe, args=(upstream, client))
+        thread.daemon = True
+        thread.start()
+        pipe(client, upstream)
+
+
+class ConanRequesterConnectionPoolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = "http://127.0.0.1:%s/" % self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connection_reuse(self):
+        cache = ClientCache(temp_folder(), TestBufferConanOutput())
+        requester = ConanRequester(cache.config)
+        for _ in range(3):
+            response = requester.get(self.url)
+            self.assertEqual(response.content, b"ok")
+        self.assertEqual(requester.connection_stats.misses, 1)
+        self.assertEqual(requester.connection_stats.hits, 2)
+        self.assertEqual(str(requester.connection_stats), "2 hits, 1 misses")
+
+    def test_connection_reuse_traced(self):
+        @api_method
+        def get_twice(api):
+            for _ in range(2):
+                api._requester.get(self.url)
+
+        conan_user_home = temp_folder()
+        trace_file = os.path.join(conan_user_home, "trace.log")
+        with environment_append({"CONAN_USER_HOME": conan_user_home,
+                                 "CONAN_TRACE_FILE": trace_file}):
+            conan_api, _, _ = Conan.factory()
+            try:
+                conan_api._requester.get(self.url)  # Outside of a command, not traced
+                get_twice(conan_api)
+            finally:
+                # The kept alive connection would block the shutdown of the test server
+                conan_api._requester._http_requester.close()
+        actions = [json.loads(line) for line in load(trace_file).splitlines()]
+        connections = [a for a in actions if a["_action"] == "HTTP_CONNECTIONS"]
+        self.assertEqual(1, len(connections))
+        self.assertEqual((2, 0), (connections[0]["hits"], connections[0]["misses"]))
+
+    def test_pool_size(self):
+        cache = ClientCache(temp_folder(), TestBufferConanOutput())
+        requester = ConanRequester(cache.config)
+        adapter = requester._http_requester.get_adapter(self.url)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 10)
+
+        with environment_append({"CONAN_PARALLEL_UPLOAD": "8",
+                                 "CONAN_HTTP_POOL_CONNECTIONS": "3"}):
+            requester = ConanRequester(cache.config)
+        adapter = requester._http_requester.get_adapter(self.url)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+        self.assertEqual(adapter._pool_connections, 3)
+
+        with environment_append({"CONAN_HTTP_POOL_MAXSIZE": "2"}):
+            requester = ConanRequester(cache.config)
+        adapter = requester._http_requester.get_adapter(self.url)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 2)
+
+        with environment_append({"CONAN_HTTP_POOL_MAXSIZE": "0"}):
+            with six.assertRaisesRegex(self, ConanException, "'http_pool_maxsize'"):
+                ConanRequester(cache.config)
+
+    def test_socks_proxy(self):
+        try:
+            import socks  # noqa: the SOCKS support of requests needs PySocks
+        except ImportError:
+            raise unittest.SkipTest("PySocks not installed")
+        proxy = _Socks5Proxy()
+        try:
+            cache = ClientCache(temp_folder(), TestBufferConanOutput())
+            cache.config.set_item("proxies.http", proxy.url)
+            requester = ConanRequester(cache.config)
+            try:
+                for _ in range(3):
+                    response = requester.get(self.url)
+                    self.assertEqual(response.content, b"ok")
+            finally:
+                # The kept alive connection would block the shutdown of the test server
+                requester._http_requester.close()
+            self.assertEqual(proxy.connections, 1)
+            self.assertEqual(requester.connection_stats.misses, 1)
+            self.assertEqual(requester.connection_stats.hits, 2)
+        finally:
+            proxy.close()
@@ -5,11 +5,68 @@ from collections import OrderedDict
 from parameterized import parameterized
 
 from conans.paths import CONANFILE
-from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient, TestServer, \
-    inc_package_manifest_timestamp, inc_recipe_manifest_timestamp
+from conans.test.utils.tools import GenConanfile, NO_SETTINGS_PACKAGE_ID, TestClient, \
+    TestRequester, TestServer, inc_package_manifest_timestamp, inc_recipe_manifest_timestamp
 from conans.util.files import load
 
 
+class _SearchRecordingRequester(TestRequester):
+    searches = []
+
+    def get(self, url, **kwargs):
+        if "/search" in url:
+            self.searches.append(url)
+        return super(_SearchRecordingRequester, self).get(url, **kwargs)
+
+
+class VersionRangesRemoteSearchTest(unittest.TestCase):
+
+    def setUp(self):
+        _SearchRecordingRequester.searches = []
+        self.servers = OrderedDict([("remote1", TestServer()), ("remote2", TestServer()),
+                                    ("remote3", TestServer())])
+        users = {name: [("lasote", "mypass")] for name in self.servers}
+        client = TestClient(servers=self.servers, users=users)
+        client.save({"conanfile.py": GenConanfile()})
+        for version, remote in (("1.1", "remote2"), ("1.2", "remote3")):
+            client.run("create . Pkg/%s@lasote/testing" % version)
+            client.run("upload Pkg/%s@lasote/testing -r=%s --all" % (version, remote))
+        self.client = TestClient(servers=self.servers, users=users,
+                                 requester_class=_SearchRecordingRequester)
+        self.client.save({"conanfile.txt": "[requires]\nPkg/[~1]@lasote/testing"})
+
+    def test_first_remote_wins(self):
+        self.client.run("install .")
+        # The first remote with results wins, even if all of them are searched
+        self.assertIn("Pkg/1.1@lasote/testing: Retrieving package", self.client.out)
+        self.assertEqual(3, len(_SearchRecordingRequester.searches))
+
+    def test_ttl(self):
+        self.client.run("config set general.remote_search_ttl=300")
+        self.client.run("install .")
+        self.assertEqual(3, len(_SearchRecordingRequester.searches))
+
+        self.client.run("remove Pkg* -f")
+        self.client.run("install .")
+        self.assertIn("Pkg/1.1@lasote/testing: Retrieving package", self.client.out)
+        # Reused, and the remotes after the first one with results are not searched
+        self.assertEqual(3, len(_SearchRecordingRequester.searches))
+
+        self.client.run("install . --update")
+        self.assertEqual(6, len(_SearchRecordingRequester.searches))
+
+        # Uploading to a remote forgets its searches
+        self.client.run("upload Pkg/1.1@lasote/testing -r=remote1 --all")
+        self.client.run("remove Pkg* -f")
+        self.client.run("install .")
+        self.assertEqual(7, len(_SearchRecordingRequester.searches))
+
+        self.client.run("config set general.remote_search_ttl=0")
+        self.client.run("remove Pkg* -f")
+        self.client.run("install .")
+        self.assertEqual(10, len(_SearchRecordingRequester.searches))
+
+
 class VersionRangesUpdatingTest(unittest.TestCase):
 
     def update_test(self):
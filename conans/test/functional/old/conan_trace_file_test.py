@@ -5,7 +5,7 @@ import unittest
 from conans.client import tools
 from conans.client.runner import ConanRunner
 from conans.model.ref import ConanFileReference
-from conans.paths import RUN_LOG_NAME
+from conans.paths import EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, RUN_LOG_NAME
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
 from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestClient, TestServer,\
@@ -71,6 +71,27 @@ class HelloConan(ConanFile):
         self.assertNotIn("Packaged 1 '.log' file: conan_run.log", output)
         self.assertFalse(os.path.exists(log_file_packaged))
 
+    def test_trace_package_download(self):
+        # The API v2 extracts the packages while they are downloaded
+        client = TestClient(servers=self.servers,
+                            users={"default": [("lasote", "mypass")]}, revisions_enabled=True)
+        ref = ConanFileReference.loads("Hello0/0.1@lasote/stable")
+        client.save(cpp_hello_conan_files("Hello0", "0.1", build=False))
+        client.run("create . lasote/stable")
+        client.run("upload %s --all" % str(ref))
+        client.run("remove %s -f" % str(ref))
+        trace_file = os.path.join(temp_folder(), "conan_trace.log")
+        with tools.environment_append({"CONAN_TRACE_FILE": trace_file}):
+            client.run("install %s" % str(ref))
+
+        actions = [json.loads(line) for line in load(trace_file).splitlines()]
+        unzips = [action for action in actions if action["_action"] == "UNZIP"]
+        self.assertEqual([EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME],
+                         [os.path.basename(action["src"]) for action in unzips])
+        self.assertEqual(client.cache.package_layout(ref).packages(),
+                         os.path.dirname(unzips[1]["dst"]))
+        self.assertGreater(unzips[1]["duration"], 0)
+
     def test_trace_actions(self):
         client = TestClient(servers=self.servers,
                             users={"default": [("lasote", "mypass")]})
@@ -1,8 +1,14 @@
 import os
 import platform
+import time
 import unittest
 
+from mock import patch
+
+from conans.client import file_copier
 from conans.client.file_copier import FileCopier
+from conans.client.tools import environment_append
+from conans.errors import ConanException
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import load, save
 
@@ -171,3 +177,76 @@ class FileCopierTest(unittest.TestCase):
         copier = FileCopier([folder1], folder2)
         copier("*.txt", excludes=("*Test*.txt", "*Impl*"))
         self.assertEqual(['MyLib.txt'], os.listdir(folder2))
+
+    def multiple_patterns_test(self):
+        folder1 = temp_folder()
+        save(os.path.join(folder1, "include/header.h"), "")
+        save(os.path.join(folder1, "include/header.hpp"), "")
+        save(os.path.join(folder1, "include/source.cpp"), "")
+        save(os.path.join(folder1, "src/other.h"), "")
+        folder2 = temp_folder()
+        copier = FileCopier([folder1], folder2)
+        copied = copier(["*.h", "*.hpp"], src="include")
+        self.assertEqual(set([os.path.join(folder2, "header.h"),
+                              os.path.join(folder2, "header.hpp")]), set(copied))
+        self.assertEqual(set(['header.h', 'header.hpp']), set(os.listdir(folder2)))
+
+    def cached_walk_test(self):
+        folder1 = temp_folder()
+        save(os.path.join(folder1, "include/header.h"), "")
+        save(os.path.join(folder1, "lib/mylib.lib"), "")
+        # The folders modified in the last seconds are always listed again
+        past = time.time() - 10
+        for folder in (folder1, os.path.join(folder1, "include"), os.path.join(folder1, "lib")):
+            os.utime(folder, (past, past))
+        folder2 = temp_folder()
+        copier = FileCopier([folder1], folder2)
+        copier("*.h", "include", "include")
+        with patch.object(file_copier, "walk", wraps=file_copier.walk) as walk_mock:
+            copier("*.lib", "lib", "lib")
+            # Only "lib" is listed, "include" was already walked and didn't change
+            copier("*.h", "include2", "include")
+            self.assertEqual([os.path.join(folder1, "lib")],
+                             [c[0][0] for c in walk_mock.call_args_list])
+
+        # The new files are found
+        save(os.path.join(folder1, "include/header2.h"), "")
+        save(os.path.join(folder1, "include/sub/header3.h"), "")
+        copier("*.h", "include3", "include")
+        self.assertEqual(set(['header.h', 'header2.h', 'sub']),
+                         set(os.listdir(os.path.join(folder2, "include3"))))
+        self.assertEqual(['header3.h'], os.listdir(os.path.join(folder2, "include3/sub")))
+
+    def copy_strategy_test(self):
+        folder1 = temp_folder()
+        save(os.path.join(folder1, "include/header.h"), "header")
+        save(os.path.join(folder1, "lib/mylib.lib"), "mylib")
+        os.chmod(os.path.join(folder1, "lib/mylib.lib"), 0o444)
+
+        folder2 = temp_folder()
+        with environment_append({"CONAN_COPY_STRATEGY": "reflink"}):
+            copier = FileCopier([folder1], folder2, hardlinks=True)
+            copier("*")
+        self.assertEqual("header", load(os.path.join(folder2, "include/header.h")))
+        self.assertEqual("mylib", load(os.path.join(folder2, "lib/mylib.lib")))
+        # Depending on the file system the files are reflinked or copied
+        self.assertEqual(11, copier.copied_bytes["copy"] + copier.copied_bytes["reflink"])
+        self.assertEqual([], copier.hardlinked_files)
+
+        if platform.system() != "Windows":
+            folder2 = temp_folder()
+            with environment_append({"CONAN_COPY_STRATEGY": "hardlink"}):
+                copier = FileCopier([folder1], folder2, hardlinks=True)
+                copier("*")
+            # Only the read-only files are hardlinked
+            mylib = os.path.join(folder2, "lib", "mylib.lib")
+            self.assertEqual([mylib], copier.hardlinked_files)
+            self.assertTrue(os.path.samefile(os.path.join(folder1, "lib/mylib.lib"), mylib))
+            self.assertFalse(os.path.samefile(os.path.join(folder1, "include/header.h"),
+                                              os.path.join(folder2, "include/header.h")))
+            self.assertEqual(5, copier.copied_bytes["hardlink"])
+
+        with environment_append({"CONAN_COPY_STRATEGY": "symlink"}):
+            with self.assertRaises(ConanException) as cm:
+                FileCopier([folder1], temp_folder())
+            self.assertIn("Invalid copy strategy 'symlink'", str(cm.exception))
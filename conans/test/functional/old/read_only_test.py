@@ -1,4 +1,6 @@
 import os
+import platform
+import stat
 import unittest
 
 from conans.model.ref import ConanFileReference, PackageReference
@@ -34,6 +36,26 @@ class MyPkg(ConanFile):
         os.chmod(path, 0o777)
         save(path, "Bye World")
 
+    @unittest.skipIf(platform.system() == "Windows", "Needs hardlinks of read-only files")
+    def import_hardlink_test(self):
+        self.client.run("config set general.copy_strategy=hardlink")
+        self.client.save({"conanfile.txt": "[requires]\nPkg/0.1@lasote/channel\n"
+                                           "[imports]\n., *.h -> ."}, clean_first=True)
+        self.client.run("install .")
+        self.assertIn("Copied 0B, 0B reflinked and 9B hardlinked (not copied)", self.client.out)
+        pref = PackageReference(ConanFileReference.loads("Pkg/0.1@lasote/channel"),
+                                NO_SETTINGS_PACKAGE_ID)
+        path = os.path.join(self.client.cache.package_layout(pref.ref).package(pref), "myheader.h")
+        imported = os.path.join(self.client.current_folder, "myheader.h")
+        self.assertTrue(os.path.samefile(path, imported))
+        # The imported file is not made writable, it would make writable the package one
+        self.assertFalse(os.stat(imported).st_mode & stat.S_IWRITE)
+
+        # The imports can be repeated
+        self.client.run("install .")
+        self.assertTrue(os.path.samefile(path, imported))
+        self.assertIn("9B hardlinked", self.client.out)
+
     def remove_test(self):
         self.client.run("search")
         self.assertIn("Pkg/0.1@lasote/channel", self.client.out)
@@ -0,0 +1,89 @@
+import textwrap
+import unittest
+
+from conans import COMPLEX_SEARCH_CAPABILITY, REVISIONS
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import GenConanfile, NO_SETTINGS_PACKAGE_ID, TestClient, \
+    TestRequester, TestServer
+
+
+class _RecordingRequester(TestRequester):
+    calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(("GET", url))
+        return super(_RecordingRequester, self).get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        self.calls.append(("POST", url))
+        return super(_RecordingRequester, self).post(url, **kwargs)
+
+
+class BulkPackagesInfoTest(unittest.TestCase):
+
+    server_capabilities = None
+
+    def setUp(self):
+        _RecordingRequester.calls = []
+        self.servers = {"default": TestServer(write_permissions=[("*/*@*/*", "*")],
+                                              server_capabilities=self.server_capabilities)}
+        client = TestClient(servers=self.servers, revisions_enabled=True)
+        client.save({"conanfile.py": GenConanfile()})
+        for name in ("liba", "libb", "libc"):
+            client.run("create . %s/1.0@user/testing" % name)
+        client.run("upload * --all --confirm")
+
+    def _consumer(self):
+        client = TestClient(servers=self.servers, requester_class=_RecordingRequester,
+                            revisions_enabled=True)
+        client.save({"conanfile.txt": textwrap.dedent("""
+            [requires]
+            liba/1.0@user/testing
+            libb/1.0@user/testing
+            libc/1.0@user/testing
+            """)})
+        return client
+
+    def test_single_request(self):
+        client = self._consumer()
+        client.run("install .")
+
+        posts = [url for method, url in _RecordingRequester.calls if method == "POST"]
+        self.assertEqual(1, len(posts))
+        self.assertTrue(posts[0].endswith("/v2/conans/packages/info"))
+        # No request for the latest package revisions, and the conaninfo files are only
+        # downloaded with the rest of the package files
+        urls = [url for _, url in _RecordingRequester.calls]
+        self.assertFalse([url for url in urls if "/packages/" in url and url.endswith("/latest")])
+        self.assertEqual(3, len([url for url in urls if url.endswith("conaninfo.txt")]))
+        for name in ("liba", "libb", "libc"):
+            self.assertIn("%s/1.0@user/testing:%s - Download" % (name, NO_SETTINGS_PACKAGE_ID),
+                          client.out)
+
+    def test_missing_package(self):
+        client = TestClient(servers=self.servers, revisions_enabled=True)
+        ref = ConanFileReference.loads("libb/1.0@user/testing")
+        client.run("remove %s -p -r=default -f" % ref.full_repr())
+
+        client = self._consumer()
+        client.run("install .", assert_error=True)
+        self.assertIn("libb/1.0@user/testing:%s - Missing" % NO_SETTINGS_PACKAGE_ID, client.out)
+        self.assertIn("liba/1.0@user/testing:%s - Download" % NO_SETTINGS_PACKAGE_ID, client.out)
+
+
+class ConcurrentPackagesInfoTest(BulkPackagesInfoTest):
+    server_capabilities = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]
+
+    def test_single_request(self):
+        client = self._consumer()
+        client.run("install .")
+
+        self.assertFalse([url for method, url in _RecordingRequester.calls if method == "POST"])
+        # A single request per package, even if they were retrieved before evaluating the nodes
+        urls = [url for _, url in _RecordingRequester.calls]
+        self.assertEqual(3, len([url for url in urls
+                                 if "/packages/" in url and url.endswith("/latest")]))
+        self.assertEqual(6, len([url for url in urls if url.endswith("conaninfo.txt")]))
+        for name in ("liba", "libb", "libc"):
+            self.assertIn("%s/1.0@user/testing:%s - Download" % (name, NO_SETTINGS_PACKAGE_ID),
+                          client.out)
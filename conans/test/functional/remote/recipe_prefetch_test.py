@@ -0,0 +1,58 @@
+import textwrap
+import unittest
+
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import GenConanfile, TestClient, TestRequester, TestServer
+
+
+class _RecordingRequester(TestRequester):
+    calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        return super(_RecordingRequester, self).get(url, **kwargs)
+
+
+class RecipePrefetchTest(unittest.TestCase):
+
+    def setUp(self):
+        _RecordingRequester.calls = []
+        self.servers = {"default": TestServer(write_permissions=[("*/*@*/*", "*")])}
+        client = TestClient(servers=self.servers)
+        client.save({"conanfile.py": GenConanfile()})
+        for name in ("liba", "libb", "libc"):
+            client.run("create . %s/1.0@user/testing" % name)
+        liba = ConanFileReference.loads("liba/1.0@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_requirement(liba)})
+        client.run("create . libd/1.0@user/testing")
+        client.run("upload * --all --confirm")
+
+    def test_prefetch(self):
+        client = TestClient(servers=self.servers, requester_class=_RecordingRequester)
+        client.save({"conanfile.txt": textwrap.dedent("""
+            [requires]
+            libd/1.0@user/testing
+            libb/1.0@user/testing
+            libc/1.0@user/testing
+            """)})
+        client.run("install .")
+
+        # Every recipe is downloaded once, and reported in the order of the graph expansion
+        self.assertEqual(4, len([url for url in _RecordingRequester.calls
+                                 if "/export/conanfile.py" in url]))
+        positions = [str(client.out).index("%s/1.0@user/testing: Downloaded recipe" % name)
+                     for name in ("libd", "liba", "libb", "libc")]
+        self.assertEqual(sorted(positions), positions)
+        for name in ("liba", "libb", "libc", "libd"):
+            self.assertIn("%s/1.0@user/testing: Retrieving package" % name, client.out)
+
+    def test_prefetch_missing(self):
+        client = TestClient(servers=self.servers)
+        client.save({"conanfile.txt": textwrap.dedent("""
+            [requires]
+            liba/1.0@user/testing
+            missing/1.0@user/testing
+            """)})
+        client.run("install .", assert_error=True)
+        self.assertIn("liba/1.0@user/testing: Downloaded recipe", client.out)
+        self.assertIn("ERROR: Unable to find 'missing/1.0@user/testing' in remotes", client.out)
@@ -112,3 +112,19 @@ class RetryDownloadTests(unittest.TestCase):
         counter = Counter(output_lines)
         self.assertEqual(counter["ERROR: 500 Server Error: content"], 2)
         self.assertEqual(counter["Waiting 0 seconds to retry..."], 2)
+
+    def test_retry_sends_whole_file(self):
+        class _RequesterMock:
+            retry = 0
+            retry_wait = 0
+            bodies = []
+
+            def put(self, *args, **kwargs):
+                self.bodies.append(b"".join(kwargs["data"]))
+                return response_type(500 if len(self.bodies) == 1 else 200, "content")
+
+        requester = _RequesterMock()
+        uploader = FileUploader(requester=requester, output=TestBufferConanOutput(),
+                                verify=False)
+        uploader.upload(url="fake", abs_path=self.filename, retry=2)
+        self.assertEqual([b"anything", b"anything"], requester.bodies)
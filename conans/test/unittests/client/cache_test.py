@@ -3,12 +3,14 @@
 import os
 import unittest
 
+from mock import patch
 from six import StringIO
 
 from conans.client.cache.cache import ClientCache
 from conans.client.output import ConanOutput
 from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference, PackageReference
+from conans.model.settings import Settings
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import mkdir
 from conans.util.files import save
@@ -68,3 +70,18 @@ class CacheTest(unittest.TestCase):
             metadata.packages[pref2.id].revision = "prevision"
 
         self.assertTrue(layout2.package_exists(pref2))
+
+    def test_settings(self):
+        self.cache.settings  # Creates the default settings.yml
+        settings = self.cache.settings
+        settings.os = "Windows"
+        # The settings.yml is not parsed again, and the returned settings are independent
+        with patch.object(Settings, "loads") as loads_mock:
+            other_settings = self.cache.settings
+            self.assertFalse(loads_mock.called)
+        self.assertIsNone(other_settings.os.value)
+        self.assertEqual("Windows", settings.os.value)
+
+        save(self.cache.settings_path, "os: [Windows, Linux]")
+        self.assertEqual(["os"], self.cache.settings.fields)
+        self.assertEqual(["Linux", "Windows"], self.cache.settings.os.values_range)
@@ -0,0 +1,116 @@
+import datetime
+import os
+import textwrap
+import unittest
+
+from mock import Mock, patch
+
+from conans.client.cache import compiled_recipes
+from conans.client.cache.compiled_recipes import CompiledRecipesCache
+from conans.client.graph.python_requires import ConanPythonRequire
+from conans.client.loader import ConanFileLoader
+from conans.paths import CONANFILE, DATA_YML
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+class CompiledRecipesCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = CompiledRecipesCache(temp_folder())
+        self.path = os.path.join(temp_folder(), CONANFILE)
+
+    def _run(self, source):
+        code = self.cache.code(self.path, source)
+        namespace = {}
+        exec(code, namespace)
+        return namespace["value"]
+
+    def test_code(self):
+        self.assertEqual(1, self._run(b"value = 1"))
+        with patch.object(compiled_recipes, "compile") as compile_mock:
+            self.assertEqual(1, self._run(b"value = 1"))
+            self.assertFalse(compile_mock.called)
+        self.assertEqual(2, self._run(b"value = 2"))
+        self.assertEqual(1, self._run(b"value = 1"))
+
+        # The compiled code is also by path, for the tracebacks
+        code = self.cache.code(self.path, b"value = 1")
+        self.assertEqual(self.path, code.co_filename)
+        other_path = os.path.join(temp_folder(), CONANFILE)
+        self.assertEqual(other_path, self.cache.code(other_path, b"value = 1").co_filename)
+
+    def test_corrupted(self):
+        self.cache.code(self.path, b"value = 1")
+        folder = self.cache._folder
+        for entry in os.listdir(folder):
+            with open(os.path.join(folder, entry), "r+b") as handle:
+                handle.truncate(60)
+        self.assertEqual(1, self._run(b"value = 1"))
+
+    def test_data(self):
+        data_path = os.path.join(temp_folder(), DATA_YML)
+        contents = b"sources:\n  '1.0':\n    url: http://myurl\n"
+        self.assertEqual({"sources": {"1.0": {"url": "http://myurl"}}},
+                         self.cache.data(data_path, contents))
+        with patch("yaml.safe_load") as load_mock:
+            self.assertEqual({"sources": {"1.0": {"url": "http://myurl"}}},
+                             self.cache.data(data_path, contents))
+            self.assertFalse(load_mock.called)
+
+        # Values that cannot be stored are parsed every time
+        self.assertEqual({"date": datetime.date(2019, 6, 1)},
+                         self.cache.data(data_path, b"date: 2019-06-01"))
+        self.assertEqual({"date": datetime.date(2019, 6, 1)},
+                         self.cache.data(data_path, b"date: 2019-06-01"))
+        self.assertIsNone(self.cache.data(data_path, b""))
+
+    def test_prune(self):
+        save(self.path, "value = 1")
+        self.cache.code(self.path, b"value = 1")
+        self.cache.prune()
+        self.assertEqual(2, len(os.listdir(self.cache._folder)))  # With the file of the prune
+        os.remove(self.path)
+        self.cache.prune()
+        self.assertEqual([".pruned"], os.listdir(self.cache._folder))
+
+
+class CompiledRecipesLoaderTest(unittest.TestCase):
+
+    def test_load_class(self):
+        cache = CompiledRecipesCache(temp_folder())
+        folder = temp_folder()
+        conanfile_path = os.path.join(folder, CONANFILE)
+        save(conanfile_path, textwrap.dedent("""
+            import os
+            from conans import ConanFile
+
+            class Pkg(ConanFile):
+                folder = os.path.dirname(__file__)
+            """))
+        save(os.path.join(folder, DATA_YML), "value: 42")
+
+        def load_class():
+            loader = ConanFileLoader(None, Mock(), ConanPythonRequire(None, None),
+                                     compiled_recipes=cache)
+            return loader.load_class(conanfile_path)
+
+        conanfile = load_class()
+        self.assertEqual(folder, conanfile.folder)
+        self.assertEqual({"value": 42}, conanfile.conan_data)
+        with patch.object(compiled_recipes, "compile") as compile_mock:
+            conanfile = load_class()
+            self.assertFalse(compile_mock.called)
+        self.assertEqual(folder, conanfile.folder)
+        self.assertEqual({"value": 42}, conanfile.conan_data)
+
+        save(conanfile_path, textwrap.dedent("""
+            from conans import ConanFile
+
+            class Pkg(ConanFile):
+                folder = "changed"
+            """))
+        save(os.path.join(folder, DATA_YML), "value: 43")
+        conanfile = load_class()
+        self.assertEqual("changed", conanfile.folder)
+        self.assertEqual({"value": 43}, conanfile.conan_data)
@@ -0,0 +1,60 @@
+import os
+import unittest
+
+from mock import patch
+
+from conans.client.cache import entries_cache
+from conans.client.cache.entries_cache import EntriesCache
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save
+
+
+class _SourcesCache(EntriesCache):
+    """ The entries just contain the path they were computed from
+    """
+
+    def _entry_source(self, entry_path):
+        return load(entry_path)
+
+    def add(self, name, source):
+        self._save(os.path.join(self._folder, name + ".txt"), source)
+
+
+class EntriesCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = _SourcesCache(os.path.join(temp_folder(), "entries"))
+        self.sources = [os.path.join(temp_folder(), "file%d.txt" % i) for i in range(3)]
+        for source in self.sources:
+            save(source, "contents")
+
+    def _entries(self):
+        return sorted(os.listdir(self.cache._folder))
+
+    def test_prune(self):
+        self.cache.add("entry0", self.sources[0])
+        self.cache.add("entry1", self.sources[1])
+        self.cache.add("unknown", "")
+        save(os.path.join(self.cache._folder, "entry2.txt.1234"), "")  # Other process writing it
+        self.assertEqual([".pruned", "entry0.txt", "entry1.txt", "entry2.txt.1234",
+                          "unknown.txt"], self._entries())
+
+        os.remove(self.sources[1])
+        self.cache.prune()
+        self.assertEqual([".pruned", "entry0.txt", "entry2.txt.1234"], self._entries())
+
+    def test_prune_when_saving(self):
+        # The first entry doesn't prune, the interval starts
+        self.cache.add("entry0", self.sources[0])
+        os.remove(self.sources[0])
+        self.cache.add("entry1", self.sources[1])
+        self.assertEqual([".pruned", "entry0.txt", "entry1.txt"], self._entries())
+
+        with patch.object(entries_cache, "_PRUNE_INTERVAL", 0):
+            self.cache.add("entry2", self.sources[2])
+        self.assertEqual([".pruned", "entry1.txt", "entry2.txt"], self._entries())
+
+    def test_save_error(self):
+        with patch.object(entries_cache, "save_atomic", side_effect=OSError("Failed")):
+            self.cache.add("entry0", self.sources[0])
+        self.assertFalse(os.path.exists(self.cache._folder))
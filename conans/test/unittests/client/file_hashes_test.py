@@ -0,0 +1,130 @@
+import os
+import shutil
+import unittest
+
+from mock import patch
+
+from conans.client.cache import file_hashes
+from conans.client.cache.file_hashes import FileHashesCache
+from conans.model.manifest import FileTreeManifest
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, md5sum, mkdir, save
+
+
+class FileHashesCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        # The hashes of the files modified in the last seconds are not stored
+        resolution = patch.object(file_hashes, "_TIME_RESOLUTION", -10)
+        resolution.start()
+        self.addCleanup(resolution.stop)
+        self.cache = FileHashesCache(temp_folder())
+        self.folder = temp_folder()
+        self.files = {}
+        for name in ("file1.txt", "sub/file2.txt", "sub/file3.bin"):
+            path = os.path.join(self.folder, name)
+            save(path, "contents of %s" % name)
+            self.files[name] = path
+
+    def _md5sums(self, files=None):
+        with patch.object(file_hashes, "md5sum", wraps=md5sum) as md5sum_mock:
+            result = self.cache.md5sums(self.folder, files or self.files)
+        hashed = sorted(os.path.relpath(c[0][0], self.folder) for c in md5sum_mock.call_args_list)
+        return result, [h.replace("\\", "/") for h in hashed]
+
+    def test_md5sums(self):
+        expected = {name: md5sum(path) for name, path in self.files.items()}
+        self.assertEqual((expected, sorted(self.files)), self._md5sums())
+        self.assertEqual((expected, []), self._md5sums())
+
+        # Only the modified files are hashed again
+        save(self.files["sub/file2.txt"], "new contents")
+        expected["sub/file2.txt"] = md5sum(self.files["sub/file2.txt"])
+        self.assertEqual((expected, ["sub/file2.txt"]), self._md5sums())
+        self.assertEqual((expected, []), self._md5sums())
+
+        # Replaced by other file with the same size and mtime
+        path = self.files["file1.txt"]
+        file_stat = os.stat(path)
+        os.remove(path)
+        save(path, "contents of file9.txt")
+        os.utime(path, (file_stat.st_atime, file_stat.st_mtime))
+        expected["file1.txt"] = md5sum(path)
+        self.assertEqual((expected, ["file1.txt"]), self._md5sums())
+
+    def test_recently_modified(self):
+        self.assertEqual(sorted(self.files), self._md5sums()[1])
+        # Modified in the last seconds, they could change again without changing the mtime
+        save(self.files["file1.txt"], "new contents")
+        with patch.object(file_hashes, "_TIME_RESOLUTION", 2):
+            self.assertEqual(["file1.txt"], self._md5sums()[1])
+            self.assertEqual(["file1.txt"], self._md5sums()[1])
+
+    def test_corrupted(self):
+        self.cache.md5sums(self.folder, self.files)
+        for entry in os.listdir(self.cache._folder):
+            save(os.path.join(self.cache._folder, entry), "{corrupted")
+        self.assertEqual(sorted(self.files), self._md5sums()[1])
+
+    def test_prune(self):
+        self.cache.md5sums(self.folder, self.files)
+        self.cache.prune()
+        self.assertEqual(2, len(os.listdir(self.cache._folder)))  # With the file of the prune
+        shutil.rmtree(self.folder)
+        self.cache.prune()
+        self.assertEqual([".pruned"], os.listdir(self.cache._folder))
+
+    def test_threads(self):
+        for index in range(4):
+            path = os.path.join(self.folder, "big%s.bin" % index)
+            save(path, os.urandom(512 * 1024))
+            self.files["big%s.bin" % index] = path
+        expected = {name: md5sum(path) for name, path in self.files.items()}
+        self.assertEqual(expected, self.cache.md5sums(self.folder, self.files))
+        self.assertEqual(expected, self.cache.md5sums(self.folder, self.files))
+
+    def test_copied(self):
+        self.cache.md5sums(self.folder, self.files)
+        for _ in range(2):  # As every export, the copies are new files
+            dst_folder = temp_folder()
+            copies = {}
+            for name, path in self.files.items():
+                copies[name] = os.path.join(dst_folder, name)
+                mkdir(os.path.dirname(copies[name]))
+                shutil.copy2(path, copies[name])
+            self.cache.copied(self.folder, {copies[n]: self.files[n] for n in self.files})
+            save(copies["file1.txt"], "modified after the copy")
+            with patch.object(file_hashes, "md5sum", wraps=md5sum) as md5sum_mock:
+                result = self.cache.md5sums(dst_folder, copies)
+            self.assertEqual({name: md5sum(path) for name, path in copies.items()}, result)
+            self.assertEqual([copies["file1.txt"]],
+                             [c[0][0] for c in md5sum_mock.call_args_list])
+
+    def test_copied_restored_mtime(self):
+        for path in self.files.values():
+            os.utime(path, (1500000000, 1500000000))  # Restored exactly, without the ns
+        self.cache.md5sums(self.folder, self.files)
+        dst_folder = temp_folder()
+        copies = {}
+        for name, path in self.files.items():
+            copies[name] = os.path.join(dst_folder, name)
+            mkdir(os.path.dirname(copies[name]))
+            shutil.copy2(path, copies[name])
+        self.cache.copied(self.folder, {copies[n]: self.files[n] for n in self.files})
+        # Modified with the same size, restoring the mtime, the copy and the origin
+        for path in (copies["file1.txt"], self.files["sub/file2.txt"]):
+            save(path, load(path).upper())
+            os.utime(path, (1500000000, 1500000000))
+
+        with patch.object(file_hashes, "md5sum", wraps=md5sum) as md5sum_mock:
+            result = self.cache.md5sums(dst_folder, copies)
+        self.assertEqual({name: md5sum(path) for name, path in copies.items()}, result)
+        self.assertEqual(sorted([copies["file1.txt"], copies["sub/file2.txt"]]),
+                         sorted(c[0][0] for c in md5sum_mock.call_args_list))
+
+    def test_manifest(self):
+        save(os.path.join(self.folder, "conanmanifest.txt"), "")
+        expected = FileTreeManifest.create(self.folder, self.folder)
+        for _ in range(2):
+            manifest = FileTreeManifest.create(self.folder, self.folder, file_hashes=self.cache)
+            self.assertEqual(expected.file_sums, manifest.file_sums)
@@ -1,4 +1,11 @@
+import random
+import sys
+import time
 import unittest
+from collections import OrderedDict
+
+from mock import patch
+from nose.plugins.attrib import attr
 
 from conans.client.graph.graph_builder import DepsGraph, Node
 from conans.model.conan_file import ConanFile
@@ -23,6 +30,36 @@ class DepsGraphTest(unittest.TestCase):
 
         self.assertNotEqual(n1, n2)
 
+    def test_connected_closures_by_graph(self):
+        graphs = []
+        for _ in range(2):
+            deps = DepsGraph()
+            nodes = [Node(ConanFileReference.loads("Hello%d/1.0@user/stable" % i), i)
+                     for i in range(3)]
+            for node in nodes:
+                node.public_closure = OrderedDict([(node.name, node)])
+                node.public_deps = {node.name: node}
+                deps.add_node(node)
+            graphs.append(nodes)
+        n1, n2, n3 = graphs[0]
+        n2.connect_closure(n3)
+        n1.connect_public_closure(n2)
+        self.assertIs(n3, n1.public_closure["Hello2"])
+
+        # The changes of other graphs don't invalidate the connected closures
+        other = graphs[1][1]
+        other.private = True
+        other.make_public()
+        with patch.object(Node, "connect_closure") as connect:
+            n1.connect_public_closure(n2)
+            self.assertFalse(connect.called)
+        # The changes of the same graph do
+        n3.private = True
+        n3.make_public()
+        with patch.object(Node, "connect_closure") as connect:
+            n1.connect_public_closure(n2)
+            self.assertTrue(connect.called)
+
     def basic_levels_test(self):
         ref1 = ConanFileReference.loads("Hello/1.0@user/stable")
         ref2 = ConanFileReference.loads("Hello/2.0@user/stable")
@@ -109,3 +146,91 @@ class DepsGraphTest(unittest.TestCase):
         deps.add_edge(n2, n32)
         deps.add_edge(n32, n5)
         self.assertEqual([[n5, n31], [n32], [n2], [n1]], deps.by_levels())
+
+
+def _random_graph(size, seed=1):
+    rand = random.Random(seed)
+    deps = DepsGraph()
+    nodes = [Node(ConanFileReference.loads("Hello%d/1.0@user/stable" % i), i)
+             for i in range(size)]
+    for node in nodes:
+        deps.add_node(node)
+    for i, node in enumerate(nodes[:-1]):
+        for _ in range(3):
+            deps.add_edge(node, nodes[rand.randint(i + 1, min(size - 1, i + 50))])
+    return deps
+
+
+def _scan_levels(deps, direct):
+    # Every level scanning all the remaining nodes, to check the computed levels
+    result = []
+    opened = deps.nodes
+    while opened:
+        level = [o for o in opened
+                 if not any(n in opened
+                            for n in (o.neighbors() if direct else o.inverse_neighbors()))]
+        level.sort()
+        result.append(level)
+        opened = opened.difference(level)
+    return result
+
+
+class DepsGraphLevelsTest(unittest.TestCase):
+
+    def test_levels(self):
+        deps = _random_graph(300)
+        self.assertEqual(_scan_levels(deps, True), deps.by_levels())
+        self.assertEqual(_scan_levels(deps, False), deps.inverse_levels())
+        self.assertEqual([n for level in deps.by_levels() for n in level],
+                         list(deps.ordered_iterate()))
+
+    def test_cached_levels(self):
+        deps = _random_graph(20)
+        levels = deps.by_levels()
+        levels[0].append("mutated")
+        with patch.object(DepsGraph, "_compute_levels") as compute:
+            self.assertEqual(_scan_levels(deps, True), deps.by_levels())
+            self.assertFalse(compute.called)
+
+        # Adding nodes or edges invalidates the levels, also if it is done in a build-requires
+        # subgraph sharing the version of the graph
+        root = Node(ConanFileReference.loads("Root/1.0@user/stable"), "root")
+        deps.add_node(root)
+        self.assertIn(root, deps.by_levels()[0])
+        subgraph = DepsGraph()
+        subgraph.version = deps.version
+        subgraph.nodes = {root, deps.root}
+        subgraph.add_edge(root, deps.root)
+        self.assertEqual(_scan_levels(deps, True), deps.by_levels())
+        deps.nodes.update([Node(ConanFileReference.loads("Other/1.0@user/stable"), "other")])
+        self.assertEqual(_scan_levels(deps, False), deps.inverse_levels())
+
+        # Other graphs don't invalidate them
+        levels = deps.by_levels()
+        other = _random_graph(20)
+        with patch.object(DepsGraph, "_compute_levels") as compute:
+            other.add_edge(other.root, list(other.nodes)[1])
+            self.assertEqual(levels, deps.by_levels())
+            self.assertFalse(compute.called)
+
+    @attr("slow")
+    def test_levels_performance(self):
+        # Scanning the remaining nodes in every level took several seconds for 5000 nodes. The
+        # times are reported, they depend on the machine
+        for size in (1000, 5000, 10000):
+            deps = _random_graph(size)
+            start = time.time()
+            levels = deps.by_levels()
+            inverse_levels = deps.inverse_levels()
+            sys.stdout.write("Levels of %d nodes: %.3f seconds\n" % (size, time.time() - start))
+            for _ in range(10):
+                self.assertEqual(levels, deps.by_levels())
+                self.assertEqual(inverse_levels, deps.inverse_levels())
+            self.assertEqual(size, sum(len(level) for level in levels))
+            # Every node is in the level after the last one of its neighbors
+            for ordered, direct in ((levels, True), (inverse_levels, False)):
+                index = {node: i for i, level in enumerate(ordered) for node in level}
+                for node in deps.nodes:
+                    neighbors = node.neighbors() if direct else node.inverse_neighbors()
+                    expected = max(index[n] for n in neighbors) + 1 if neighbors else 0
+                    self.assertEqual(expected, index[node])
@@ -0,0 +1,77 @@
+import os
+import unittest
+
+from mock import patch
+
+from conans.client.cache import metadata_cache
+from conans.client.cache.metadata_cache import PackageMetadataCache
+from conans.errors import RecipeNotFoundException
+from conans.model.ref import ConanFileReference
+from conans.paths.package_layouts.package_cache_layout import PackageCacheLayout
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load
+
+
+class PackageMetadataCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        # The files modified in the last seconds are read again
+        resolution = patch.object(metadata_cache, "_TIME_RESOLUTION", -10)
+        resolution.start()
+        self.addCleanup(resolution.stop)
+        self.ref = ConanFileReference.loads("pkg/0.1@user/channel")
+        self.cache = PackageMetadataCache()
+        self.layout = PackageCacheLayout(temp_folder(), self.ref, short_paths=False,
+                                         no_lock=True, metadata_cache=self.cache)
+        with self.layout.update_metadata() as metadata:
+            metadata.recipe.revision = "rrev"
+            metadata.packages["pid1"].revision = "prev1"
+
+    def _load_metadata(self):
+        with patch.object(metadata_cache, "load", wraps=load) as load_mock:
+            metadata = self.layout.load_metadata()
+        return metadata, load_mock.call_count
+
+    def test_load(self):
+        metadata, loads = self._load_metadata()
+        self.assertEqual(1, loads)
+        self.assertEqual("rrev", metadata.recipe.revision)
+        self.assertEqual("prev1", metadata.packages["pid1"].revision)
+
+        # The cached metadata is not modified through the returned objects
+        metadata.recipe.properties["key"] = "value"
+        metadata.packages["pid2"].revision = "prev2"
+        metadata, loads = self._load_metadata()
+        self.assertEqual(0, loads)
+        self.assertEqual({}, metadata.recipe.properties)
+        self.assertEqual(["pid1"], list(metadata.packages))
+
+        with self.layout.update_metadata() as metadata:
+            metadata.packages["pid2"].revision = "prev2"
+        metadata, loads = self._load_metadata()
+        self.assertEqual(1, loads)
+        self.assertEqual("prev2", metadata.packages["pid2"].revision)
+        self.assertEqual(0, self._load_metadata()[1])
+
+    def test_recently_modified(self):
+        self.assertEqual(1, self._load_metadata()[1])
+        with patch.object(metadata_cache, "_TIME_RESOLUTION", 2):
+            with self.layout.update_metadata() as metadata:
+                metadata.recipe.remote = "remote"
+            self.assertEqual(1, self._load_metadata()[1])
+            self.assertEqual(1, self._load_metadata()[1])
+
+    def test_removed(self):
+        self.layout.load_metadata()
+        os.remove(self.layout.package_metadata())
+        with self.assertRaises(RecipeNotFoundException):
+            self.layout.load_metadata()
+
+    def test_update_unchanged(self):
+        with patch("conans.paths.package_layouts.package_cache_layout.save") as save_mock:
+            with self.layout.update_metadata() as metadata:
+                metadata.packages["pid1"].revision = "prev1"
+            self.assertFalse(save_mock.called)
+            with self.layout.update_metadata() as metadata:
+                metadata.packages["pid1"].remote = "remote"
+            self.assertTrue(save_mock.called)
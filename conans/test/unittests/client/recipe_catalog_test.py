@@ -0,0 +1,82 @@
+import os
+import unittest
+
+from mock import patch
+
+from conans.client.cache import catalog
+from conans.client.cache.catalog import RecipeCatalog
+from conans.model.ref import ConanFileReference
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, mkdir, rmdir
+
+
+class RecipeCatalogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_folder = temp_folder()
+        self.store = os.path.join(self.cache_folder, "data")
+        for ref in ("zlib/1.2.11@conan/stable", "zlib/1.2.8@conan/stable",
+                    "openssl/1.0.2@conan/stable", "Boost/1.70.0@conan/stable"):
+            self._create(ref)
+
+    def _create(self, ref):
+        mkdir(os.path.join(self.store, ConanFileReference.loads(ref).dir_repr(), "export"))
+
+    def _refs(self, name=None, ignorecase=False):
+        return [str(ref) for ref in RecipeCatalog(self.cache_folder, self.store).refs(name,
+                                                                                      ignorecase)]
+
+    def test_refs(self):
+        self.assertEqual(["Boost/1.70.0@conan/stable", "openssl/1.0.2@conan/stable",
+                          "zlib/1.2.11@conan/stable", "zlib/1.2.8@conan/stable"], self._refs())
+        self.assertEqual(["zlib/1.2.11@conan/stable", "zlib/1.2.8@conan/stable"],
+                         self._refs("zlib"))
+        self.assertEqual([], self._refs("boost"))
+        self.assertEqual(["Boost/1.70.0@conan/stable"], self._refs("boost", ignorecase=True))
+        self.assertEqual([], self._refs("missing"))
+        self.assertTrue(os.path.exists(os.path.join(self.cache_folder, catalog.CATALOG_FILE)))
+
+    def test_modified_store(self):
+        self.assertEqual(2, len(self._refs("zlib")))
+        self._create("zlib/1.2.11@other/testing")
+        self._create("bzip2/1.0.8@conan/stable")
+        rmdir(os.path.join(self.store, "zlib", "1.2.8"))
+        self.assertEqual(["zlib/1.2.11@conan/stable", "zlib/1.2.11@other/testing"],
+                         self._refs("zlib"))
+        self.assertIn("bzip2/1.0.8@conan/stable", self._refs())
+        rmdir(os.path.join(self.store, "openssl"))
+        self.assertNotIn("openssl/1.0.2@conan/stable", self._refs())
+
+    @patch.object(catalog, "_RACY_SECONDS", -60)  # Trust the mtimes of the new folders
+    def test_no_scan(self):
+        recipe_catalog = RecipeCatalog(self.cache_folder, self.store)
+        self.assertEqual(2, len(recipe_catalog.refs("zlib")))
+        with patch.object(RecipeCatalog, "_scan_name") as scan:
+            self.assertEqual(2, len(RecipeCatalog(self.cache_folder, self.store).refs("zlib")))
+            self.assertFalse(scan.called)
+
+        self._create("zlib/1.2.9@conan/stable")
+        self.assertEqual(3, len(RecipeCatalog(self.cache_folder, self.store).refs("zlib")))
+
+    def test_rebuild(self):
+        recipe_catalog = RecipeCatalog(self.cache_folder, self.store)
+        recipe_catalog.refs()
+        self._create("bzip2/1.0.8@conan/stable")
+        rmdir(os.path.join(self.store, "openssl"))
+
+        missing, stale = recipe_catalog.rebuild(verify=True)
+        self.assertEqual(["bzip2/1.0.8@conan/stable"], [str(ref) for ref in missing])
+        self.assertEqual(["openssl/1.0.2@conan/stable"], [str(ref) for ref in stale])
+
+        recipe_catalog.rebuild()
+        self.assertEqual(([], []), recipe_catalog.rebuild(verify=True))
+
+    def test_save_error(self):
+        self.assertEqual(4, len(self._refs()))
+        stored = load(os.path.join(self.cache_folder, catalog.CATALOG_FILE))
+        self._create("bzip2/1.0.8@conan/stable")
+        with patch.object(catalog, "save_atomic", side_effect=OSError("Read-only")):
+            self.assertEqual(5, len(self._refs()))
+        # The previous catalog is kept, never half written
+        self.assertEqual(stored, load(os.path.join(self.cache_folder, catalog.CATALOG_FILE)))
+        self.assertEqual(5, len(self._refs()))
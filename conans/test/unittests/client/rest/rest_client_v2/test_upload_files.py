@@ -0,0 +1,81 @@
+# coding=utf-8
+
+import os
+import threading
+import time
+import unittest
+from collections import namedtuple
+
+import six
+
+from conans.client.rest.rest_client_v2 import RestV2Methods
+from conans.errors import ConanException
+from conans.model.ref import PackageReference
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestBufferConanOutput
+from conans.util.files import save
+
+
+class _MockRequester(object):
+    retry = 0
+    retry_wait = 0
+
+    def __init__(self, fail=None):
+        self.uploaded = []
+        self._fail = fail
+        self._lock = threading.Lock()
+
+    def put(self, url, data, **kwargs):
+        time.sleep(0.05)
+        filename = url.rsplit("/", 1)[-1]
+        content = b"".join(data)
+        status = 500 if filename == self._fail else 201
+        with self._lock:
+            self.uploaded.append((filename, content))
+        response = namedtuple("response", "status_code raise_for_status")
+        if status != 201:
+            def raise_for_status():
+                raise Exception("Server error uploading %s" % filename)
+        else:
+            def raise_for_status():
+                pass
+        return response(status, raise_for_status)
+
+
+class UploadFilesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        folder = temp_folder()
+        self.files = {}
+        for filename in ("conan_package.tgz", "conaninfo.txt", "conanmanifest.txt"):
+            self.files[filename] = os.path.join(folder, filename)
+            save(self.files[filename], "contents of %s" % filename)
+        self.pref = PackageReference.loads("lib/1.0@user/channel#rrev:123#prev")
+
+    def test_compressed_files_land_first(self):
+        requester = _MockRequester()
+        output = TestBufferConanOutput()
+        v2 = RestV2Methods("http://some.url", token=None, custom_headers={}, output=output,
+                           requester=requester, verify_ssl=None)
+        v2._upload_package(self.pref, self.files, retry=0, retry_wait=0)
+
+        uploaded = [filename for filename, _ in requester.uploaded]
+        self.assertEqual(uploaded[0], "conan_package.tgz")
+        self.assertEqual(sorted(uploaded[1:]), ["conaninfo.txt", "conanmanifest.txt"])
+        for filename, content in requester.uploaded:
+            self.assertEqual(content, ("contents of %s" % filename).encode())
+        # The output is deterministic, whatever the order the transfers finished
+        lines = [line for line in str(output).splitlines() if line.startswith("Uploading")]
+        self.assertEqual(lines, ["Uploading conan_package.tgz", "Uploading conaninfo.txt",
+                                 "Uploading conanmanifest.txt"])
+
+    def test_failed_compressed_file_skips_metadata(self):
+        requester = _MockRequester(fail="conan_package.tgz")
+        output = TestBufferConanOutput()
+        v2 = RestV2Methods("http://some.url", token=None, custom_headers={}, output=output,
+                           requester=requester, verify_ssl=None)
+        with six.assertRaisesRegex(self, ConanException, "failed files: conan_package.tgz"):
+            v2._upload_package(self.pref, self.files, retry=0, retry_wait=0)
+
+        self.assertEqual([filename for filename, _ in requester.uploaded], ["conan_package.tgz"])
+        self.assertIn("Error uploading file: conan_package.tgz", output)
@@ -1,13 +1,17 @@
+import io
+import os
+import tarfile
 import tempfile
 import unittest
 from collections import namedtuple
 
 import six
 
-from conans.client.rest.uploader_downloader import FileUploader
-from conans.errors import AuthenticationException, ForbiddenException
+from conans.client.rest.uploader_downloader import ExtractionError, FileDownloader, FileUploader
+from conans.errors import AuthenticationException, ConanConnectionError, ForbiddenException
+from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestBufferConanOutput
-from conans.util.files import save
+from conans.util.files import gzopen_without_timestamps, load, save
 
 
 class UploaderUnitTest(unittest.TestCase):
@@ -61,3 +65,79 @@ class UploaderUnitTest(unittest.TestCase):
         save(f, "some contents")
         with six.assertRaisesRegex(self, ForbiddenException, "tururu"):
             uploader.upload("fake_url", f, auth=auth)
+
+
+class _MockResponse(object):
+    ok = True
+    status_code = 200
+
+    def __init__(self, content, fail=False):
+        self.headers = {"content-length": str(len(content))}
+        self._content = content
+        self._fail = fail
+
+    def iter_content(self, chunk_size):
+        # A failing response returns half of the content, then the connection is lost
+        end = len(self._content) // 2 if self._fail else len(self._content)
+        for i in range(0, end, chunk_size):
+            yield self._content[i:min(i + chunk_size, end)]
+        if self._fail:
+            raise IOError("Connection lost")
+
+    def close(self):
+        pass
+
+
+class _MockRequester(object):
+    retry = 2
+    retry_wait = 0
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = 0
+
+    def get(self, *args, **kwargs):
+        response = self.responses[min(self.calls, len(self.responses) - 1)]
+        self.calls += 1
+        return response
+
+
+class DownloaderExtractTest(unittest.TestCase):
+
+    def setUp(self):
+        self.files = {"lib/file%d.a" % i: os.urandom(200 * 1024) for i in range(4)}
+        buffer = io.BytesIO()
+        tgz = gzopen_without_timestamps("conan_package.tgz", mode="w", fileobj=buffer)
+        for filename, content in sorted(self.files.items()):
+            info = tarfile.TarInfo(name=filename)
+            info.size = len(content)
+            tgz.addfile(tarinfo=info, fileobj=io.BytesIO(content))
+        tgz.close()
+        self.tgz = buffer.getvalue()
+        self.folder = temp_folder()
+        save(os.path.join(self.folder, "conaninfo.txt"), "info")
+
+    def _download(self, requester):
+        downloader = FileDownloader(requester, TestBufferConanOutput(), verify=False)
+        downloader.download("fake_url", extract_folder=self.folder)
+
+    def test_retry_connection_error(self):
+        requester = _MockRequester([_MockResponse(self.tgz, fail=True), _MockResponse(self.tgz)])
+        self._download(requester)
+        self.assertEqual(requester.calls, 2)
+        for filename, content in self.files.items():
+            self.assertEqual(content, load(os.path.join(self.folder, filename), binary=True))
+
+        requester = _MockRequester([_MockResponse(self.tgz, fail=True)])
+        with six.assertRaisesRegex(self, ConanConnectionError, "Connection lost"):
+            self._download(requester)
+        self.assertEqual(requester.calls, 3)
+        # The files of the failed extraction are removed, not the other ones in the folder
+        self.assertEqual(os.listdir(self.folder), ["conaninfo.txt"])
+
+    def test_extraction_error_not_retried(self):
+        requester = _MockRequester([_MockResponse(b"not a tgz file" * 1000)])
+        with six.assertRaisesRegex(self, ExtractionError, "Error while downloading/extracting"):
+            self._download(requester)
+        self.assertEqual(requester.calls, 1)
+        self.assertEqual(os.listdir(self.folder), ["conaninfo.txt"])
@@ -1,11 +1,16 @@
+import hashlib
 import os
 import time
 import unittest
 
+import six
+from mock import patch
+
 from conans.client.cmd.uploader import compress_files
 from conans.paths import PACKAGE_TGZ_NAME
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import md5sum, mkdir, path_exists, save
+from conans.util.files import load, md5sum, mkdir, path_exists, remember_checksums, save, \
+    save_atomic, sha1sum
 
 
 class FilesTest(unittest.TestCase):
@@ -39,6 +44,60 @@ class FilesTest(unittest.TestCase):
 
         self.assertEqual(md5_a, md5_b)
 
+    def test_compress_checksums(self):
+        """
+        The checksums computed while compressing are the ones of the contents on disk
+        """
+        folder = temp_folder()
+        save(os.path.join(folder, "one_file.txt"), b"The contents")
+        files = {"one_file.txt": os.path.join(folder, "one_file.txt")}
+
+        tgz_path = compress_files(files, {}, PACKAGE_TGZ_NAME, dest_dir=folder)
+        with patch("conans.util.files.open", create=True) as open_mock:
+            known_sha1 = sha1sum(tgz_path)
+            known_md5 = md5sum(files["one_file.txt"])
+            self.assertFalse(open_mock.called)
+        self.assertEqual(known_sha1, hashlib.sha1(load(tgz_path, binary=True)).hexdigest())
+        self.assertEqual(known_md5, hashlib.md5(b"The contents").hexdigest())
+
+        # If the file changes, its checksum is computed again
+        save(files["one_file.txt"], b"Other contents!")
+        self.assertEqual(md5sum(files["one_file.txt"]),
+                         hashlib.md5(b"Other contents!").hexdigest())
+
+    def test_known_checksums_bounded(self):
+        folder = temp_folder()
+        paths = [os.path.join(folder, "file%d.txt" % i) for i in range(3)]
+        for path in paths:
+            save(path, b"contents")
+        with patch("conans.util.files._MAX_KNOWN_CHECKSUMS", 2):
+            for path in paths:
+                remember_checksums(path, {"md5": "known"})
+        # The oldest one is forgotten, and computed again
+        self.assertEqual(md5sum(paths[0]), hashlib.md5(b"contents").hexdigest())
+        self.assertEqual(md5sum(paths[1]), "known")
+        self.assertEqual(md5sum(paths[2]), "known")
+
+        # Any change of the file discards it, even if the mtime and the size are the same
+        file_stat = os.stat(paths[2])
+        os.chmod(paths[2], file_stat.st_mode)  # ctime changes, nothing else
+        remember_checksums(paths[2], {"md5": "known"}, file_stat)
+        self.assertEqual(md5sum(paths[2]), hashlib.md5(b"contents").hexdigest())
+
+    def test_save_atomic(self):
+        folder = temp_folder()
+        path = os.path.join(folder, "sub", "file.txt")
+        save_atomic(path, "contents")
+        save_atomic(path, "new contents")
+        self.assertEqual("new contents", load(path))
+
+        # The file is never half written
+        with patch("conans.util.files.os.rename", side_effect=OSError("Failed")):
+            with six.assertRaisesRegex(self, OSError, "Failed"):
+                save_atomic(path, "other contents")
+        self.assertEqual("new contents", load(path))
+        self.assertEqual(["file.txt"], os.listdir(os.path.dirname(path)))
+
     def test_path_exists(self):
         """
         Unit test of path_exists
@@ -29,3 +29,6 @@ class Retriever(object):
     def get_recipe(self, ref, check_updates, update, remote_name, recorder):  # @UnusedVariable
         conan_path = os.path.join(self.folder, "data", ref.dir_repr(), CONANFILE)
         return conan_path, None, None, ref.copy_with_rev(DEFAULT_REVISION_V1)
+
+    def prefetch_recipes(self, refs, remotes):  # @UnusedVariable
+        pass
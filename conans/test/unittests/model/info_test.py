@@ -134,3 +134,20 @@ class ConanInfoTest(unittest.TestCase):
         self.assertEqual(info.requires.dumps(), "bzip2/1.2.3-alpha1+build123@lasote/testing:sha1\n"
                                                 "poco/2.3.4+build123@lasote/stable:sha3\n"
                                                 "zlib/0.3@lasote/testing:sha2")
+
+    def test_shared_requirements(self):
+        info_text = """[full_requires]
+    bzip2/1.2.3@lasote/testing:sha1
+    zlib/0.3@lasote/testing:sha2
+"""
+        info = ConanInfo.loads(info_text)
+        other = ConanInfo.loads(info_text)
+        package_id = other.package_id()
+        info.requires["zlib"].full_package_mode()
+        self.assertEqual("bzip2/1.Y.Z\nzlib/0.3@lasote/testing:sha2", info.requires.dumps())
+        self.assertEqual("bzip2/1.Y.Z\nzlib/0.3", other.requires.dumps())
+        info.requires.full_version_mode()
+        self.assertEqual("bzip2/1.2.3\nzlib/0.3", info.requires.dumps())
+        self.assertEqual("bzip2/1.Y.Z\nzlib/0.3", other.requires.dumps())
+        self.assertEqual(package_id, ConanInfo.loads(info_text).package_id())
+        self.assertNotEqual(package_id, info.package_id())
@@ -227,6 +227,30 @@ Poco:deps_bundled=True""")
                                                      ("OpenSSL.*:fake_option", "FuzzBuzz"),
                                                      ])
 
+    def test_shared_values(self):
+        zlib_values = OptionsValues.loads("shared=True\nfoo:option=1")
+        zlib_ref = ConanFileReference.loads("zlib/1.2@user/testing")
+        self.sut.propagate_downstream(zlib_ref, zlib_values)
+        values = self.sut.values
+        self.assertEqual([("optimized", "3"), ("path", "NOTDEF"), ("static", "True"),
+                          ("foo:option", "1"), ("zlib:shared", "True")], values.as_list())
+
+        # The values of the requirements are shared, but they are independent
+        self.sut["zlib"].shared = False
+        values["foo"].option = 2
+        self.assertEqual([("shared", "True"), ("foo:option", "1")], zlib_values.as_list())
+        self.assertEqual("False", self.sut["zlib"].shared)
+        self.assertEqual("1", self.sut["foo"].option)
+        self.assertEqual("True", values["zlib"].shared)
+        self.assertEqual("2", values["foo"].option)
+
+        copied = values.copy()
+        copied.clear_indirect()
+        self.assertEqual([("optimized", "3"), ("path", "NOTDEF"), ("static", "True")],
+                         copied.as_list())
+        self.assertEqual([("optimized", "3"), ("path", "NOTDEF"), ("static", "True"),
+                          ("foo:option", "2"), ("zlib:shared", "True")], values.as_list())
+
 
 class OptionsValuesPropagationUpstreamNone(unittest.TestCase):
 
@@ -331,6 +355,20 @@ class OptionsValuesTest(unittest.TestCase):
         self.assertEqual(self.sut.sha,
                          "2442d43f1d558621069a15ff5968535f818939b5")
 
+    def test_copy(self):
+        sha = self.sut.sha
+        copied = self.sut.copy()
+        copied["Boost"].static = True
+        copied["Poco"].new_option = 1
+        self.assertEqual("False", self.sut["Boost"].static)
+        self.assertIsNone(self.sut["Poco"].new_option)
+        self.assertEqual(sha, self.sut.sha)
+        self.assertNotEqual(sha, copied.sha)
+
+        self.sut["Boost"].static = True
+        self.sut["Poco"].new_option = 1
+        self.assertEqual(copied.sha, self.sut.sha)
+
     def test_loads_exceptions(self):
         emsg = "not enough values to unpack" if six.PY3 and sys.version_info.minor > 4 \
             else "need more than 1 value to unpack"
@@ -505,3 +505,42 @@ os: [Windows, Linux]
 
         self.sut.compiler.arch.speed = "D"
         self.assertEqual(self.sut.compiler.arch.speed, "D")
+
+    def test_copy(self):
+        self.sut.compiler = "gcc"
+        self.sut.compiler.arch = "x86"
+        copied = self.sut.copy()
+        self.assertEqual(self.sut.values_list, copied.values_list)
+
+        # The copies share the definition, but they are independent
+        copied.compiler.arch.speed = "A"
+        copied.compiler.remove("Visual Studio")
+        copied.compiler.arch.remove("x64")
+        self.assertIsNone(self.sut.compiler.arch.speed.value)
+        self.assertEqual(["Visual Studio", "gcc"], self.sut.compiler.values_range)
+        self.assertEqual(["x64", "x86"], self.sut.compiler.arch.values_range)
+
+        self.sut.compiler.arch.speed = "B"
+        del self.sut.os
+        self.sut.compiler.version = "4.9"
+        self.assertEqual("A", copied.compiler.arch.speed.value)
+        self.assertEqual(["gcc"], copied.compiler.values_range)
+        self.assertEqual(["x86"], copied.compiler.arch.values_range)
+        self.assertIsNone(copied.compiler.version.value)
+        self.assertEqual(["compiler", "os"], copied.fields)
+
+        # Copies of copies
+        other = copied.copy()
+        other.constraint({"compiler": {"gcc": {"version": ["4.8"], "arch": None}}})
+        self.assertEqual(["compiler", "os"], copied.fields)
+        with self.assertRaises(ConanException):
+            other.compiler.version = "4.9"
+        copied.compiler.version = "4.9"
+        self.assertEqual([("compiler", "gcc"), ("compiler.arch", "x86"),
+                          ("compiler.arch.speed", "A")], other.values_list)
+        self.assertEqual([("compiler", "gcc"), ("compiler.arch", "x86"),
+                          ("compiler.arch.speed", "A"), ("compiler.version", "4.9")],
+                         copied.values_list)
+        self.assertEqual([("compiler", "gcc"), ("compiler.arch", "x86"),
+                          ("compiler.arch.speed", "B"), ("compiler.version", "4.9")],
+                         self.sut.values_list)
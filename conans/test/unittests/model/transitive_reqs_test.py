@@ -1,13 +1,15 @@
+import random
 import unittest
 from collections import namedtuple, Counter
 
 import six
-from mock import Mock
+from mock import Mock, patch
 
 from conans import DEFAULT_REVISION_V1
 from conans.client.cache.cache import ClientCache
 from conans.client.conf import default_settings_yml
 from conans.client.graph.build_mode import BuildMode
+from conans.client.graph.graph import Node
 from conans.client.graph.graph_binaries import GraphBinariesAnalyzer
 from conans.client.graph.graph_builder import DepsGraphBuilder
 from conans.client.graph.python_requires import ConanPythonRequire
@@ -73,6 +75,10 @@ class MockRemoteManager(object):
         self.count[pattern] += 1
         return self.packages
 
+    def search_recipes_in_remotes(self, remotes, pattern, ignorecase):
+        for remote in remotes:
+            yield self.search_recipes(remote, pattern, ignorecase)
+
 
 class GraphTest(unittest.TestCase):
 
@@ -1920,3 +1926,42 @@ class ChatConan(ConanFile):
                          "%s:95c360996106af45b8eec11a37df19fda39a5880\n"
                          "%s:751fd69d10b2a54fdd8610cdae748d6b22700841"
                          % (str(hello_ref), str(say_ref)))
+
+
+class ClosuresTest(GraphTest):
+
+    def test_connected_closures(self):
+        # Many diamonds, with some private requirements, the closures must be the same than
+        # connecting every time all the nodes of the closures
+        rand = random.Random(1)
+        layers, width = 6, 5
+
+        def name(layer, index):
+            return "L%dN%d" % (layer, index)
+
+        for layer in range(layers):
+            for index in range(width):
+                requires, private_requires = [], []
+                if layer + 1 < layers:
+                    for dep in rand.sample(range(width), 3):
+                        reqs = private_requires if rand.random() < 0.2 else requires
+                        reqs.append("%s/1.0@user/testing" % name(layer + 1, dep))
+                content = TestConanFile(name(layer, index), "1.0", requires=requires,
+                                        private_requires=private_requires)
+                self.retriever.save_recipe("%s/1.0@user/testing" % name(layer, index), content)
+        root = TestConanFile("Root", "1.0",
+                             requires=["%s/1.0@user/testing" % name(0, i) for i in range(width)])
+
+        def closures(deps_graph):
+            return sorted((str(node.ref), [str(n.ref) for n in node.public_closure.values()],
+                           sorted(str(n.ref) for n in node.public_deps.values()))
+                          for node in deps_graph.nodes)
+
+        def connect_public_closure(node, other_node):
+            for n in other_node.public_closure.values():
+                if not n.build_require and not n.private:
+                    node.connect_closure(n)
+
+        expected = closures(self.build_graph(root))
+        with patch.object(Node, "connect_public_closure", connect_public_closure):
+            self.assertEqual(expected, closures(self.build_graph(root)))
@@ -25,3 +25,16 @@ class ValuesTest(unittest.TestCase):
         v.compiler = None
         self.assertEqual(v.as_list(), [('compiler', 'None')])
         self.assertEqual(v.dumps(), "compiler=None")
+
+    def test_copy(self):
+        v = Values.from_list([("compiler", "gcc"), ("compiler.version", "7"), ("os", "Linux")])
+        copied = v.copy()
+        copied.compiler.version = "8"
+        del copied.os
+        self.assertEqual([("compiler", "gcc"), ("compiler.version", "7"), ("os", "Linux")],
+                         v.as_list())
+        self.assertEqual([("compiler", "gcc"), ("compiler.version", "8")], copied.as_list())
+
+        v.compiler.libcxx = "libstdc++"
+        self.assertEqual([("compiler", "gcc"), ("compiler.version", "8")], copied.as_list())
+        self.assertEqual("7", v.copy().compiler.version)
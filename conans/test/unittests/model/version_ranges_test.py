@@ -1,6 +1,6 @@
 import unittest
 
-from conans.client.graph.range_resolver import satisfying
+from conans.client.graph.range_resolver import VersionRangeCache, satisfying
 from conans.errors import ConanException
 from conans.test.utils.tools import TestBufferConanOutput
 
@@ -103,3 +103,37 @@ class BasicMaxVersionTest(unittest.TestCase):
             satisfying(["2.1.1"], "2.3 3.2, include_prerelease=Ture, loose=False", output)
         with self.assertRaises(ConanException):
             satisfying(["2.1.1"], "~2.3, abc, loose=False", output)
+
+
+class VersionRangeCacheTest(unittest.TestCase):
+
+    def cached_test(self):
+        cache = VersionRangeCache()
+        versions = ["1.1", "1.2", "1.3", "no.version", "2.1"]
+        for _ in range(2):
+            output = []
+            self.assertEqual("1.3", cache.satisfying(versions, ">1.1,<2.1", output))
+            # The messages are reported every time
+            self.assertEqual(["WARN: Commas as separator in version '>1.1,<2.1' range are "
+                              "deprecated and will be removed in Conan 2.0",
+                              "WARN: Version 'no.version' is not semver, cannot be compared "
+                              "with a range"], output)
+        self.assertEqual("2.1", cache.satisfying(versions, ">1.1", []))
+        self.assertEqual("1.2", cache.satisfying(versions[:2], ">1.1", []))
+        with self.assertRaises(ConanException):
+            cache.satisfying(versions, "~2.3, abc, loose=False", [])
+
+    def same_as_max_satisfying_test(self):
+        from semver import SemVer, max_satisfying
+
+        versions = ["1.0", "1.0.0", "1.0.0-pre", "1.0.1", "1.0.1.2", "1.0.1.1", "2.0-rc.1",
+                    "2.0-rc.2", "2.0", "1.5", "1.05"]
+        cache = VersionRangeCache()
+        for expression in ("", "1.0", "~1.0", ">=1.0 <2.0", "1.0.1", "^1", "<2.0 || >=2.0",
+                           "~2.0.0-rc", "~1.0, include_prerelease=True", "1.5"):
+            candidates = {SemVer(v, loose=True): v for v in versions}
+            range_ = expression.split(",")[0]
+            prerelease = "include_prerelease" in expression
+            expected = candidates.get(max_satisfying(candidates, range_, loose=True,
+                                                     include_prerelease=prerelease))
+            self.assertEqual(expected, cache.satisfying(versions, expression, []))
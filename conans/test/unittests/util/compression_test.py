@@ -0,0 +1,130 @@
+import gzip
+import io
+import os
+import tarfile
+import unittest
+
+import six
+from mock import patch
+
+from conans.client.tools.env import environment_append
+from conans.errors import ConanException
+from conans.test.utils.test_files import temp_folder
+from conans.util.compression import ParallelGzipWriter, PipelinedTarFile, zstd_available, \
+    zstd_tar_open
+from conans.util.files import TarExtractionStream, gzopen_without_timestamps, load, save, \
+    tar_extract
+
+
+def _compress(files, threads, name="conan_package.tgz"):
+    buffer = io.BytesIO()
+    with environment_append({"CONAN_COMPRESSION_THREADS": str(threads)}):
+        if name.endswith(".tzst"):
+            tgz = zstd_tar_open(name, mode="w", fileobj=buffer)
+        else:
+            tgz = gzopen_without_timestamps(name, mode="w", fileobj=buffer)
+    for filename, content in sorted(files.items()):
+        info = tarfile.TarInfo(name=filename)
+        info.size = len(content)
+        tgz.addfile(tarinfo=info, fileobj=io.BytesIO(content))
+    tgz.close()
+    return buffer.getvalue()
+
+
+class ParallelGzipTest(unittest.TestCase):
+
+    def setUp(self):
+        self.files = {"file%d.txt" % i: os.urandom(5000) + b"repeated " * 3000 * i
+                      for i in range(10)}
+
+    def test_gzip_compatible(self):
+        with patch.object(ParallelGzipWriter, "BLOCK_SIZE", 16 * 1024):
+            compressed = _compress(self.files, threads=4)
+
+        # A single gzip member, with the same header as GzipFile
+        self.assertEqual(compressed[:10], _compress(self.files, threads=1)[:10])
+        tar_contents = gzip.GzipFile(fileobj=io.BytesIO(compressed)).read()
+        the_tar = tarfile.open(fileobj=io.BytesIO(tar_contents))
+        for member in the_tar.getmembers():
+            self.assertEqual(self.files[member.name], the_tar.extractfile(member).read())
+
+    def test_deterministic(self):
+        with patch.object(ParallelGzipWriter, "BLOCK_SIZE", 16 * 1024):
+            compressed = _compress(self.files, threads=2)
+            self.assertEqual(compressed, _compress(self.files, threads=2))
+            self.assertEqual(compressed, _compress(self.files, threads=7))
+
+    def test_invalid_threads(self):
+        with six.assertRaisesRegex(self, ConanException, "Specify a numeric parameter for "
+                                                         "'compression_threads'"):
+            _compress(self.files, threads="auto")
+        with six.assertRaisesRegex(self, ConanException, "Invalid 'compression_threads' "
+                                                         "value '0'"):
+            _compress(self.files, threads=0)
+
+    @unittest.skipUnless(zstd_available(), "Requires zstandard")
+    def test_zstd(self):
+        compressed = _compress(self.files, threads=2, name="conan_package.tzst")
+        folder = temp_folder()
+        tgz_path = os.path.join(folder, "conan_package.tzst")
+        save(tgz_path, compressed)
+        with open(tgz_path, "rb") as file_handler:
+            tar_extract(file_handler, folder, tar_open=zstd_tar_open)
+        for filename, content in self.files.items():
+            self.assertEqual(content, load(os.path.join(folder, filename), binary=True))
+
+    @unittest.skipUnless(zstd_available(), "Requires zstandard")
+    def test_zstd_level(self):
+        files = {"numbers.txt": " ".join(str(i * i) for i in range(100000)).encode()}
+        compressed = {}
+        for level in ("1", "19", "22", "40"):
+            with environment_append({"CONAN_COMPRESSION_LEVEL": level}):
+                compressed[level] = _compress(files, threads=1, name="conan_package.tzst")
+        self.assertGreater(len(compressed["1"]), len(compressed["19"]))
+        # Out of the zstd range, it is the maximum level
+        self.assertEqual(compressed["40"], compressed["22"])
+
+
+class TarExtractionStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.files = {"file%d.txt" % i: os.urandom(5000) + b"repeated " * 3000 * i
+                      for i in range(10)}
+        self.files["big.bin"] = os.urandom(3 * PipelinedTarFile.PIPELINE_SIZE)
+
+    def _extract(self, compressed, tar_open=None):
+        folder = temp_folder()
+        stream = TarExtractionStream(folder) if tar_open is None \
+            else TarExtractionStream(folder, tar_open)
+        with stream:
+            for i in range(0, len(compressed), 1000):
+                stream.write(compressed[i:i + 1000])
+        return folder
+
+    def test_extract_while_writing(self):
+        folder = self._extract(_compress(self.files, threads=1))
+        self.assertEqual(sorted(os.listdir(folder)), sorted(self.files))
+        for filename, content in self.files.items():
+            self.assertEqual(content, load(os.path.join(folder, filename), binary=True))
+
+    @unittest.skipUnless(zstd_available(), "Requires zstandard")
+    def test_extract_zstd(self):
+        compressed = _compress(self.files, threads=1, name="conan_package.tzst")
+        folder = self._extract(compressed, tar_open=zstd_tar_open)
+        for filename, content in self.files.items():
+            self.assertEqual(content, load(os.path.join(folder, filename), binary=True))
+
+    def test_corrupted(self):
+        compressed = _compress(self.files, threads=1)
+        with self.assertRaises(tarfile.TarError):
+            self._extract(compressed[:len(compressed) // 2])
+        with self.assertRaises(tarfile.TarError):
+            self._extract(b"not a tgz file" * 1000)
+
+    def test_abort(self):
+        compressed = _compress(self.files, threads=1)
+        folder = temp_folder()
+        with six.assertRaisesRegex(self, ValueError, "Connection lost"):
+            with TarExtractionStream(folder) as stream:
+                stream.write(compressed[:len(compressed) // 2])
+                raise ValueError("Connection lost")
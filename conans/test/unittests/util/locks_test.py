@@ -0,0 +1,152 @@
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import unittest
+
+from nose.plugins.attrib import attr
+
+import conans
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestBufferConanOutput
+from conans.util.files import load, mkdir
+from conans.util.locks import ReadLock, WriteLock
+
+_LOCK = textwrap.dedent("""
+    import sys
+    from conans.client.output import ConanOutput
+    from conans.util.locks import ReadLock, WriteLock
+
+    lock_class = ReadLock if sys.argv[2] == "read" else WriteLock
+    with lock_class(sys.argv[1], "Pkg/0.1@user/channel", ConanOutput(sys.stdout)):
+        sys.stdout.write("LOCKED\\n")
+    """)
+
+# Every process increments the counter with the write lock, writing it in two steps, and
+# checks it with the read lock, that never sees a half written value. The longest wait for a
+# lock is the output
+_CONTENTION = textwrap.dedent("""
+    import os, sys, time
+    from conans.client.output import ConanOutput
+    from conans.util.files import load, save
+    from conans.util.locks import ReadLock, WriteLock
+
+    folder, iterations = sys.argv[1], int(sys.argv[2])
+    counter = os.path.join(folder, "counter.txt")
+    output = ConanOutput(open(os.devnull, "w"))
+    waits = []
+    for i in range(iterations):
+        start = time.time()
+        if i % 4 == 0:
+            with WriteLock(folder, "Pkg/0.1@user/channel", output):
+                waits.append(time.time() - start)
+                value = int(load(counter))
+                save(counter, "")
+                time.sleep(0.01)  # Like the installation of a package
+                save(counter, str(value + 1))
+        else:
+            with ReadLock(folder, "Pkg/0.1@user/channel", output):
+                waits.append(time.time() - start)
+                int(load(counter))
+    sys.stdout.write("%s" % max(waits))
+    """)
+
+
+class LocksTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = os.path.join(temp_folder(), "Pkg", "0.1", "user", "channel")
+        mkdir(self.folder)
+        self.env = dict(os.environ)
+        repo_folder = os.path.dirname(os.path.dirname(os.path.abspath(conans.__file__)))
+        self.env["PYTHONPATH"] = os.pathsep.join([repo_folder, self.env.get("PYTHONPATH", "")])
+        self.env["PYTHONWARNINGS"] = "ignore"
+
+    def _launch(self, script, *args):
+        return subprocess.Popen([sys.executable, "-c", script, self.folder] + list(args),
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=self.env)
+
+    def _finished(self, process, timeout=10):
+        for _ in range(int(timeout * 10)):
+            if process.poll() is not None:
+                return True
+            time.sleep(0.1)
+        return False
+
+    def test_shared_read(self):
+        output = TestBufferConanOutput()
+        with ReadLock(self.folder, "Pkg/0.1@user/channel", output):
+            process = self._launch(_LOCK, "read")
+            self.assertTrue(self._finished(process))
+            out = process.communicate()[0].decode()
+        self.assertEqual(0, process.returncode, out)
+        self.assertEqual("LOCKED", out.strip())
+        self.assertEqual("", str(output))
+
+    def _wait_blocked(self, process, timeout=10):
+        """ Reads the output of the process until it says that it is waiting for the lock
+        """
+        lines = []
+
+        def read_output():
+            for line in iter(process.stdout.readline, b""):
+                lines.append(line.decode())
+                if "is locked by another concurrent conan process" in lines[-1]:
+                    return
+
+        reader = threading.Thread(target=read_output)
+        reader.daemon = True
+        reader.start()
+        reader.join(timeout)
+        out = "".join(lines)
+        if reader.is_alive() or "is locked by another concurrent conan process" not in out:
+            self.fail("The process didn't say it was waiting for the lock:\n%s" % out)
+        return out
+
+    def _check_locked(self, process, out):
+        self.assertTrue(self._finished(process))
+        out += process.communicate()[0].decode()
+        self.assertEqual(0, process.returncode, out)
+        self.assertTrue(out.strip().endswith("LOCKED"), out)
+
+    def test_write_blocks(self):
+        for lock_class, lock_type in ((WriteLock, "read"), (WriteLock, "write"),
+                                      (ReadLock, "write")):
+            output = TestBufferConanOutput()
+            with lock_class(self.folder, "Pkg/0.1@user/channel", output):
+                process = self._launch(_LOCK, lock_type)
+                out = self._wait_blocked(process)
+                self.assertIsNone(process.poll())
+            self._check_locked(process, out)
+
+    def test_waiting_writer_blocks_readers(self):
+        with ReadLock(self.folder, "Pkg/0.1@user/channel", TestBufferConanOutput()):
+            writer = self._launch(_LOCK, "write")
+            writer_out = self._wait_blocked(writer)
+            # The reader waits for the writer, that is waiting for the current reader
+            reader = self._launch(_LOCK, "read")
+            reader_out = self._wait_blocked(reader)
+            self.assertIsNone(writer.poll())
+            self.assertIsNone(reader.poll())
+        self._check_locked(writer, writer_out)
+        self._check_locked(reader, reader_out)
+
+    @attr("slow")
+    def test_contention(self):
+        # With the polling count lock, some of the 16 processes waited for a lock most of the
+        # time (10 of 12 seconds), while the others were taking it
+        with WriteLock(self.folder, "Pkg/0.1@user/channel", TestBufferConanOutput()):
+            with open(os.path.join(self.folder, "counter.txt"), "w") as handle:
+                handle.write("0")
+        start = time.time()
+        processes = [self._launch(_CONTENTION, "200") for _ in range(16)]
+        waits = []
+        for process in processes:
+            out = process.communicate()[0].decode()
+            self.assertEqual(0, process.returncode, out)
+            waits.append(float(out))
+        duration = time.time() - start
+        self.assertEqual(16 * 50, int(load(os.path.join(self.folder, "counter.txt"))))
+        self.assertLess(max(waits), duration / 2, "Waits %s in %s seconds" % (waits, duration))
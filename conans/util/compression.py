@@ -0,0 +1,219 @@
+import os
+import struct
+import tarfile
+import threading
+import zlib
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+import six
+from six.moves import queue
+
+from conans.errors import ConanException
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def zstd_available():
+    return zstandard is not None
+
+
+def compression_threads():
+    """ the threads to compress (CONAN_COMPRESSION_THREADS), None if not defined
+    """
+    threads = os.getenv("CONAN_COMPRESSION_THREADS")
+    if not threads:
+        return None
+    try:
+        threads = int(threads)
+    except ValueError:
+        raise ConanException("Specify a numeric parameter for 'compression_threads'")
+    if threads < 1:
+        raise ConanException("Invalid 'compression_threads' value '%s', it must be at least 1"
+                             % threads)
+    return threads
+
+
+def _deflate_block(block, dictionary, compresslevel, last):
+    if dictionary and six.PY3:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                      zlib.DEF_MEM_LEVEL, zlib.Z_DEFAULT_STRATEGY, dictionary)
+    else:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    data = compressor.compress(block)
+    return data + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class ParallelGzipWriter(object):
+    """ Writable file object that gzips the data written to it, deflating blocks of the data
+    concurrently (zlib releases the GIL while compressing).
+    As pigz does, every block is primed with the last 32KB of the previous one, and the
+    blocks are joined with sync flushes in a single deflate stream, so the result is a
+    regular single member gzip file, that any gzip implementation can decompress. For the
+    same data and level, the result doesn't depend on the number of threads.
+    """
+    BLOCK_SIZE = 1024 * 1024
+    _WINDOW_SIZE = 32 * 1024
+
+    def __init__(self, name, fileobj, compresslevel, threads):
+        self._fileobj = fileobj
+        self._compresslevel = compresslevel
+        self._pool = ThreadPool(threads)
+        self._max_pending = 2 * threads
+        self._pending = deque()
+        self._buffer = bytearray()
+        self._dictionary = b""
+        self._crc = zlib.crc32(b"") & 0xffffffff
+        self._size = 0
+        self._closed = False
+        self._write_header(name)
+
+    def _write_header(self, name):
+        # Same header as gzip.GzipFile(mtime=0)
+        fname = os.path.basename(name or "")
+        if not isinstance(fname, bytes):
+            fname = fname.encode("latin-1")
+        if fname.endswith(b".gz"):
+            fname = fname[:-3]
+        flags = b"\010" if fname else b"\000"
+        if self._compresslevel == 9:
+            xfl = b"\002"
+        elif self._compresslevel == 1:
+            xfl = b"\004"
+        else:
+            xfl = b"\000"
+        header = b"\037\213\010" + flags + struct.pack("<L", 0) + xfl + b"\377"
+        if fname:
+            header += fname + b"\000"
+        self._fileobj.write(header)
+
+    def write(self, data):
+        data = bytes(data)
+        self._crc = zlib.crc32(data, self._crc) & 0xffffffff
+        self._size += len(data)
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.BLOCK_SIZE:
+            block = bytes(self._buffer[:self.BLOCK_SIZE])
+            del self._buffer[:self.BLOCK_SIZE]
+            self._submit(block, last=False)
+        return len(data)
+
+    def tell(self):
+        return self._size
+
+    def _submit(self, block, last):
+        dictionary = self._dictionary
+        self._dictionary = block[-self._WINDOW_SIZE:]
+        self._pending.append(self._pool.apply_async(_deflate_block,
+                                                    (block, dictionary, self._compresslevel, last)))
+        while len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().get())
+
+    def flush(self):
+        self._fileobj.flush()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(bytes(self._buffer), last=True)
+            self._buffer = bytearray()
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().get())
+            self._fileobj.write(struct.pack("<LL", self._crc, self._size & 0xffffffff))
+            self._fileobj.flush()
+        finally:
+            self._pool.close()
+            self._pool.join()
+
+
+def parallel_gzopen(name, fileobj, compresslevel, threads, **kwargs):
+    """ Opens a tar file to be written in "fileobj", compressed with a ParallelGzipWriter
+    """
+    writer = ParallelGzipWriter(name, fileobj, compresslevel, threads)
+    try:
+        t = tarfile.TarFile.taropen(name, "w", writer, **kwargs)
+    except Exception:
+        writer.close()
+        raise
+    t._extfileobj = False
+    return t
+
+
+class PipelinedTarFile(tarfile.TarFile):
+    """ TarFile that writes the contents of the big members to disk in another thread, while
+    the following chunks of the member are being read (and decompressed)
+    """
+    PIPELINE_SIZE = 1024 * 1024
+    CHUNK_SIZE = 256 * 1024
+
+    def makefile(self, tarinfo, targetpath):
+        if tarinfo.size < self.PIPELINE_SIZE or tarinfo.sparse is not None:
+            return super(PipelinedTarFile, self).makefile(tarinfo, targetpath)
+
+        chunks = queue.Queue(maxsize=16)
+        errors = []
+
+        def write_chunks():
+            try:
+                with open(targetpath, "wb") as target:
+                    while True:
+                        chunk = chunks.get()
+                        if chunk is None:
+                            return
+                        target.write(chunk)
+            except Exception as exc:
+                errors.append(exc)
+                while chunks.get() is not None:  # Do not block the reader
+                    pass
+
+        writer = threading.Thread(target=write_chunks)
+        writer.daemon = True
+        writer.start()
+        try:
+            source = self.fileobj
+            source.seek(tarinfo.offset_data)
+            remaining = tarinfo.size
+            while remaining and not errors:
+                chunk = source.read(min(self.CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise tarfile.ReadError("unexpected end of data")
+                chunks.put(chunk)
+                remaining -= len(chunk)
+        finally:
+            chunks.put(None)
+            writer.join()
+        if errors:
+            raise errors[0]
+
+
+def tar_stream_open(fileobj):
+    """ Opens a compressed tar to be read as a stream, members have to be processed in order
+    """
+    return PipelinedTarFile.open(fileobj=fileobj, mode="r|*")
+
+
+def zstd_tar_open(name=None, mode="r", fileobj=None, compresslevel=None, **kwargs):
+    """ Opens a zstd compressed tar file. Reading it is done as a stream, so the members
+    have to be processed in order. The compression level is the one of gzip
+    (CONAN_COMPRESSION_LEVEL), clamped to the range of zstd, that goes further (1-22)
+    """
+    if zstandard is None:
+        raise tarfile.CompressionError("The 'zstandard' python package is not installed")
+    if mode == "w":
+        compresslevel = compresslevel or int(os.getenv("CONAN_COMPRESSION_LEVEL", 9))
+        compresslevel = min(max(compresslevel, 1), zstandard.MAX_COMPRESSION_LEVEL)
+        compressor = zstandard.ZstdCompressor(level=compresslevel,
+                                              threads=compression_threads() or 0)
+        writer = compressor.stream_writer(fileobj, closefd=False)
+        t = tarfile.TarFile.taropen(name, "w", writer, **kwargs)
+        t._extfileobj = False
+        return t
+    elif mode == "r":
+        reader = zstandard.ZstdDecompressor().stream_reader(fileobj, closefd=False)
+        return PipelinedTarFile.open(name, "r|", fileobj=reader, **kwargs)
+    raise ValueError("mode must be 'r' or 'w'")
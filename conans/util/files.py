@@ -8,11 +8,15 @@ import stat
 import sys
 import tarfile
 import tempfile
+import threading
+import uuid
+from collections import OrderedDict
 
 from os.path import abspath, join as joinpath, realpath
 
 import six
 
+from conans.util.compression import compression_threads, parallel_gzopen, tar_stream_open
 from conans.util.log import logger
 
 
@@ -108,7 +112,83 @@ def sha256sum(file_path):
     return _generic_algorithm_sum(file_path, "sha256")
 
 
+# Checksums already computed while Conan was writing or reading the whole file, the most
+# recent ones, as the process can live long (conan daemon)
+# {file_path: ((size, mtime_ns, ctime_ns, inode), {algorithm_name: checksum})}
+_known_checksums = OrderedDict()
+_known_checksums_lock = threading.Lock()
+_MAX_KNOWN_CHECKSUMS = 4096
+
+
+def _checksum_key(file_stat):
+    """ The ctime changes with any change of the file, even if the mtime is restored
+    """
+    try:
+        times = file_stat.st_mtime_ns, file_stat.st_ctime_ns
+    except AttributeError:  # Python 2
+        times = int(file_stat.st_mtime * 1e9), int(file_stat.st_ctime * 1e9)
+    return file_stat.st_size, times[0], times[1], file_stat.st_ino
+
+
+def remember_checksums(file_path, checksums, file_stat=None):
+    """ Stores the checksums of a file computed while streaming its contents, so they don't
+    need to be computed again reading the file. They are discarded if the file changes.
+    file_stat: os.stat() of the file at the moment the contents were read
+    """
+    file_stat = file_stat or os.stat(file_path)
+    file_path = os.path.abspath(file_path)
+    with _known_checksums_lock:
+        _known_checksums.pop(file_path, None)
+        _known_checksums[file_path] = (_checksum_key(file_stat), dict(checksums))
+        while len(_known_checksums) > _MAX_KNOWN_CHECKSUMS:
+            _known_checksums.popitem(last=False)
+
+
+def _known_checksum(file_path, algorithm_name):
+    file_path = os.path.abspath(file_path)
+    known = _known_checksums.get(file_path)
+    if known is None:
+        return None
+    key, checksums = known
+    try:
+        if key != _checksum_key(os.stat(file_path)):
+            with _known_checksums_lock:
+                _known_checksums.pop(file_path, None)
+            return None
+    except OSError:
+        return None
+    return checksums.get(algorithm_name)
+
+
+class HashingFile(object):
+    """ Wraps a file object, computing the checksums of all the data read from or written to it
+    """
+    def __init__(self, fileobj, algorithm_names=("md5", "sha1")):
+        self._fileobj = fileobj
+        self._hashes = {name: hashlib.new(name) for name in algorithm_names}
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        for h in self._hashes.values():
+            h.update(data)
+        return data
+
+    def write(self, data):
+        for h in self._hashes.values():
+            h.update(data)
+        return self._fileobj.write(data)
+
+    def flush(self):
+        self._fileobj.flush()
+
+    def checksums(self):
+        return {name: h.hexdigest() for name, h in self._hashes.items()}
+
+
 def _generic_algorithm_sum(file_path, algorithm_name):
+    checksum = _known_checksum(file_path, algorithm_name)
+    if checksum is not None:
+        return checksum
 
     with open(file_path, 'rb') as fh:
         m = hashlib.new(algorithm_name)
@@ -154,6 +234,24 @@ def save(path, content, only_if_modified=False):
         handle.write(new_content)
 
 
+def save_atomic(path, content):
+    """ Saves a file writing a temporary file renamed to the path, so other processes never
+    read it partially written
+    """
+    tmp_path = "%s.%s" % (path, uuid.uuid4().hex)
+    try:
+        mkdir(os.path.dirname(path))
+        with open(tmp_path, "wb") as handle:
+            handle.write(to_file_bytes(content))
+        if platform.system() == "Windows" and os.path.exists(path):
+            os.remove(path)  # Windows doesn't replace with rename
+        os.rename(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def mkdir_tmp():
     return tempfile.mkdtemp(suffix='tmp_conan')
 
@@ -231,7 +329,11 @@ def mkdir(path):
     """Recursive mkdir, doesnt fail if already existing"""
     if os.path.exists(path):
         return
-    os.makedirs(path)
+    try:
+        os.makedirs(path)
+    except OSError as e:  # Created concurrently by other thread or process
+        if e.errno != errno.EEXIST or not os.path.isdir(path):
+            raise
 
 
 def path_exists(path, basedir):
@@ -266,6 +368,10 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
     if mode not in ("r", "w"):
         raise ValueError("mode must be 'r' or 'w'")
 
+    threads = compression_threads()
+    if mode == "w" and threads and threads > 1:
+        return parallel_gzopen(name, fileobj, compresslevel, threads, **kwargs)
+
     try:
         import gzip
         gzip.GzipFile
@@ -293,9 +399,10 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
     return t
 
 
-def tar_extract(fileobj, destination_dir):
+def tar_extract(fileobj, destination_dir, tar_open=tarfile.open, extracted=None):
     """Extract tar file controlling not absolute paths and fixing the routes
-    if the tar was zipped in windows"""
+    if the tar was zipped in windows. The names of the members are appended to the
+    "extracted" list, if given, before extracting them"""
     def badpath(path, base):
         # joinpath will ignore base if path is absolute
         return not realpath(abspath(joinpath(base, path))).startswith(base)
@@ -309,9 +416,11 @@ def tar_extract(fileobj, destination_dir):
             else:
                 # Fixes unzip a windows zipped file in linux
                 finfo.name = finfo.name.replace("\\", "/")
+                if extracted is not None:
+                    extracted.append(finfo.name)
                 yield finfo
 
-    the_tar = tarfile.open(fileobj=fileobj)
+    the_tar = tar_open(fileobj=fileobj)
     # NOTE: The errorlevel=2 has been removed because it was failing in Win10, it didn't allow to
     # "could not change modification time", with time=0
     # the_tar.errorlevel = 2  # raise exception if any error
@@ -319,6 +428,94 @@ def tar_extract(fileobj, destination_dir):
     the_tar.close()
 
 
+class TarExtractionStream(object):
+    """ Writable file object that extracts the compressed tar being written to it, while it is
+    being written, so the tar doesn't need to be saved to disk and read again. The
+    decompression and extraction happen in another thread, overlapping with the writer.
+    If the writer fails, it has to call abort(), otherwise close()
+    """
+    _END = None
+
+    def __init__(self, destination_dir, tar_open=tar_stream_open):
+        self._destination_dir = destination_dir
+        self._chunks = six.moves.queue.Queue(maxsize=64)
+        self._pending = b""
+        self._aborted = False
+        self._error = None
+        self._extracted = []
+        self._thread = threading.Thread(target=self._extract, args=(destination_dir, tar_open))
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def error(self):
+        """ The error extracting the data, if any. The incomplete data of an aborted
+        stream is not an extraction error
+        """
+        return self._error
+
+    def _extract(self, destination_dir, tar_open):
+        try:
+            tar_extract(self, destination_dir, tar_open=tar_open, extracted=self._extracted)
+        except BaseException as exc:
+            if not self._aborted:
+                self._error = exc
+        # Consume the rest of the data (or all of it after an error) so the writer never blocks
+        while self.read(1024 * 1024, raise_aborted=False):
+            pass
+
+    def read(self, size=-1, raise_aborted=True):
+        while not self._pending:
+            chunk = self._chunks.get()
+            if chunk is self._END:
+                self._chunks.put(self._END)  # Following reads will also get the end
+                if self._aborted and raise_aborted:
+                    raise tarfile.ReadError("Incomplete data, the writer was aborted")
+                return b""
+            self._pending = chunk
+        if size is None or size < 0:
+            size = len(self._pending)
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def write(self, data):
+        if self._error is not None:
+            raise self._error
+        if data:
+            self._chunks.put(bytes(data))
+
+    def close(self):
+        self._chunks.put(self._END)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def abort(self):
+        self._aborted = True
+        self._chunks.put(self._END)
+        self._thread.join()
+
+    def remove_extracted(self):
+        """ Removes the files and folders extracted so far, leaving the rest of the destination
+        folder untouched. To be called after close() or abort()
+        """
+        for name in set(name.split("/")[0] for name in self._extracted):
+            path = os.path.join(self._destination_dir, name)
+            if os.path.isdir(path) and not os.path.islink(path):
+                rmdir(path)
+            elif os.path.lexists(path):
+                remove(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
 def list_folder_subdirs(basedir, level):
     ret = []
     for root, dirs, _ in walk(basedir):
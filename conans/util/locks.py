@@ -1,11 +1,17 @@
+import errno
 import os
 import time
 
 import fasteners
 
-from conans.util.files import load, save
+from conans.util.files import load, mkdir, save
 from conans.util.log import logger
 
+try:
+    import fcntl
+except ImportError:  # Windows, the readers are counted in a file
+    fcntl = None
+
 
 class NoLock(object):
 
@@ -36,10 +42,9 @@ class Lock(object):
 
     @staticmethod
     def clean(folder):
-        if os.path.exists(folder + ".count"):
-            os.remove(folder + ".count")
-        if os.path.exists(folder + ".count.lock"):
-            os.remove(folder + ".count.lock")
+        for suffix in (".count", ".count.lock", ".gate"):
+            if os.path.exists(folder + suffix):
+                os.remove(folder + suffix)
 
     def __init__(self, folder, locked_item, output):
         self._count_file = folder + ".count"
@@ -69,7 +74,74 @@ class Lock(object):
             return 0
 
 
-class ReadLock(Lock):
+class _FileLock(Lock):
+    """ Reader/writer lock with a shared or exclusive flock() of the lock file: the readers
+    don't write anything, and the waiting processes are blocked by the OS until they get the
+    lock, instead of polling. The locks are released when the files are closed, also if the
+    process dies.
+
+    flock() doesn't queue the waiting processes, a writer could wait forever while other
+    readers come and go. Taking the lock is serialized with the exclusive flock() of the
+    ".gate" file, that the writers hold until they get the lock, so no other reader enters
+    meanwhile
+    """
+    _mode = None
+    _lock_type = None
+
+    def __init__(self, folder, locked_item, output):
+        super(_FileLock, self).__init__(folder, locked_item, output)
+        self._gate_file = folder + ".gate"
+        self._handle = None
+
+    @property
+    def files(self):
+        return self._gate_file, self._count_lock_file
+
+    @staticmethod
+    def _try_flock(handle, mode):
+        """ returns False if the lock is taken by other process
+        """
+        try:
+            fcntl.flock(handle.fileno(), mode | fcntl.LOCK_NB)
+            return True
+        except (IOError, OSError) as e:
+            if e.errno not in (errno.EAGAIN, errno.EACCES, errno.EWOULDBLOCK):
+                raise
+            return False
+
+    def __enter__(self):
+        mkdir(os.path.dirname(self._count_lock_file))
+        start = time.time()
+        waited = False
+        gate = open(self._gate_file, "a")
+        try:
+            if not self._try_flock(gate, fcntl.LOCK_EX):
+                # Only for a moment, unless there is a writer waiting for the lock
+                waited = True
+                self._info_locked()
+                fcntl.flock(gate.fileno(), fcntl.LOCK_EX)
+            handle = open(self._count_lock_file, "a")
+            try:
+                if not self._try_flock(handle, self._mode):
+                    waited = True
+                    self._info_locked()
+                    fcntl.flock(handle.fileno(), self._mode)
+            except BaseException:
+                handle.close()
+                raise
+        finally:
+            gate.close()
+        if waited:
+            from conans.util.tracer import log_lock_wait
+            log_lock_wait(self._locked_item, self._lock_type, time.time() - start)
+        self._handle = handle
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+        handle, self._handle = self._handle, None
+        handle.close()  # Releases the lock
+
+
+class _CountReadLock(Lock):
 
     def __enter__(self):
         while True:
@@ -87,7 +159,7 @@ class ReadLock(Lock):
             save(self._count_file, str(readers - 1))
 
 
-class WriteLock(Lock):
+class _CountWriteLock(Lock):
 
     def __enter__(self):
         while True:
@@ -102,3 +174,16 @@ class WriteLock(Lock):
     def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
         with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
             save(self._count_file, "0")
+
+
+if fcntl is not None:
+    class ReadLock(_FileLock):
+        _mode = fcntl.LOCK_SH
+        _lock_type = "read"
+
+    class WriteLock(_FileLock):
+        _mode = fcntl.LOCK_EX
+        _lock_type = "write"
+else:
+    ReadLock = _CountReadLock
+    WriteLock = _CountWriteLock
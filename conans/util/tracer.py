@@ -15,10 +15,11 @@ TRACER_ACTIONS = ["UPLOADED_RECIPE", "UPLOADED_PACKAGE",
                   "DOWNLOADED_RECIPE", "DOWNLOADED_RECIPE_SOURCES", "DOWNLOADED_PACKAGE",
                   "PACKAGE_BUILT_FROM_SOURCES",
                   "GOT_RECIPE_FROM_LOCAL_CACHE", "GOT_PACKAGE_FROM_LOCAL_CACHE",
-                  "REST_API_CALL", "COMMAND",
+                  "REST_API_CALL", "HTTP_CONNECTIONS", "COMMAND",
                   "EXCEPTION",
                   "DOWNLOAD",
-                  "UNZIP", "ZIP"]
+                  "UNZIP", "ZIP",
+                  "LOCK_WAIT"]
 
 MASKED_FIELD = "**********"
 
@@ -69,9 +70,17 @@ def _file_document(name, path):
     return {"name": name, "path": path, "md5": md5sum(path), "sha1": sha1sum(path)}
 
 
+def _file_documents(files):
+    """ Computing the checksums requires reading the files, avoid it if nothing is logged
+    """
+    if not _get_tracer_file():
+        return []
+    files = files or {}
+    return [_file_document(name, path) for name, path in files.items()]
+
+
 def log_recipe_upload(ref, duration, files_uploaded, remote_name):
-    files_uploaded = files_uploaded or {}
-    files_uploaded = [_file_document(name, path) for name, path in files_uploaded.items()]
+    files_uploaded = _file_documents(files_uploaded)
     _append_action("UPLOADED_RECIPE", {"_id": str(ref),
                                        "duration": duration,
                                        "files": files_uploaded,
@@ -80,8 +89,7 @@ def log_recipe_upload(ref, duration, files_uploaded, remote_name):
 
 def log_package_upload(pref, duration, files_uploaded, remote):
     """files_uploaded is a dict with relative path as keys and abs path as values"""
-    files_uploaded = files_uploaded or {}
-    files_uploaded = [_file_document(name, path) for name, path in files_uploaded.items()]
+    files_uploaded = _file_documents(files_uploaded)
     _append_action("UPLOADED_PACKAGE", {"_id": str(pref),
                                         "duration": duration,
                                         "files": files_uploaded,
@@ -90,8 +98,7 @@ def log_package_upload(pref, duration, files_uploaded, remote):
 
 def log_recipe_download(ref, duration, remote_name, files_downloaded):
     assert(isinstance(ref, ConanFileReference))
-    files_downloaded = files_downloaded or {}
-    files_downloaded = [_file_document(name, path) for name, path in files_downloaded.items()]
+    files_downloaded = _file_documents(files_downloaded)
     _append_action("DOWNLOADED_RECIPE", {"_id": str(ref),
                                          "duration": duration,
                                          "remote": remote_name,
@@ -100,8 +107,7 @@ def log_recipe_download(ref, duration, remote_name, files_downloaded):
 
 def log_recipe_sources_download(ref, duration, remote_name, files_downloaded):
     assert(isinstance(ref, ConanFileReference))
-    files_downloaded = files_downloaded or {}
-    files_downloaded = [_file_document(name, path) for name, path in files_downloaded.items()]
+    files_downloaded = _file_documents(files_downloaded)
     _append_action("DOWNLOADED_RECIPE_SOURCES", {"_id": str(ref),
                                                  "duration": duration,
                                                  "remote": remote_name,
@@ -109,8 +115,7 @@ def log_recipe_sources_download(ref, duration, remote_name, files_downloaded):
 
 
 def log_package_download(pref, duration, remote, files_downloaded):
-    files_downloaded = files_downloaded or {}
-    files_downloaded = [_file_document(name, path) for name, path in files_downloaded.items()]
+    files_downloaded = _file_documents(files_downloaded)
     _append_action("DOWNLOADED_PACKAGE", {"_id": str(pref),
                                           "duration": duration,
                                           "remote": remote.name,
@@ -143,6 +148,12 @@ def log_client_rest_api_call(url, method, duration, headers):
                                      "duration": duration, "headers": headers})
 
 
+def log_http_connections(hits, misses):
+    _append_action("HTTP_CONNECTIONS", {"hits": hits, "misses": misses})
+    logger.debug("REST: %d requests reused an open connection, %d opened a new one"
+                 % (hits, misses))
+
+
 def log_command(name, parameters):
     if name == "authenticate" and "password" in parameters:
         parameters = copy.copy(parameters)  # Ensure we don't alter any app object like args
@@ -165,6 +176,12 @@ def log_uncompressed_file(src_path, duration, dest_folder):
 
 
 def log_compressed_files(files, duration, tgz_path):
-    files = files or {}
-    files_compressed = [_file_document(name, path) for name, path in files.items()]
+    files_compressed = _file_documents(files)
     _append_action("ZIP", {"src": files_compressed, "dst": tgz_path, "duration": duration})
+
+
+def log_lock_wait(locked_item, lock_type, duration):
+    _append_action("LOCK_WAIT", {"_id": str(locked_item), "type": lock_type,
+                                 "duration": duration})
+    logger.debug("LOCK: Waited %.3f seconds for the %s lock of %s"
+                 % (duration, lock_type, locked_item))